@@ -17,11 +17,16 @@ def read_version():
 
 
 extensions = [
+    Extension(
+        "supriya._osc",
+        language="c",
+        sources=["supriya/_osc.pyx"],
+    ),
     Extension(
         "supriya.utils._intervals",
         language="c",
         sources=["supriya/utils/_intervals.pyx"],
-    )
+    ),
 ]
 
 if platform.system() != "Windows":
@@ -0,0 +1,416 @@
+# cython: language_level=3
+"""
+Accelerated OSC encoding and decoding.
+
+Mirrors the pure-Python codec in :py:mod:`supriya.osc`, but walks a single
+buffer by offset rather than slicing off the remainder at every step.
+"""
+
+import enum
+import struct
+from collections.abc import Sequence as SequenceABC
+
+cimport cython
+from cpython.bytearray cimport (
+    PyByteArray_AS_STRING,
+    PyByteArray_GET_SIZE,
+    PyByteArray_Resize,
+)
+from cpython.bytes cimport PyBytes_FromStringAndSize
+from cpython.unicode cimport PyUnicode_DecodeASCII
+from libc.math cimport isinf
+from libc.stdint cimport int32_t, int64_t, uint32_t, uint64_t
+from libc.string cimport memcpy
+
+
+cdef bytes BUNDLE_PREFIX = b"#bundle\x00"
+cdef uint64_t IMMEDIATELY = 1
+
+cdef object OscBundle = None
+cdef object OscMessage = None
+cdef double NTP_DELTA = 0.0
+
+
+cdef int _load_classes() except -1:
+    global NTP_DELTA, OscBundle, OscMessage
+    if OscMessage is not None:
+        return 0
+    from . import osc
+
+    NTP_DELTA = osc.NTP_DELTA
+    OscBundle = osc.OscBundle
+    OscMessage = osc.OscMessage
+    return 0
+
+
+### DECODING ###
+
+
+cdef inline int _require(Py_ssize_t offset, Py_ssize_t width, Py_ssize_t stop) except -1:
+    if offset + width > stop:
+        raise struct.error(f"unpack requires a buffer of {width} bytes")
+    return 0
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline uint32_t _read_uint32(const unsigned char[:] data, Py_ssize_t offset):
+    return (
+        (<uint32_t>data[offset] << 24)
+        | (<uint32_t>data[offset + 1] << 16)
+        | (<uint32_t>data[offset + 2] << 8)
+        | (<uint32_t>data[offset + 3])
+    )
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline uint64_t _read_uint64(const unsigned char[:] data, Py_ssize_t offset):
+    return (<uint64_t>_read_uint32(data, offset) << 32) | _read_uint32(data, offset + 4)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef Py_ssize_t _find_null(
+    const unsigned char[:] data, Py_ssize_t offset, Py_ssize_t stop
+) except -1:
+    cdef Py_ssize_t index = offset
+    while index < stop:
+        if data[index] == 0:
+            return index
+        index += 1
+    raise ValueError("subsection not found")
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef bint _has_bundle_prefix(
+    const unsigned char[:] data, Py_ssize_t offset, Py_ssize_t stop
+):
+    cdef Py_ssize_t i
+    cdef const unsigned char* prefix = BUNDLE_PREFIX
+    if stop - offset < 8:
+        return False
+    for i in range(8):
+        if data[offset + i] != prefix[i]:
+            return False
+    return True
+
+
+cdef object _decode_bundle(
+    object cls, const unsigned char[:] data, Py_ssize_t start, Py_ssize_t stop
+):
+    cdef Py_ssize_t offset, length
+    cdef uint64_t ntp_timestamp
+    cdef list contents = []
+    if not _has_bundle_prefix(data, start, stop):
+        raise ValueError("datagram is not a bundle")
+    offset = start + 8
+    _require(offset, 8, stop)
+    ntp_timestamp = _read_uint64(data, offset)
+    offset += 8
+    timestamp = None
+    if ntp_timestamp != IMMEDIATELY:
+        timestamp = (<double>ntp_timestamp / 4294967296.0) - NTP_DELTA
+    while offset < stop:
+        _require(offset, 4, stop)
+        length = <int32_t>_read_uint32(data, offset)
+        offset += 4
+        if length < 0:
+            raise ValueError(f"invalid bundle element length {length}")
+        length = min(length, stop - offset)
+        if _has_bundle_prefix(data, offset, stop):
+            contents.append(_decode_bundle(cls, data, offset, offset + length))
+        else:
+            contents.append(
+                _decode_message(OscMessage, data, offset, offset + length)
+            )
+        offset += length
+    return cls(timestamp=timestamp, contents=tuple(contents))
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef object _decode_message(
+    object cls, const unsigned char[:] data, Py_ssize_t start, Py_ssize_t stop
+):
+    cdef Py_ssize_t offset, null_index, tags_start, tags_stop, length, padded_length
+    cdef uint32_t raw
+    cdef uint64_t raw_double
+    cdef float float_value
+    cdef double double_value
+    cdef Py_ssize_t i
+    cdef unsigned char type_tag
+    cdef list contents = []
+    cdef list array_stack = [contents]
+    current = contents
+    # address
+    null_index = _find_null(data, start, stop)
+    address = PyUnicode_DecodeASCII(
+        <const char*>&data[start], null_index - start, NULL
+    )
+    offset = start + ((null_index - start) // 4 + 1) * 4
+    # type tags
+    null_index = _find_null(data, offset, stop)
+    tags_start, tags_stop = offset, null_index
+    for i in range(tags_start, tags_stop):
+        if data[i] > 127:
+            raise ValueError("type tags must be ascii")
+    offset = tags_start + ((tags_stop - tags_start) // 4 + 1) * 4
+    # arguments
+    for i in range(tags_start + 1, tags_stop):
+        type_tag = data[i]
+        if type_tag == b"i":
+            _require(offset, 4, stop)
+            current.append(<int32_t>_read_uint32(data, offset))
+            offset += 4
+        elif type_tag == b"f":
+            _require(offset, 4, stop)
+            raw = _read_uint32(data, offset)
+            memcpy(&float_value, &raw, 4)
+            current.append(<double>float_value)
+            offset += 4
+        elif type_tag == b"d":
+            _require(offset, 8, stop)
+            raw_double = _read_uint64(data, offset)
+            memcpy(&double_value, &raw_double, 8)
+            current.append(double_value)
+            offset += 8
+        elif type_tag == b"s":
+            null_index = _find_null(data, offset, stop)
+            current.append(
+                PyUnicode_DecodeASCII(
+                    <const char*>&data[offset], null_index - offset, NULL
+                )
+            )
+            offset += ((null_index - offset) // 4 + 1) * 4
+        elif type_tag == b"b":
+            _require(offset, 4, stop)
+            length = _read_uint32(data, offset)
+            offset += 4
+            padded_length = length
+            if length % 4:
+                padded_length = (length // 4 + 1) * 4
+            length = min(length, max(stop - offset, 0))
+            current.append(_decode_blob(data, offset, offset + length))
+            offset += padded_length
+        elif type_tag == b"T":
+            current.append(True)
+        elif type_tag == b"F":
+            current.append(False)
+        elif type_tag == b"N":
+            current.append(None)
+        elif type_tag == b"[":
+            array = []
+            current.append(array)
+            array_stack.append(array)
+            current = array
+        elif type_tag == b"]":
+            array_stack.pop()
+            current = array_stack[len(array_stack) - 1] if array_stack else None
+        else:
+            raise RuntimeError(f"Unable to parse type {chr(type_tag)!r}")
+    return cls(address, *contents)
+
+
+cdef object _decode_blob(
+    const unsigned char[:] data, Py_ssize_t start, Py_ssize_t stop
+):
+    # Blobs may carry nested bundles or messages, e.g. completion messages.
+    try:
+        return _decode_bundle(OscBundle, data, start, stop)
+    except Exception:
+        pass
+    try:
+        return _decode_message(OscMessage, data, start, stop)
+    except Exception:
+        pass
+    if start >= stop:
+        return b""
+    return PyBytes_FromStringAndSize(<const char*>&data[start], stop - start)
+
+
+def decode_bundle(cls, datagram):
+    """
+    Decode ``datagram`` into an instance of bundle class ``cls``.
+    """
+    _load_classes()
+    cdef const unsigned char[:] data = datagram
+    return _decode_bundle(cls, data, 0, data.shape[0])
+
+
+def decode_message(cls, datagram):
+    """
+    Decode ``datagram`` into an instance of message class ``cls``.
+    """
+    _load_classes()
+    cdef const unsigned char[:] data = datagram
+    return _decode_message(cls, data, 0, data.shape[0])
+
+
+### ENCODING ###
+
+
+cdef inline char* _grow(bytearray out, Py_ssize_t width) except NULL:
+    cdef Py_ssize_t size = PyByteArray_GET_SIZE(out)
+    PyByteArray_Resize(out, size + width)
+    return PyByteArray_AS_STRING(out) + size
+
+
+cdef inline int _write_uint32(bytearray out, uint32_t value) except -1:
+    cdef char* pointer = _grow(out, 4)
+    pointer[0] = <char>((value >> 24) & 0xFF)
+    pointer[1] = <char>((value >> 16) & 0xFF)
+    pointer[2] = <char>((value >> 8) & 0xFF)
+    pointer[3] = <char>(value & 0xFF)
+    return 0
+
+
+cdef inline int _write_int(bytearray out, object value) except -1:
+    cdef int64_t integer
+    try:
+        integer = value
+    except OverflowError:
+        integer = -(1 << 62)
+    if not (-2147483648 <= integer <= 2147483647):
+        raise struct.error(
+            "'i' format requires -2147483648 <= number <= 2147483647"
+        )
+    return _write_uint32(out, <uint32_t><int32_t>integer)
+
+
+cdef inline int _write_float(bytearray out, double value) except -1:
+    cdef float single = <float>value
+    cdef uint32_t raw
+    if isinf(single) and not isinf(value):
+        raise OverflowError("float too large to pack with f format")
+    memcpy(&raw, &single, 4)
+    return _write_uint32(out, raw)
+
+
+cdef inline int _write_padded(bytearray out, const char* data, Py_ssize_t length, Py_ssize_t width) except -1:
+    cdef char* pointer = _grow(out, width)
+    cdef Py_ssize_t i
+    memcpy(pointer, data, length)
+    for i in range(length, width):
+        pointer[i] = 0
+    return 0
+
+
+cdef inline int _write_string(bytearray out, str value) except -1:
+    cdef bytes encoded = value.encode("ascii")
+    cdef Py_ssize_t length = len(encoded)
+    return _write_padded(out, encoded, length, (length // 4 + 1) * 4)
+
+
+cdef inline int _write_blob(bytearray out, const unsigned char[:] value) except -1:
+    cdef Py_ssize_t length = value.shape[0]
+    cdef Py_ssize_t width = length
+    _write_uint32(out, <uint32_t>length)
+    if length % 4:
+        width = (length // 4 + 1) * 4
+    if length:
+        _write_padded(out, <const char*>&value[0], length, width)
+    return 0
+
+
+cdef int _encode_value(bytearray type_tags, bytearray out, object value) except -1:
+    # Fast paths for the overwhelmingly common exact types.
+    value_type = type(value)
+    if value_type is float:
+        type_tags.append(102)  # f
+        return _write_float(out, value)
+    elif value_type is int:
+        type_tags.append(105)  # i
+        return _write_int(out, value)
+    elif value_type is str:
+        type_tags.append(115)  # s
+        return _write_string(out, value)
+    # Otherwise mirror the pure-Python precedence exactly.
+    if value_type is OscMessage:
+        value = _encode_message(value)
+    elif value_type is OscBundle:
+        value = _encode_bundle(value, True)
+    elif hasattr(value, "to_datagram"):
+        value = bytearray(value.to_datagram())
+    elif isinstance(value, enum.Enum):
+        value = value.value
+    if isinstance(value, (bytearray, bytes)):
+        type_tags.append(98)  # b
+        _write_blob(out, value)
+    elif isinstance(value, str):
+        type_tags.append(115)  # s
+        _write_string(out, value)
+    elif isinstance(value, bool):
+        type_tags.append(84 if value else 70)  # T / F
+    elif isinstance(value, float):
+        type_tags.append(102)  # f
+        _write_float(out, value)
+    elif isinstance(value, int):
+        type_tags.append(105)  # i
+        _write_int(out, value)
+    elif value is None:
+        type_tags.append(78)  # N
+    elif isinstance(value, SequenceABC):
+        type_tags.append(91)  # [
+        for sub_value in value:
+            _encode_value(type_tags, out, sub_value)
+        type_tags.append(93)  # ]
+    else:
+        raise TypeError("Cannot encode {!r}".format(value))
+    return 0
+
+
+cdef bytes _encode_message(object message):
+    cdef bytearray type_tags, contents, out
+    if message._datagram is not None:
+        return message._datagram
+    type_tags, contents, out = bytearray(b","), bytearray(), bytearray()
+    address = message.address
+    if isinstance(address, str):
+        _write_string(out, address)
+    else:
+        _write_int(out, address)
+    for value in message.contents or ():
+        _encode_value(type_tags, contents, value)
+    _write_padded(
+        out,
+        PyByteArray_AS_STRING(type_tags),
+        PyByteArray_GET_SIZE(type_tags),
+        (PyByteArray_GET_SIZE(type_tags) // 4 + 1) * 4,
+    )
+    out += contents
+    return bytes(out)
+
+
+cdef bytes _encode_bundle(object bundle, bint realtime):
+    cdef bytearray out = bytearray(BUNDLE_PREFIX)
+    cdef bytes datagram
+    out += bundle._encode_date(bundle.timestamp, realtime=realtime)
+    for content in bundle.contents:
+        content_type = type(content)
+        if content_type is OscMessage:
+            datagram = _encode_message(content)
+        elif content_type is OscBundle:
+            datagram = _encode_bundle(content, True)
+        else:
+            datagram = content.to_datagram()
+        _write_uint32(out, <uint32_t>len(datagram))
+        out += datagram
+    return bytes(out)
+
+
+def encode_bundle(bundle, realtime=True):
+    """
+    Encode ``bundle`` into a datagram.
+    """
+    _load_classes()
+    return _encode_bundle(bundle, realtime)
+
+
+def encode_message(message):
+    """
+    Encode ``message`` into a datagram.
+    """
+    _load_classes()
+    return _encode_message(message)
@@ -1,6 +1,13 @@
 from .asynchronous import AsyncClock
 from .bases import BaseClock
-from .ephemera import CallbackEvent, ChangeEvent, ClockContext, Moment, TimeUnit
+from .ephemera import (
+    CallbackEvent,
+    ChangeEvent,
+    ClockContext,
+    ClockStatistics,
+    Moment,
+    TimeUnit,
+)
 from .offline import AsyncOfflineClock, OfflineClock
 from .threaded import Clock
 
@@ -10,6 +17,7 @@ __all__ = [
     "CallbackEvent",
     "ChangeEvent",
     "ClockContext",
+    "ClockStatistics",
     "Moment",
     "OfflineClock",
     "AsyncOfflineClock",
@@ -27,11 +27,12 @@ class AsyncClock(BaseClock):
         self._event.set()
 
     async def _perform_callback_event(self, event, current_moment, desired_moment):
-        logger.debug(
-            f"[{self.name}] ... ... Performing {event.procedure} at "
-            f"{desired_moment.seconds - self._state.initial_seconds}:s / "
-            f"{desired_moment.offset}:o"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"[{self.name}] ... ... Performing {event.procedure} at "
+                f"{desired_moment.seconds - self._state.initial_seconds}:s / "
+                f"{desired_moment.offset}:o"
+            )
         context = ClockContext(current_moment, desired_moment, event)
         args = event.args or ()
         kwargs = event.kwargs or {}
@@ -45,11 +46,12 @@ class AsyncClock(BaseClock):
         self._process_callback_event_result(desired_moment, event, result)
 
     async def _perform_events(self, current_moment: Moment):
-        logger.debug(
-            f"[{self.name}] ... Ready to perform at "
-            f"{current_moment.seconds - self._state.initial_seconds}:s / "
-            f"{current_moment.offset}:o"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"[{self.name}] ... Ready to perform at "
+                f"{current_moment.seconds - self._state.initial_seconds}:s / "
+                f"{current_moment.offset}:o"
+            )
         while self._is_running and self._event_queue.qsize():
             (
                 event,
@@ -75,10 +77,12 @@ class AsyncClock(BaseClock):
         return current_moment
 
     async def _run(self, *args, offline=False, **kwargs):
-        logger.debug(f"[{self.name}] Coroutine start")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[{self.name}] Coroutine start")
         self._process_command_deque(first_run=True)
         while self._is_running:
-            logger.debug(f"[{self.name}] Loop start")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"[{self.name}] Loop start")
             if not await self._wait_for_queue():
                 return
             try:
@@ -92,7 +96,8 @@ class AsyncClock(BaseClock):
                 previous_seconds=current_moment.seconds,
                 previous_offset=current_moment.offset,
             )
-        logger.debug(f"[{self.name}] Coroutine terminating")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[{self.name}] Coroutine terminating")
         self._stop()
 
     async def _wait_for_event(self, sleep_time):
@@ -104,9 +109,10 @@ class AsyncClock(BaseClock):
     async def _wait_for_moment(self, offline=False) -> Optional[Moment]:
         current_time = self.get_current_time()
         next_time = self._event_queue.peek().seconds
-        logger.debug(
-            f"[{self.name}] ... Waiting for next moment at {next_time} from {current_time}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"[{self.name}] ... Waiting for next moment at {next_time} from {current_time}"
+            )
         while current_time < next_time:
             if not offline:
                 await self._wait_for_event(next_time - current_time)
@@ -119,7 +125,8 @@ class AsyncClock(BaseClock):
         return self._seconds_to_moment(current_time)
 
     async def _wait_for_queue(self, offline=False) -> bool:
-        logger.debug(f"[{self.name}] ... Waiting for events")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[{self.name}] ... Waiting for events")
         self._process_command_deque()
         self._event.clear()
         while not self._event_queue.qsize():
@@ -8,7 +8,7 @@ import time
 import traceback
 from typing import Optional, Tuple
 
-from .. import conversions
+from .. import conversions, tracing
 from .ephemera import (
     CallbackCommand,
     CallbackEvent,
@@ -56,12 +56,11 @@ class BaseClock:
         self._name = None
         self._counter = itertools.count()
         self._command_deque = collections.deque()
-        self._event_queue = EventQueue()
+        self._event_queue = EventQueue(self._offset_to_seconds)
         self._is_running = False
         self._slop = 0.001
         self._events_by_id = {}
         self._measure_relative_event_ids = set()
-        self._offset_relative_event_ids = set()
         self._state = ClockState(
             beats_per_minute=120.0,
             initial_seconds=0.0,
@@ -93,10 +92,11 @@ class BaseClock:
             if mod:
                 offset += fraction_grid
         seconds = self._offset_to_seconds(offset)
-        logger.debug(
-            f"[{self.name}] ... ... Cueing {quantization} to "
-            f"{seconds}:s / {offset}:o / {measure}:m"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"[{self.name}] ... ... Cueing {quantization} to "
+                f"{seconds}:s / {offset}:o / {measure}:m"
+            )
         return seconds, offset, measure
 
     def _get_schedule_point(self, schedule_at: float, time_unit: TimeUnit):
@@ -192,15 +192,17 @@ class BaseClock:
             event, (CallbackCommand, ChangeCommand)
         ):
             self._event_queue.remove(event)
-            if event.offset is not None:
-                self._offset_relative_event_ids.remove(event.event_id)
-                if event.measure is not None:
-                    self._measure_relative_event_ids.remove(event.event_id)
+            if event.measure is not None:
+                self._measure_relative_event_ids.remove(event.event_id)
         return event
 
     def _enqueue_command(self, command):
         self._events_by_id[command.event_id] = command
         self._command_deque.append(command)
+        if tracing.enabled:
+            tracing.record("enqueue", self.name, command.event_id)
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         if isinstance(command, CallbackCommand):
             logger.debug(
                 f"[{self.name}] Enqueued {type(command).__name__} ({command.event_id}) {command.procedure}"
@@ -213,14 +215,10 @@ class BaseClock:
     def _enqueue_event(self, event):
         self._events_by_id[event.event_id] = event
         self._event_queue.put(event)
-        if event.offset is not None:
-            self._offset_relative_event_ids.add(event.event_id)
-            if event.measure is not None:
-                self._measure_relative_event_ids.add(event.event_id)
+        if event.measure is not None:
+            self._measure_relative_event_ids.add(event.event_id)
 
     def _process_perform_event_loop(self, current_moment):
-        # There may be items in the queue which have been flagged "removed".
-        # They contribute to the queue's size, but cannot be retrieved by .get().
         try:
             event = self._event_queue.get()
         except queue.Empty:
@@ -241,11 +239,12 @@ class BaseClock:
         return event, desired_moment, False, False
 
     def _perform_callback_event(self, event, current_moment, desired_moment):
-        logger.debug(
-            f"[{self.name}] ... ... Performing {event.procedure} at "
-            f"{desired_moment.seconds - self._state.initial_seconds}:s / "
-            f"{desired_moment.offset}:o"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"[{self.name}] ... ... Performing {event.procedure} at "
+                f"{desired_moment.seconds - self._state.initial_seconds}:s / "
+                f"{desired_moment.offset}:o"
+            )
         context = ClockContext(current_moment, desired_moment, event)
         args = event.args or ()
         kwargs = event.kwargs or {}
@@ -273,18 +272,22 @@ class BaseClock:
             kwargs["seconds"] = self._offset_to_seconds(kwargs["offset"])
         if unit == TimeUnit.SECONDS:
             kwargs["seconds"] = desired_moment.seconds + delta
-        logger.debug(
-            f"[{self.name}] ... ... ... Rescheduling "
-            f"{event.procedure} ({event.event_id}) at {kwargs['seconds'] - self._state.initial_seconds}s"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"[{self.name}] ... ... ... Rescheduling "
+                f"{event.procedure} ({event.event_id}) at {kwargs['seconds'] - self._state.initial_seconds}s"
+            )
         event = event._replace(**kwargs)
         self._enqueue_event(event)
+        if tracing.enabled:
+            tracing.record("reschedule", self.name, event.event_id, event.seconds)
 
     def _perform_change_event(self, event, current_moment, desired_moment):
-        logger.debug(
-            f"[{self.name}] ... ... Changing at "
-            f"{desired_moment.seconds - self._state.initial_seconds}:s"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"[{self.name}] ... ... Changing at "
+                f"{desired_moment.seconds - self._state.initial_seconds}:s"
+            )
         # TODO: current offset is misleading here
         if event.time_signature is not None:
             new_duration = event.time_signature[0] / event.time_signature[1]
@@ -319,12 +322,14 @@ class BaseClock:
                 previous_seconds=desired_moment.seconds,
                 previous_offset=desired_moment.offset,
             )
-            self._reschedule_offset_relative_events()
+            # Offset-relative events derive their seconds from the new tempo as
+            # they're dequeued, so need no rescheduling.
             new_current_offset = self._seconds_to_offset(current_moment.seconds)
-            logger.debug(
-                f"[{self.name}] ... ... ... Revised offset from "
-                f"{current_moment.offset} to {new_current_offset}"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"[{self.name}] ... ... ... Revised offset from "
+                    f"{current_moment.offset} to {new_current_offset}"
+                )
             current_moment = dataclasses.replace(
                 current_moment, offset=new_current_offset
             )
@@ -334,11 +339,12 @@ class BaseClock:
         return current_moment, True
 
     def _perform_events(self, current_moment: Moment):
-        logger.debug(
-            f"[{self.name}] ... Ready to perform at "
-            f"{current_moment.seconds - self._state.initial_seconds}:s / "
-            f"{current_moment.offset}:o"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"[{self.name}] ... Ready to perform at "
+                f"{current_moment.seconds - self._state.initial_seconds}:s / "
+                f"{current_moment.offset}:o"
+            )
         while self._is_running and self._event_queue.qsize():
             (
                 event,
@@ -350,6 +356,14 @@ class BaseClock:
                 continue
             elif should_break:
                 break
+            if tracing.enabled:
+                tracing.record(
+                    "change" if event.event_type == EventType.CHANGE else "perform",
+                    self.name,
+                    event.event_id,
+                    desired_moment.seconds,
+                    current_moment.seconds - desired_moment.seconds,
+                )
             if event.event_type == EventType.CHANGE:
                 current_moment, should_continue = self._perform_change_event(
                     event, current_moment, desired_moment
@@ -363,12 +377,16 @@ class BaseClock:
 
     def _process_command_deque(self, first_run=False):
         while self._command_deque:
-            logger.debug(f"[{self.name}] ... Processing command deque ({first_run})")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"[{self.name}] ... Processing command deque ({first_run})"
+                )
             command = self._command_deque.popleft()
             if self._events_by_id.pop(command.event_id, None) is None:
                 continue
             schedule_at = command.schedule_at
-            logger.debug(f"[{self.name}] ... ... Scheduled at {schedule_at}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"[{self.name}] ... ... Scheduled at {schedule_at}")
             if command.quantization is not None:
                 # If the command was queued before the clock was started,
                 # reset its reference time
@@ -408,25 +426,13 @@ class BaseClock:
                     time_signature=command.time_signature,
                 )
             self._enqueue_event(event)
-            logger.debug(
-                f"[{self.name}] ... ... Enqueued {type(event).__name__} "
-                f"({event.event_id}) for {event.seconds}:s / {event.offset}:o"
-            )
-
-    def _reschedule_offset_relative_events(self):
-        for event_id in tuple(self._offset_relative_event_ids):
-            event = self._cancel(event_id)
-            if event is None:
-                self._offset_relative_event_ids.remove(event_id)
-                continue
-            seconds = self._offset_to_seconds(event.offset)
-            logger.debug(
-                f"[{self.name}] ... ... ... Rescheduling offset-relative event "
-                f"({event.event_id}) from "
-                f"{event.seconds - self._state.initial_seconds}:s to "
-                f"{seconds - self._state.initial_seconds}:s"
-            )
-            self._enqueue_event(event._replace(seconds=seconds))
+            if tracing.enabled:
+                tracing.record("schedule", self.name, event.event_id, event.seconds)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"[{self.name}] ... ... Enqueued {type(event).__name__} "
+                    f"({event.event_id}) for {event.seconds}:s / {event.offset}:o"
+                )
 
     def _reschedule_measure_relative_events(self):
         for event_id in tuple(self._measure_relative_event_ids):
@@ -436,10 +442,11 @@ class BaseClock:
                 continue
             offset = self._measure_to_offset(event.measure)
             seconds = self._offset_to_seconds(offset)
-            logger.debug(
-                f"[{self.name}] ... ... ... Rescheduling measure-relative event from "
-                f"offset {event.offset} to {offset}"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"[{self.name}] ... ... ... Rescheduling measure-relative event from "
+                    f"offset {event.offset} to {offset}"
+                )
             self._enqueue_event(event._replace(offset=offset, seconds=seconds))
 
     def _start(
@@ -474,7 +481,8 @@ class BaseClock:
     ### PUBLIC METHODS ###
 
     def cancel(self, event_id) -> Optional[Tuple]:
-        logger.debug(f"[{self.name}] Canceling {event_id}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[{self.name}] Canceling {event_id}")
         event = self._cancel(event_id)
         return event
 
@@ -613,7 +621,8 @@ class BaseClock:
         args=None,
         kwargs=None,
     ) -> int:
-        logger.debug(f"[{self.name}] Scheduling {procedure}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[{self.name}] Scheduling {procedure}")
         if event_type <= 0:
             raise ValueError(f"Invalid event type {event_type}")
         event_id = next(self._counter)
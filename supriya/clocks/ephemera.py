@@ -91,6 +91,15 @@ class ChangeEvent(NamedTuple):
         return hash((type(self), self.event_id))
 
 
+class ClockStatistics(NamedTuple):
+    elapsed_seconds: float
+    wakeup_count: int
+    wakeups_per_second: float
+    performed_count: int
+    mean_lateness: float  # seconds between desired and actual performance
+    maximum_lateness: float
+
+
 class ClockContext(NamedTuple):
     current_moment: Moment
     desired_moment: Moment
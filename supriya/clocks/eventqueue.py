@@ -1,44 +1,149 @@
+import heapq
+import itertools
 import queue
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
 
 
-class EventQueue(queue.PriorityQueue):
+class EventQueue:
+    """
+    A priority queue of clock events, ordered by seconds, event type and ID.
+
+    Events with an offset are keyed in beats, and their seconds derived on
+    demand via ``offset_to_seconds``. Tempo changes then reorder nothing: they
+    only change the seconds derived from here on. Other events are keyed in
+    seconds.
+
+    Removed events are left in place as tombstones, and compacted away once
+    they outnumber the live events.
+    """
+
+    ### CLASS VARIABLES ###
+
+    #: Tombstone count below which the queue is never compacted.
+    minimum_compaction_size = 64
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self, offset_to_seconds: Optional[Callable[[float], float]] = None
+    ) -> None:
+        self._counter = itertools.count()
+        self._lock = threading.RLock()
+        self._offset_to_seconds = offset_to_seconds
+        self._entries: Dict[int, list] = {}
+        self._offset_heap: List[list] = []
+        self._seconds_heap: List[list] = []
+        self._tombstone_count = 0
+
     ### PRIVATE METHODS ###
 
-    def _init(self, maxsize):
-        self.queue = []
-        self.items = {}
-
-    def _put(self, item):
-        entry = [item, True]
-        if item in self.items:
-            self.items[item][-1] = False
-        self.items[item] = entry
-        super()._put(entry)
-
-    def _get(self):
-        while self.queue:
-            item, active = super()._get()
-            if active:
-                del self.items[item]
-                return item
-        raise queue.Empty
+    def _compact(self) -> None:
+        self._offset_heap = [entry for entry in self._offset_heap if entry[-1]]
+        self._seconds_heap = [entry for entry in self._seconds_heap if entry[-1]]
+        heapq.heapify(self._offset_heap)
+        heapq.heapify(self._seconds_heap)
+        self._tombstone_count = 0
+
+    def _get_seconds(self, entry: list) -> float:
+        if entry[-2]:
+            return self._offset_to_seconds(entry[0])  # type: ignore
+        return entry[0]
+
+    def _get_head(self, heap: List[list]) -> Optional[list]:
+        while heap and not heap[0][-1]:
+            heapq.heappop(heap)
+            self._tombstone_count -= 1
+        return heap[0] if heap else None
+
+    def _peek_entry(self) -> Tuple[List[list], list]:
+        offset_entry = self._get_head(self._offset_heap)
+        seconds_entry = self._get_head(self._seconds_heap)
+        if offset_entry is None and seconds_entry is None:
+            raise queue.Empty
+        elif seconds_entry is None:
+            return self._offset_heap, offset_entry  # type: ignore
+        elif offset_entry is None:
+            return self._seconds_heap, seconds_entry
+        offset_key = (self._get_seconds(offset_entry), *offset_entry[1:3])
+        if offset_key <= (seconds_entry[0], *seconds_entry[1:3]):
+            return self._offset_heap, offset_entry
+        return self._seconds_heap, seconds_entry
+
+    def _resolve(self, entry: list):
+        event = entry[4]
+        if entry[-2]:
+            seconds = self._get_seconds(entry)
+            if seconds != event.seconds:
+                event = event._replace(seconds=seconds)
+        return event
 
     ### PUBLIC METHODS ###
 
-    def clear(self):
-        with self.mutex:
-            self._init(None)
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._offset_heap.clear()
+            self._seconds_heap.clear()
+            self._tombstone_count = 0
+
+    def get(self):
+        """
+        Remove and return the earliest event.
+
+        Raises ``queue.Empty`` if there are no events.
+        """
+        with self._lock:
+            heap, entry = self._peek_entry()
+            heapq.heappop(heap)
+            del self._entries[entry[2]]
+            return self._resolve(entry)
 
     def peek(self):
-        with self.mutex:
-            item = self._get()
-            entry = [item, True]
-            self.items[item] = entry
-            super()._put(entry)
-        return item
-
-    def remove(self, item):
-        with self.mutex:
-            entry = self.items.pop(item, None)
-            if entry is not None:
-                entry[-1] = False
+        """
+        Return the earliest event without removing it.
+
+        Raises ``queue.Empty`` if there are no events.
+        """
+        with self._lock:
+            _, entry = self._peek_entry()
+            return self._resolve(entry)
+
+    def put(self, event) -> None:
+        """
+        Add ``event``, replacing any event with the same ID.
+        """
+        with self._lock:
+            self.remove(event)
+            in_beats = event.offset is not None and self._offset_to_seconds is not None
+            # Entries compare by key, event type, event ID, then insertion order,
+            # never reaching the event itself.
+            entry = [
+                event.offset if in_beats else event.seconds,
+                event.event_type,
+                event.event_id,
+                next(self._counter),
+                event,
+                in_beats,
+                True,
+            ]
+            self._entries[event.event_id] = entry
+            heapq.heappush(self._offset_heap if in_beats else self._seconds_heap, entry)
+
+    def qsize(self) -> int:
+        return len(self._entries)
+
+    def remove(self, event) -> None:
+        """
+        Remove the event with the same ID as ``event``, if any.
+        """
+        with self._lock:
+            entry = self._entries.pop(event.event_id, None)
+            if entry is None:
+                return
+            entry[-1] = False
+            self._tombstone_count += 1
+            if self._tombstone_count > max(
+                self.minimum_compaction_size, len(self._entries)
+            ):
+                self._compact()
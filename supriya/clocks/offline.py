@@ -17,11 +17,12 @@ class OfflineClock(BaseClock):
     ### SCHEDULING METHODS ###
 
     def _perform_callback_event(self, event, current_moment, desired_moment):
-        logger.debug(
-            f"[{self.name}] ... ... Performing {event.procedure} at "
-            f"{desired_moment.seconds - self._state.initial_seconds}:s / "
-            f"{desired_moment.offset}:o"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"[{self.name}] ... ... Performing {event.procedure} at "
+                f"{desired_moment.seconds - self._state.initial_seconds}:s / "
+                f"{desired_moment.offset}:o"
+            )
         context = ClockContext(current_moment, desired_moment, event)
         args = event.args or ()
         kwargs = event.kwargs or {}
@@ -29,10 +30,12 @@ class OfflineClock(BaseClock):
         self._process_callback_event_result(desired_moment, event, result)
 
     def _run(self, *args, offline=False, **kwargs):
-        logger.debug(f"[{self.name}] Thread start")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[{self.name}] Thread start")
         self._process_command_deque(first_run=True)
         while self._is_running and self._event_queue.qsize():
-            logger.debug(f"[{self.name}] Loop start")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"[{self.name}] Loop start")
             if not self._wait_for_queue():
                 return
             try:
@@ -46,7 +49,8 @@ class OfflineClock(BaseClock):
                 previous_seconds=current_moment.seconds,
                 previous_offset=current_moment.offset,
             )
-        logger.debug(f"[{self.name}] Terminating")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[{self.name}] Terminating")
         yield False
         self._stop()
 
@@ -55,7 +59,8 @@ class OfflineClock(BaseClock):
         return self._seconds_to_moment(current_time)
 
     def _wait_for_queue(self, offline=False) -> bool:
-        logger.debug(f"[{self.name}] ... Waiting for events")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[{self.name}] ... Waiting for events")
         self._process_command_deque()
         return True
 
@@ -98,10 +103,12 @@ class OfflineClock(BaseClock):
 
 class AsyncOfflineClock(AsyncClock):
     async def _run(self, *args, offline=False, **kwargs):
-        logger.debug(f"[{self.name}] Coroutine start")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[{self.name}] Coroutine start")
         self._process_command_deque(first_run=True)
         while self._is_running and self._event_queue.qsize():
-            logger.debug(f"[{self.name}] Loop start")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"[{self.name}] Loop start")
             if not await self._wait_for_queue():
                 return
             try:
@@ -115,7 +122,8 @@ class AsyncOfflineClock(AsyncClock):
                 previous_seconds=current_moment.seconds,
                 previous_offset=current_moment.offset,
             )
-        logger.debug(f"[{self.name}] Coroutine terminating")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[{self.name}] Coroutine terminating")
         self._stop()
 
     async def _wait_for_event(self, sleep_time):
@@ -128,7 +136,8 @@ class AsyncOfflineClock(AsyncClock):
         return self._seconds_to_moment(current_time)
 
     async def _wait_for_queue(self, offline=False) -> bool:
-        logger.debug(f"[{self.name}] ... Waiting for events")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[{self.name}] ... Waiting for events")
         self._process_command_deque()
         self._event.clear()
         return True
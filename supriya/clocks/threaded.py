@@ -2,25 +2,40 @@ import atexit
 import logging
 import queue
 import threading
+import time
+import warnings
 from typing import Optional, Tuple
 
 from .bases import BaseClock
-from .ephemera import Moment
+from .ephemera import ClockStatistics, Moment
 
 logger = logging.getLogger("supriya.clocks")
 
 
 class Clock(BaseClock):
+    """
+    A threaded clock.
+
+    The clock's thread sleeps until the next event is due, or until new
+    commands arrive. Sleeping is imprecise to within the operating system's
+    timer resolution, so the final ``spin_window`` seconds before each event
+    may be busy-waited instead, trading CPU time for timing accuracy.
+
+    As the clock no longer polls, ``slop`` is deprecated and has no effect.
+    """
+
     ### CLASS VARIABLES ###
 
     _default_clock = None
 
     ### INITIALIZER ###
 
-    def __init__(self):
+    def __init__(self, spin_window: float = 0.0005):
         BaseClock.__init__(self)
         self._event = threading.Event()
         self._thread = threading.Thread(target=self._run, daemon=True)
+        self.spin_window = spin_window
+        self.reset_statistics()
         atexit.register(self.stop)
 
     ### SCHEDULING METHODS ###
@@ -29,11 +44,20 @@ class Clock(BaseClock):
         super()._enqueue_command(command)
         self._event.set()
 
+    def _perform_callback_event(self, event, current_moment, desired_moment):
+        lateness = current_moment.seconds - desired_moment.seconds
+        self._performed_count += 1
+        self._total_lateness += lateness
+        self._maximum_lateness = max(self._maximum_lateness, lateness)
+        super()._perform_callback_event(event, current_moment, desired_moment)
+
     def _run(self, *args, offline=False, **kwargs):
-        logger.debug(f"[{self.name}] Thread start")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[{self.name}] Thread start")
         self._process_command_deque(first_run=True)
         while self._is_running:
-            logger.debug(f"[{self.name}] Loop start")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"[{self.name}] Loop start")
             if not self._wait_for_queue():
                 return
             try:
@@ -47,38 +71,50 @@ class Clock(BaseClock):
                 previous_seconds=current_moment.seconds,
                 previous_offset=current_moment.offset,
             )
-            if not offline:
-                self._event.wait(timeout=self._slop)
-        logger.debug(f"[{self.name}] Terminating")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[{self.name}] Terminating")
+
+    def _wait_for_event(self, timeout: Optional[float]) -> None:
+        # Wait for new commands, at most until timeout, or indefinitely if None.
+        if timeout is None or timeout > 0:
+            self._event.wait(timeout=timeout)
+            self._wakeup_count += 1
+        else:
+            # Spinning: yield to other threads, but don't sleep.
+            time.sleep(0)
 
     def _wait_for_moment(self, offline=False) -> Optional[Moment]:
         current_time = self.get_current_time()
         next_time = self._event_queue.peek().seconds
-        logger.debug(
-            f"[{self.name}] ... Waiting for next moment at {next_time} from {current_time}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"[{self.name}] ... Waiting for next moment at {next_time} from {current_time}"
+            )
         while current_time < next_time:
             if not offline:
-                self._event.wait(timeout=self._slop)
+                self._wait_for_event(next_time - current_time - self._spin_window)
+            # Clear before processing, so commands arriving from here on wake
+            # the next wait immediately.
+            self._event.clear()
             if not self._is_running:
                 return None
             self._process_command_deque()
             next_time = self._event_queue.peek().seconds
             current_time = self.get_current_time()
-            self._event.clear()
         return self._seconds_to_moment(current_time)
 
     def _wait_for_queue(self, offline=False) -> bool:
-        logger.debug(f"[{self.name}] ... Waiting for events")
-        self._process_command_deque()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[{self.name}] ... Waiting for events")
         self._event.clear()
+        self._process_command_deque()
         while not self._event_queue.qsize():
             if not offline:
-                self._event.wait(timeout=self._slop)
+                self._wait_for_event(None)
+            self._event.clear()
             if not self._is_running:
                 return False
             self._process_command_deque()
-            self._event.clear()
         return True
 
     ### PUBLIC METHODS ###
@@ -94,6 +130,30 @@ class Clock(BaseClock):
             cls._default_clock = cls()
         return cls._default_clock
 
+    def get_statistics(self) -> ClockStatistics:
+        """
+        Get wakeup and lateness statistics since the last reset.
+        """
+        elapsed_seconds = time.monotonic() - self._statistics_start
+        return ClockStatistics(
+            elapsed_seconds=elapsed_seconds,
+            wakeup_count=self._wakeup_count,
+            wakeups_per_second=self._wakeup_count / elapsed_seconds,
+            performed_count=self._performed_count,
+            mean_lateness=self._total_lateness / (self._performed_count or 1),
+            maximum_lateness=self._maximum_lateness,
+        )
+
+    def reset_statistics(self) -> None:
+        """
+        Reset wakeup and lateness statistics.
+        """
+        self._maximum_lateness = 0.0
+        self._performed_count = 0
+        self._statistics_start = time.monotonic()
+        self._total_lateness = 0.0
+        self._wakeup_count = 0
+
     def start(
         self,
         initial_time: Optional[float] = None,
@@ -116,3 +176,43 @@ class Clock(BaseClock):
         if self._stop():
             self._event.set()
             self._thread.join()
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def slop(self) -> float:
+        """
+        Deprecated: the clock sleeps until deadlines, so has no polling interval.
+
+        Use ``spin_window`` to tune timing accuracy instead.
+        """
+        warnings.warn(
+            "Clock.slop has no effect, use Clock.spin_window instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return self._slop
+
+    @slop.setter
+    def slop(self, slop: float):
+        warnings.warn(
+            "Clock.slop has no effect, use Clock.spin_window instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        if slop <= 0:
+            raise ValueError(slop)
+        self._slop = float(slop)
+
+    @property
+    def spin_window(self) -> float:
+        """
+        Get the seconds before each event busy-waited rather than slept.
+        """
+        return self._spin_window
+
+    @spin_window.setter
+    def spin_window(self, spin_window: float):
+        if spin_window < 0:
+            raise ValueError(spin_window)
+        self._spin_window = float(spin_window)
@@ -32,6 +32,7 @@ except ImportError:
 from uqbar.objects import new
 
 from ..enums import AddAction, CalculationRate, ParameterRate
+from ..osc import OscBundle, OscMessage
 from ..scsynth import Options
 from ..synthdefs import SynthDef
 from ..typing import (
@@ -108,6 +109,10 @@ class Moment:
 
     Multiple requests made inside a moment are bundled together.
 
+    Bundles too large for the context's transport are split into several
+    bundles sharing the same timestamp. The number of bundles sent is recorded
+    in ``bundle_count`` on exit.
+
     :param context: The moment's context.
     :param seconds: The moment's timestamp.
     """
@@ -118,6 +123,7 @@ class Moment:
     requests: List[Tuple[Request, Optional["Completion"]]] = dataclasses.field(
         default_factory=list, init=False
     )
+    bundle_count: int = dataclasses.field(default=0, init=False)
 
     def __enter__(self) -> "Moment":
         """
@@ -137,10 +143,25 @@ class Moment:
         timestamp = (
             self.seconds + self.context._latency if self.seconds is not None else None
         )
-        if len(requests) and timestamp is not None:
+        maximum_size = self.context._get_maximum_bundle_size()
+        if maximum_size is not None and (
+            len(requests) > 1 or (len(requests) and timestamp is not None)
+        ):
+            # Completions are already folded into their requests, so packing
+            # whole requests in order keeps their semantics intact.
+            for bundle in OscBundle.partition(
+                [request.to_osc() for request in requests],
+                timestamp=timestamp,
+                maximum_size=maximum_size,
+            ):
+                self.context.send(bundle)
+                self.bundle_count += 1
+        elif len(requests) and timestamp is not None:
             self.context.send(RequestBundle(timestamp=timestamp, contents=requests))
+            self.bundle_count = 1
         elif len(requests) > 1:
             self.context.send(RequestBundle(contents=requests))
+            self.bundle_count = 1
         elif len(requests):
             self.context.send(requests[0])
         self.closed = True
@@ -278,9 +299,8 @@ class Context(metaclass=abc.ABCMeta):
                 return self._control_bus_allocator.allocate(count)
         raise ValueError
 
-    @staticmethod
     def _apply_completions(
-        pairs: List[Tuple[Request, Optional[Completion]]]
+        self, pairs: List[Tuple[Request, Optional[Completion]]]
     ) -> List[Request]:
         requests: List[Request] = []
         for key, group in itertools.groupby(
@@ -291,7 +311,7 @@ class Context(metaclass=abc.ABCMeta):
             key=lambda x: type(x),
         ):
             requests.extend(key.merge(list(group)))
-        return requests
+        return self._resolve_synthdefs(requests)
 
     @abc.abstractmethod
     def _free_id(
@@ -318,6 +338,29 @@ class Context(metaclass=abc.ABCMeta):
                 return self._control_bus_allocator
         raise ValueError
 
+    def _get_buffer_chunk_size(self) -> Optional[int]:
+        # Most buffer samples a single /b_setn or /b_getn reply datagram carries.
+        # Each sample costs a type tag and four bytes, after the message and
+        # bundle headers.
+        if (maximum_size := self._get_maximum_bundle_size()) is None:
+            return None
+        return (maximum_size - 64) // 5
+
+    def _get_buffer_range_set_requests(
+        self, buffer: Buffer, index: int, values: Sequence[float]
+    ) -> List[SetBufferRange]:
+        chunk_size = self._get_buffer_chunk_size() or max(len(values), 1)
+        return [
+            SetBufferRange(
+                buffer_id=buffer, items=[(index + i, values[i : i + chunk_size])]
+            )
+            for i in range(0, max(len(values), 1), chunk_size)
+        ]
+
+    def _get_maximum_bundle_size(self) -> Optional[int]:
+        # Largest bundle datagram the context accepts, None meaning unlimited.
+        return None
+
     def _get_moment(self) -> Optional[Moment]:
         moments = self._thread_local.__dict__.get("moments", [])
         if not moments:
@@ -357,6 +400,10 @@ class Context(metaclass=abc.ABCMeta):
     def _resolve_node(self, node: Union[Node, SupportsInt, None]) -> int:
         raise NotImplementedError
 
+    def _resolve_synthdefs(self, requests: List[Request]) -> List[Request]:
+        # Contexts tracking which SynthDefs they hold may elide or add uploads.
+        return requests
+
     def _setup_allocators(self) -> None:
         # audio buses
         audio_bus_minimum, audio_bus_maximum = self.options.get_audio_bus_ids(
@@ -578,6 +625,7 @@ class Context(metaclass=abc.ABCMeta):
         add_action: AddActionLike = AddAction.ADD_TO_HEAD,
         target_node: Optional[SupportsInt] = None,
         permanent: bool = False,
+        variant: Optional[str] = None,
         **settings,
     ) -> Synth:
         """
@@ -585,10 +633,15 @@ class Context(metaclass=abc.ABCMeta):
 
         Emit ``/s_new`` requests.
 
+        Realtime contexts first upload SynthDefs the server doesn't hold yet,
+        emitting the ``/s_new`` on completion of their ``/d_recv``.
+
         :param synthdef: The :term:`SynthDef` to use for the new synth.
         :param add_action: The :term:`add action` to use when placing the new synth.
         :param target_node: The node to place the new synth relative to.
         :param permanent: Flag for using a permanent node ID.
+        :param variant: The name of the SynthDef variant whose control values the
+            new synth starts from.
         :param settings: The new synth's control settings.
         """
         self._validate_can_request()
@@ -596,13 +649,16 @@ class Context(metaclass=abc.ABCMeta):
         if isinstance(target_node, Node):
             if add_action_ not in target_node._valid_add_actions:
                 raise ValueError(add_action_)
+        if variant is not None and variant not in synthdef._variants:
+            raise ValueError(variant)
+        variant_settings = synthdef._variants.get(variant or "", {})
         target_node_id = self._resolve_node(target_node)
         synthdef_kwargs: Dict[Union[int, str], Union[SupportsFloat, str]] = {}
         for _, parameter in synthdef.indexed_parameters:
             if parameter.name not in settings:
                 continue
             value = settings[parameter.name]
-            if value == parameter.value:
+            if value == variant_settings.get(parameter.name, parameter.value):
                 continue
             if parameter.parameter_rate is ParameterRate.SCALAR:
                 synthdef_kwargs[parameter.name] = float(value)
@@ -622,6 +678,7 @@ class Context(metaclass=abc.ABCMeta):
                 synthdef=synthdef,
                 target_node_id=target_node_id,
                 controls=synthdef_kwargs,
+                variant=variant,
             )
         )
         return Synth(context=self, id_=id_, synthdef=synthdef)
@@ -636,6 +693,10 @@ class Context(metaclass=abc.ABCMeta):
 
         Emit ``/d_recv`` requests.
 
+        Realtime contexts skip SynthDefs the server already holds, unless
+        completions are attached, and pack the rest into as few ``/d_recv``
+        requests as their transport allows.
+
         :param synthdefs: The synthdefs to add.
         :param on_completion: A callable with the buffer's context as the only argument.
             Permits building an "on completion" argument to this method's request
@@ -1138,7 +1199,7 @@ class Context(metaclass=abc.ABCMeta):
         return self._add_request_with_completion(request, on_completion)
 
     @abc.abstractmethod
-    def send(self, message: SupportsOsc):
+    def send(self, message: Union[SupportsOsc, OscBundle, OscMessage]):
         """
         Send a message to the execution context.
 
@@ -1168,13 +1229,15 @@ class Context(metaclass=abc.ABCMeta):
 
         Emit ``/b_setn`` requests.
 
+        Ranges too large for one datagram are split across several requests. numpy
+        arrays are encoded without converting each value in turn.
+
         :param buffer: The buffer to modify.
         :param index: The sample index to start writing at.
         :param values: The values to write.
         """
         self._validate_can_request()
-        request = SetBufferRange(buffer_id=buffer, items=[(index, values)])
-        self._add_requests(request)
+        self._add_requests(*self._get_buffer_range_set_requests(buffer, index, values))
 
     def set_bus(self, bus: Bus, value: float) -> None:
         """
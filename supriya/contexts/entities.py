@@ -98,13 +98,12 @@ class Buffer(ContextObject):
         return self.completion.__exit__(*args)
 
     def __plot__(self) -> Tuple["numpy.ndarray", float]:
-        import librosa
-
-        with tempfile.TemporaryDirectory() as temp_directory:
-            file_path = Path(temp_directory) / "tmp.wav"
-            self.write(file_path=file_path, header_format="wav", sample_format="int32")
-            cast("Server", self.context).sync()
-            return librosa.load(file_path, mono=False, sr=None)
+        server = cast("Server", self.context)
+        info = cast(BufferInfo, server.query_buffer(self)).items[0]
+        array = server.get_buffer_array(self)
+        if info.channel_count > 1:
+            array = array.reshape(-1, info.channel_count).T
+        return array, info.sample_rate
 
     def __render_memo__(
         self,
@@ -235,6 +234,23 @@ class Buffer(ContextObject):
             self, *indices, sync=sync
         )
 
+    def get_array(
+        self, index: int = 0, count: Optional[int] = None, **kwargs
+    ) -> Union[Awaitable["numpy.ndarray"], "numpy.ndarray"]:
+        """
+        Get a sample range as a numpy ``float32`` array.
+
+        Transfer large ranges in chunks, or via a memory-mapped file when the server
+        is local.
+
+        :param index: The sample index to start reading at.
+        :param count: The number of samples to read, defaulting to the rest of the
+            buffer.
+        """
+        return cast(Union["AsyncServer", "Server"], self.context).get_buffer_array(
+            self, index, count, **kwargs
+        )
+
     def get_range(
         self, index: int, count: int, sync: bool = True
     ) -> Union[Awaitable[Optional[Sequence[float]]], Optional[Sequence[float]]]:
@@ -330,6 +346,21 @@ class Buffer(ContextObject):
         """
         self.context.set_buffer(buffer=self, index=index, value=value)
 
+    def set_array(
+        self, index: int, values: Sequence[float], **kwargs
+    ) -> Optional[Awaitable[None]]:
+        """
+        Set a sample range, paced for bulk uploads.
+
+        Emit ``/b_setn`` requests in datagram-sized chunks.
+
+        :param index: The sample index to start writing at.
+        :param values: The values to write.
+        """
+        return cast(Union["AsyncServer", "Server"], self.context).set_buffer_array(
+            self, index, values, **kwargs
+        )
+
     def set_range(self, index: int, values: Sequence[float]) -> None:
         """
         Set a sample range.
@@ -605,6 +636,7 @@ class Node(ContextObject):
         *,
         add_action: AddActionLike = AddAction.ADD_TO_HEAD,
         permanent: bool = False,
+        variant: Optional[str] = None,
         **settings,
     ) -> "Synth":
         """
@@ -615,6 +647,8 @@ class Node(ContextObject):
         :param synthdef: The :term:`SynthDef` to use for the new synth.
         :param add_action: The :term:`add action` to use when placing the new synth.
         :param permanent: Flag for using a permanent node ID.
+        :param variant: The name of the SynthDef variant whose control values the
+            new synth starts from.
         :param settings: The new synth's control settings.
         """
         return self.context.add_synth(
@@ -622,6 +656,7 @@ class Node(ContextObject):
             add_action=add_action,
             permanent=permanent,
             target_node=self,
+            variant=variant,
             **settings,
         )
 
@@ -746,14 +781,14 @@ class Node(ContextObject):
         """
         Get the node's paused/unpaused status.
         """
-        return cast("BaseServer", self.context)._node_active.get(self.id_, True)
+        return cast("BaseServer", self.context)._node_tree.active.get(self.id_, True)
 
     @property
     def parent(self) -> Optional["Group"]:
         """
         Get the node's parent, as currently cached on the context.
         """
-        parent_id = cast("BaseServer", self.context)._node_parents.get(self.id_)
+        parent_id = cast("BaseServer", self.context)._node_tree.parents.get(self.id_)
         if parent_id is None:
             return None
         elif parent_id == 0:
@@ -767,7 +802,8 @@ class Node(ContextObject):
         """
         context = cast("BaseServer", self.context)
         parentage: List["Node"] = [self]
-        while (parent_id := context._node_parents.get(parentage[-1].id_)) is not None:
+        parents = context._node_tree.parents
+        while (parent_id := parents.get(parentage[-1].id_)) is not None:
             if parent_id:
                 parentage.append(Group(context=context, id_=parent_id))
             else:
@@ -803,8 +839,9 @@ class Group(Node):
         Get the group's children, as currently cached on the context.
         """
         children: List[Node] = []
-        for id_ in cast("BaseServer", self.context)._node_children.get(self.id_, []):
-            if id_ in cast("BaseServer", self.context)._node_children:
+        node_tree = cast("BaseServer", self.context)._node_tree
+        for id_ in node_tree.children(self.id_):
+            if node_tree.is_group(id_):
                 children.append(Group(context=self.context, id_=id_))
             else:
                 # cannot get synthdef name without running /g_queryTree
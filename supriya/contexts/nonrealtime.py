@@ -17,7 +17,7 @@ from uqbar.objects import new
 
 from ..assets.synthdefs import system_synthdefs
 from ..enums import CalculationRate, HeaderFormat, SampleFormat
-from ..osc import OscBundle
+from ..osc import OscBundle, OscMessage
 from ..scsynth import AsyncNonrealtimeProcessProtocol, Options
 from ..synthdefs import SynthDef
 from ..typing import HeaderFormatLike, SampleFormatLike, SupportsOsc
@@ -230,7 +230,7 @@ class Score(Context):
         if until and until > timestamp:
             yield RequestBundle(timestamp=until, contents=[DoNothing()])
 
-    def send(self, message: SupportsOsc) -> None:
+    def send(self, message: Union[SupportsOsc, OscBundle, OscMessage]) -> None:
         """
         Send a message to the execution context.
 
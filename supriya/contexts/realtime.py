@@ -3,17 +3,27 @@ Tools for interacting with realtime execution contexts.
 """
 
 import asyncio
+import collections
 import dataclasses
 import enum
+import ipaddress
 import logging
+import tempfile
+from concurrent.futures import Future
+from pathlib import Path
 from typing import (
     TYPE_CHECKING,
+    Callable,
+    Deque,
     Dict,
+    Iterable,
+    Iterator,
     List,
     Optional,
     Sequence,
     Set,
     SupportsInt,
+    Tuple,
     Type,
     Union,
     cast,
@@ -22,7 +32,7 @@ from typing import (
 from uqbar.objects import new
 
 from ..assets.synthdefs import system_synthdefs
-from ..enums import CalculationRate
+from ..enums import CalculationRate, HeaderFormat, SampleFormat
 from ..exceptions import (
     OwnedServerShutdown,
     ServerCannotBoot,
@@ -33,11 +43,15 @@ from ..exceptions import (
 )
 from ..osc import (
     AsyncOscProtocol,
+    AsyncTcpOscProtocol,
     HealthCheck,
+    OscBundle,
+    OscCallback,
     OscMessage,
     OscProtocol,
     OscProtocolOffline,
     ThreadedOscProtocol,
+    ThreadedTcpOscProtocol,
 )
 from ..scsynth import (
     AsyncProcessProtocol,
@@ -50,6 +64,7 @@ from ..typing import SupportsOsc
 from .core import (
     Buffer,
     Bus,
+    Completion,
     Context,
     ContextObject,
     Group,
@@ -58,20 +73,32 @@ from .core import (
     Synth,
 )
 from .requests import (
+    FillControlBusRange,
+    FreeAllSynthDefs,
+    FreeSynthDef,
     GetBuffer,
     GetBufferRange,
     GetControlBus,
     GetControlBusRange,
     GetSynthControl,
     GetSynthControlRange,
+    NewSynth,
     QueryBuffer,
     QueryNode,
     QueryStatus,
     QueryTree,
     QueryVersion,
     Quit,
+    ReceiveSynthDefs,
+    Request,
+    RequestBundle,
+    Requestable,
+    ResponseCollector,
+    SetControlBus,
+    SetControlBusRange,
     Sync,
     ToggleNotifications,
+    WriteBuffer,
 )
 from .responses import (
     BufferInfo,
@@ -92,7 +119,10 @@ from .responses import (
 )
 
 if TYPE_CHECKING:
-    from ..realtime.shm import ServerSHM
+    import numpy
+
+    from .responses import Response
+    from .shm import ServerSHM
 
 logger = logging.getLogger(__name__)
 
@@ -106,6 +136,20 @@ DEFAULT_HEALTHCHECK = HealthCheck(
     timeout=1.0,
 )
 
+#: Largest UDP payload over IPv4, used for loopback servers.
+LOOPBACK_DATAGRAM_SIZE = 65507
+
+#: Largest UDP payload fitting an unfragmented Ethernet frame, used for remote servers.
+NETWORK_DATAGRAM_SIZE = 1472
+
+#: Default number of requests a gather keeps in flight, keeping bursts of requests
+#: and replies from overflowing UDP receive buffers.
+GATHER_WINDOW_SIZE = 128
+
+#: Buffer sample bytes bulk transfers keep in flight by default, well under typical
+#: UDP receive buffers once per-datagram kernel overhead is counted.
+BUFFER_TRANSFER_BYTES_IN_FLIGHT = 65536
+
 
 class BootStatus(enum.IntEnum):
     OFFLINE = 0
@@ -114,6 +158,125 @@ class BootStatus(enum.IntEnum):
     QUITTING = 3
 
 
+class NodeTree:
+    """
+    A realtime context's cached view of the server's node tree.
+
+    Each group's children form an intrusive doubly linked list, threaded
+    through the ``previous`` and ``next`` maps, so that adding, moving and
+    removing nodes costs O(1) regardless of group size.
+
+    ::
+
+        >>> from supriya.contexts.realtime import NodeTree
+        >>> node_tree = NodeTree()
+        >>> node_tree.add_group(0)
+        >>> node_tree.link(1000, 0, -1, -1)
+        >>> node_tree.link(1001, 0, 1000, -1)
+        >>> node_tree.link(1002, 0, -1, 1000)
+        >>> list(node_tree.children(0))
+        [1002, 1000, 1001]
+        >>> node_tree.unlink(1000)
+        >>> list(node_tree.children(0))
+        [1002, 1001]
+
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(self) -> None:
+        self.active: Dict[int, bool] = {}
+        self.heads: Dict[int, int] = {}
+        self.next: Dict[int, int] = {}
+        self.parents: Dict[int, int] = {}
+        self.previous: Dict[int, int] = {}
+        self.tails: Dict[int, int] = {}
+
+    ### SPECIAL METHODS ###
+
+    def __contains__(self, id_: int) -> bool:
+        return id_ in self.parents
+
+    ### PUBLIC METHODS ###
+
+    def add_group(self, id_: int) -> None:
+        self.heads.setdefault(id_, -1)
+        self.tails.setdefault(id_, -1)
+
+    def children(self, id_: int) -> Iterator[int]:
+        child_id = self.heads.get(id_, -1)
+        while child_id != -1:
+            yield child_id
+            child_id = self.next[child_id]
+
+    def clear(self) -> None:
+        for dict_ in (
+            self.active,
+            self.heads,
+            self.next,
+            self.parents,
+            self.previous,
+            self.tails,
+        ):
+            dict_.clear()
+
+    def is_group(self, id_: int) -> bool:
+        return id_ in self.heads
+
+    def link(self, id_: int, parent_id: int, previous_id: int, next_id: int) -> None:
+        """
+        Link a node into its parent group, next to its reported siblings.
+        """
+        self.parents[id_] = parent_id
+        self.add_group(parent_id)
+        if previous_id != -1 and self.parents.get(previous_id) == parent_id:
+            next_id = self.next[previous_id]
+        elif next_id != -1 and self.parents.get(next_id) == parent_id:
+            previous_id = self.previous[next_id]
+        elif previous_id == -1 and next_id != -1:
+            previous_id, next_id = -1, self.heads[parent_id]
+        else:
+            previous_id, next_id = self.tails[parent_id], -1
+        self.previous[id_], self.next[id_] = previous_id, next_id
+        if previous_id == -1:
+            self.heads[parent_id] = id_
+        else:
+            self.next[previous_id] = id_
+        if next_id == -1:
+            self.tails[parent_id] = id_
+        else:
+            self.previous[next_id] = id_
+
+    def remove(self, id_: int) -> None:
+        """
+        Unlink a node and forget everything about it.
+        """
+        self.unlink(id_)
+        self.active.pop(id_, None)
+        self.heads.pop(id_, None)
+        self.tails.pop(id_, None)
+        self.parents.pop(id_, None)
+
+    def unlink(self, id_: int) -> None:
+        """
+        Unlink a node from its parent group, leaving its own children intact.
+        """
+        if id_ not in self.previous:
+            return
+        previous_id, next_id = self.previous.pop(id_), self.next.pop(id_)
+        parent_id = self.parents.get(id_, -1)
+        if previous_id == -1:
+            if self.heads.get(parent_id) == id_:
+                self.heads[parent_id] = next_id
+        elif previous_id in self.next:
+            self.next[previous_id] = next_id
+        if next_id == -1:
+            if self.tails.get(parent_id) == id_:
+                self.tails[parent_id] = previous_id
+        elif next_id in self.previous:
+            self.previous[next_id] = previous_id
+
+
 class BaseServer(Context):
     """
     Base class for realtime execution contexts.
@@ -126,6 +289,8 @@ class BaseServer(Context):
 
     _contexts: Set["BaseServer"] = set()
 
+    _osc_protocol_classes: Dict[str, Type[OscProtocol]] = {}
+
     ### INITIALIZER ###
 
     def __init__(
@@ -135,30 +300,51 @@ class BaseServer(Context):
         process_protocol: ProcessProtocol,
         **kwargs,
     ) -> None:
-        super().__init__(options)
+        super().__init__(options, **kwargs)
         self._latency = 0.1
         self._is_owner = False
         self._boot_status = BootStatus.OFFLINE
         self._buffers: Set[int] = set()
+        self._maximum_bundle_size: Optional[int] = None
         self._maximum_logins = 1
-        self._node_active: Dict[int, bool] = {}
-        self._node_children: Dict[int, List[int]] = {}
-        self._node_parents: Dict[int, int] = {}
+        self._node_tree = NodeTree()
         self._osc_protocol = osc_protocol
         self._process_protocol = process_protocol
         self._shm: Optional["ServerSHM"] = None
+        # Control bus writes not yet known to have been applied, by bus ID.
+        self._shm_pending_writes: Dict[int, int] = {}
+        self._shm_write_count = 0
+        self._synthdefs: Dict[str, str] = {}
+        self._synthdefs_in_flight: Deque[List[Tuple[str, str]]] = collections.deque()
+        self._osc_handlers: Dict[str, Callable[[OscMessage], None]] = {
+            "/d_removed": self._handle_d_removed,
+            "/done": self._handle_done,
+            "/fail": self._handle_fail,
+            "/n_end": self._handle_n_end,
+            "/n_go": self._handle_n_go,
+            "/n_move": self._handle_n_move,
+            "/n_off": self._handle_n_off,
+            "/n_on": self._handle_n_on,
+            "/status.reply": self._handle_status_reply,
+        }
         self._setup_osc_callbacks()
+        self._setup_osc_protocol()
         self._status: Optional[StatusInfo] = None
 
     ### SPECIAL METHODS ###
 
-    def __contains__(self, object_: ContextObject) -> bool:
+    def __contains__(self, object_: Union[ContextObject, SynthDef]) -> bool:
+        if isinstance(object_, SynthDef):
+            with self._lock:
+                return (
+                    self._synthdefs.get(object_.actual_name) == object_.anonymous_name
+                )
         if object_.context is not self:
             return False
         if self.boot_status != BootStatus.ONLINE:
             return False
         if isinstance(object_, Node) and (
-            object_.id_ in self._node_parents or object_.id_ == 0
+            object_.id_ in self._node_tree or object_.id_ == 0
         ):
             return True
         if isinstance(object_, Buffer) and object_.id_ in self._buffers:
@@ -176,6 +362,35 @@ class BaseServer(Context):
 
     ### PRIVATE METHODS ###
 
+    def _apply_completions(
+        self, pairs: List[Tuple[Request, Optional[Completion]]]
+    ) -> List[Request]:
+        requests = super()._apply_completions(pairs)
+        if self._shm is not None:
+            self._track_bus_writes(requests)
+        return requests
+
+    def _confirm_bus_writes(self, write_count: int) -> None:
+        # Writes sent before a completed round trip have been applied.
+        with self._lock:
+            self._shm_pending_writes = {
+                id_: count
+                for id_, count in self._shm_pending_writes.items()
+                if count > write_count
+            }
+
+    def _fill_buffer_array(
+        self,
+        array: "numpy.ndarray",
+        index: int,
+        responses: Sequence[Optional["Response"]],
+    ) -> None:
+        for response in responses:
+            if response is None:
+                raise ValueError("Buffer range request went unanswered")
+            for start, values in cast(GetBufferRangeInfo, response).items:
+                array[start - index : start - index + len(values)] = values
+
     def _free_id(
         self,
         type_: Type[ContextObject],
@@ -184,96 +399,348 @@ class BaseServer(Context):
     ) -> None:
         self._get_allocator(type_, calculation_rate).free(id_)
 
-    def _handle_osc_callbacks(self, message: OscMessage) -> None:
-        def _handle_done(message: OscMessage) -> None:
-            if message.contents[0] in (
-                "/b_alloc",
-                "/b_allocRead",
-                "/b_allocReadChannel",
-            ):
-                self._buffers.add(message.contents[1])
-            elif message.contents[0] == "/b_free":
-                if message.contents[1] in self._buffers:
-                    self._buffers.remove(message.contents[1])
-                self._free_id(Buffer, message.contents[1])
-
-        def _handle_n_end(message: OscMessage) -> None:
-            id_, parent_id, *_ = message.contents
-            if parent_id == -1:
-                parent_id = self._node_parents.get(id_)
-            if parent_id is not None:
-                _remove_node_from_children(id_, parent_id)
-            self._free_id(Node, id_)
-            self._node_active.pop(id_, None)
-            self._node_children.pop(id_, None)
-            self._node_parents.pop(id_, None)
-
-        def _handle_n_go(message: OscMessage) -> None:
-            id_, parent_id, previous_id, next_id, is_group, *_ = message.contents
-            self._node_parents[id_] = parent_id
-            self._node_active[id_] = True
-            if is_group:
-                self._node_children[id_] = []
-            _add_node_to_children(id_, parent_id, previous_id, next_id)
-
-        def _handle_n_move(message: OscMessage) -> None:
-            id_, parent_id, previous_id, next_id, *_ = message.contents
-            old_parent_id = self._node_parents[id_]
-            _remove_node_from_children(id_, old_parent_id)
-            _add_node_to_children(id_, parent_id, previous_id, next_id)
-
-        def _handle_n_off(message: OscMessage) -> None:
-            self._node_active[message.contents[0]] = False
-
-        def _handle_n_on(message: OscMessage) -> None:
-            self._node_active[message.contents[0]] = True
-
-        def _handle_status_reply(message: OscMessage):
-            self._status = cast(StatusInfo, StatusInfo.from_osc(message))
-
-        def _add_node_to_children(
-            id_: int, parent_id: int, previous_id: int, next_id: int
-        ) -> None:
-            self._node_parents[id_] = parent_id
-            children = self._node_children[parent_id]
-            if previous_id == -1:
-                children.insert(0, id_)
-            elif next_id == -1:
-                children.append(id_)
-            elif previous_id in children:
-                children.insert(children.index(previous_id) + 1, id_)
-            elif next_id in children:
-                children.insert(children.index(next_id), id_)
-
-        def _remove_node_from_children(id_: int, parent_id: int) -> None:
-            children = self._node_children[parent_id]
-            try:
-                children.pop(children.index(id_))
-            except ValueError:
-                pass
-
-        handlers = {
-            "/done": _handle_done,
-            "/n_end": _handle_n_end,
-            "/n_go": _handle_n_go,
-            "/n_move": _handle_n_move,
-            "/n_off": _handle_n_off,
-            "/n_on": _handle_n_on,
-            "/status.reply": _handle_status_reply,
-        }
+    def _get_buffer_chunk_size(self) -> int:
+        # scsynth replies to /b_getn within one UDP datagram's worth, even over TCP.
+        return super()._get_buffer_chunk_size() or (LOOPBACK_DATAGRAM_SIZE - 64) // 5
+
+    def _get_buffer_range_get_requests(
+        self, buffer: Buffer, index: int, count: int
+    ) -> List[GetBufferRange]:
+        chunk_size = self._get_buffer_chunk_size()
+        return [
+            GetBufferRange(
+                buffer_id=int(buffer),
+                items=[(index + i, min(chunk_size, count - i))],
+            )
+            for i in range(0, max(count, 1), chunk_size)
+        ]
+
+    def _get_buffer_window_size(self, window_size: Optional[int]) -> int:
+        if window_size is not None:
+            return max(1, int(window_size))
+        return max(
+            1, BUFFER_TRANSFER_BYTES_IN_FLIGHT // (self._get_buffer_chunk_size() * 5)
+        )
 
+    def _get_buffer_write_request(
+        self, buffer: Buffer, index: int, count: int, channel_count: int, path: Path
+    ) -> Tuple[WriteBuffer, int]:
+        # Whole frames covering the sample range, and the range's offset into them.
+        starting_frame = index // channel_count
+        stopping_frame = -(-(index + count) // channel_count)
+        request = WriteBuffer(
+            buffer_id=int(buffer),
+            path=path,
+            header_format=HeaderFormat.WAV,
+            sample_format=SampleFormat.FLOAT,
+            frame_count=stopping_frame - starting_frame,
+            starting_frame=starting_frame,
+        )
+        return request, index - starting_frame * channel_count
+
+    def _get_maximum_bundle_size(self) -> Optional[int]:
+        if self._maximum_bundle_size is not None:
+            return self._maximum_bundle_size
+        if self._options.protocol == "tcp":
+            return None
+        if self._is_local():
+            return LOOPBACK_DATAGRAM_SIZE
+        return NETWORK_DATAGRAM_SIZE
+
+    def _gather_start(
+        self,
+        requestables: Sequence[Requestable],
+        procedure: Callable[[], None],
+        window_size: int,
+    ) -> Tuple[ResponseCollector, List[OscCallback]]:
+        if self._boot_status not in (BootStatus.BOOTING, BootStatus.ONLINE):
+            raise ServerOffline
+        maximum_size = self._get_maximum_bundle_size()
+        patterns: List[Tuple] = []
+        windows: List[Tuple[int, List[OscBundle]]] = []
+        messages: List[Union[OscBundle, OscMessage]] = []
+
+        def close_window() -> None:
+            sync_id = self._get_next_sync_id()
+            messages.append(Sync(sync_id=sync_id).to_osc())
+            if maximum_size is None:
+                windows.append((sync_id, [OscBundle(contents=messages[:])]))
+            else:
+                windows.append(
+                    (sync_id, OscBundle.partition(messages, maximum_size=maximum_size))
+                )
+            messages.clear()
+
+        for i, requestable in enumerate(requestables, 1):
+            (
+                success_pattern,
+                failure_pattern,
+                requestable,
+            ) = requestable._get_response_patterns_and_requestable(self)
+            patterns.append((success_pattern, failure_pattern))
+            messages.append(requestable.to_osc())
+            if i % window_size == 0:
+                close_window()
+        if messages or not windows:
+            close_window()
+        collector = ResponseCollector(patterns)
+        pending_windows = iter(windows)
+        sync_id, bundles = next(pending_windows)
+
+        def pace(message: OscMessage) -> None:
+            nonlocal sync_id, bundles
+            if message.unpack(1) != (sync_id,):
+                return
+            try:
+                sync_id, bundles = next(pending_windows)
+            except StopIteration:
+                procedure()
+                return
+            for bundle in bundles:
+                self._osc_protocol.send(bundle)
+
+        # Registered after the collector, so every response, including a
+        # window's /synced, is collected before pacing on it.
+        callbacks = [
+            self._osc_protocol.register(pattern=[address], procedure=collector)
+            for address in sorted(collector.addresses)
+        ]
+        callbacks.append(
+            self._osc_protocol.register(pattern=["/synced"], procedure=pace)
+        )
+        for bundle in bundles:
+            self._osc_protocol.send(bundle)
+        return collector, callbacks
+
+    def _gather_stop(self, callbacks: List[OscCallback]) -> None:
+        for callback in callbacks:
+            self._osc_protocol.unregister(callback)
+
+    def _get_known_synthdefs(self) -> Dict[str, str]:
+        # Graph hashes by name the server holds once in-flight uploads land.
+        known = dict(self._synthdefs)
+        for batch in self._synthdefs_in_flight:
+            known.update(batch)
+        return known
+
+    def _handle_d_removed(self, message: OscMessage) -> None:
+        self._synthdefs.pop(message.unpack(1)[0], None)
+
+    def _handle_done(self, message: OscMessage) -> None:
+        command, *arguments = message.unpack(2)
+        if command in (
+            "/b_alloc",
+            "/b_allocRead",
+            "/b_allocReadChannel",
+        ):
+            self._buffers.add(arguments[0])
+        elif command == "/b_free":
+            if arguments[0] in self._buffers:
+                self._buffers.remove(arguments[0])
+            self._free_id(Buffer, arguments[0])
+        elif command == "/d_recv":
+            # scsynth completes /d_recv requests in the order they were sent.
+            if self._synthdefs_in_flight:
+                self._synthdefs.update(self._synthdefs_in_flight.popleft())
+
+    def _handle_fail(self, message: OscMessage) -> None:
+        if message.unpack(1)[0] == "/d_recv" and self._synthdefs_in_flight:
+            self._synthdefs_in_flight.popleft()
+
+    def _handle_n_end(self, message: OscMessage) -> None:
+        id_, _ = message.unpack(2)
+        self._node_tree.remove(id_)
+        self._free_id(Node, id_)
+
+    def _handle_n_go(self, message: OscMessage) -> None:
+        id_, parent_id, previous_id, next_id, is_group = message.unpack(5)
+        self._node_tree.active[id_] = True
+        if is_group:
+            self._node_tree.add_group(id_)
+        self._node_tree.link(id_, parent_id, previous_id, next_id)
+
+    def _handle_n_move(self, message: OscMessage) -> None:
+        id_, parent_id, previous_id, next_id = message.unpack(4)
+        self._node_tree.unlink(id_)
+        self._node_tree.link(id_, parent_id, previous_id, next_id)
+
+    def _handle_n_off(self, message: OscMessage) -> None:
+        self._node_tree.active[message.unpack(1)[0]] = False
+
+    def _handle_n_on(self, message: OscMessage) -> None:
+        self._node_tree.active[message.unpack(1)[0]] = True
+
+    def _handle_osc_callbacks(self, messages: Iterable[OscMessage]) -> None:
+        """
+        Apply a burst of notifications under a single lock acquisition.
+
+        Registered as a batched callback, so notifications received together
+        arrive together.
+        """
+        handlers = self._osc_handlers
         with self._lock:
-            handler = handlers.get(str(message.address))
-            if handler is not None:
-                handler(message)
+            for message in messages:
+                if (handler := handlers.get(str(message.address))) is not None:
+                    handler(message)
+
+    def _handle_status_reply(self, message: OscMessage) -> None:
+        self._status = cast(StatusInfo, StatusInfo.from_osc(message))
+
+    def _is_local(self) -> bool:
+        try:
+            return ipaddress.ip_address(self._options.ip_address).is_loopback
+        except ValueError:
+            return self._options.ip_address == "localhost"
+
+    @staticmethod
+    def _join_buffer_ranges(
+        responses: Sequence[Optional["Response"]],
+    ) -> Tuple[float, ...]:
+        values: List[float] = []
+        for response in responses:
+            if response is None:
+                raise ValueError("Buffer range request went unanswered")
+            for _, range_values in cast(GetBufferRangeInfo, response).items:
+                values.extend(range_values)
+        return tuple(values)
+
+    @staticmethod
+    def _read_buffer_file(array: "numpy.ndarray", path: Path, offset: int) -> None:
+        # Memory-map the data chunk of the float WAV file written by /b_write.
+        import numpy
+
+        with path.open("rb") as file_pointer:
+            header = file_pointer.read(12)
+            if header[:4] != b"RIFF" or header[8:] != b"WAVE":
+                raise ValueError(path)
+            while len(chunk_header := file_pointer.read(8)) == 8:
+                chunk_id, size = chunk_header[:4], int.from_bytes(
+                    chunk_header[4:], "little"
+                )
+                if chunk_id == b"data":
+                    break
+                file_pointer.seek(size + size % 2, 1)
+            else:
+                raise ValueError(path)
+            data_offset = file_pointer.tell()
+        samples = numpy.memmap(
+            path, dtype="<f4", mode="r", offset=data_offset, shape=(size // 4,)
+        )
+        array[:] = samples[offset : offset + len(array)]
+        del samples
+
+    def _read_shm(self, bus_id: int, count: int = 1) -> Optional[Tuple[float, ...]]:
+        # Shared memory only shows writes scsynth has applied, so it is only
+        # read once this context's writes to the buses have been confirmed.
+        if self._shm is None:
+            return None
+        if (pending_writes := self._shm_pending_writes) and any(
+            id_ in pending_writes for id_ in range(bus_id, bus_id + count)
+        ):
+            return None
+        return tuple(self._shm[bus_id : bus_id + count])
 
     def _resolve_node(self, node: Union[Node, SupportsInt, None]) -> int:
         if node is None:
             return self._client_id + 1
         return int(node)
 
+    def _resolve_synthdefs(self, requests: List[Request]) -> List[Request]:
+        """
+        Upload only the SynthDefs the server lacks.
+
+        Adjacent uploads are packed into as few ``/d_recv`` requests as fit the
+        transport, and uploads carrying completions are kept whole. The first
+        synth using an unknown SynthDef is deferred into the completion of an
+        upload, along with every request after it, so they keep their order.
+        Unknown SynthDefs needed by those later requests join the same upload.
+        """
+        maximum_size = self._get_maximum_bundle_size()
+        resolved: List[Request] = []
+        batch: List[SynthDef] = []
+        batch_size = 0
+        deferred_synthdefs: List[SynthDef] = []
+        deferred_requests: List[Request] = []
+
+        def flush() -> None:
+            nonlocal batch, batch_size
+            if batch:
+                resolved.append(ReceiveSynthDefs(synthdefs=batch))
+            batch, batch_size = [], 0
+
+        with self._lock:
+            known = self._get_known_synthdefs()
+            for request in requests:
+                if isinstance(request, ReceiveSynthDefs) and not request.on_completion:
+                    for synthdef in request.synthdefs:
+                        name, hash_ = synthdef.actual_name, synthdef.anonymous_name
+                        if known.get(name) == hash_:
+                            continue
+                        known[name] = hash_
+                        if deferred_requests:
+                            deferred_synthdefs.append(synthdef)
+                            continue
+                        size = (
+                            len(name.encode()) + 1 + len(synthdef._compiled_ugen_graph)
+                        )
+                        if maximum_size is not None and (
+                            batch_size + size > maximum_size - 64
+                        ):
+                            flush()
+                        batch.append(synthdef)
+                        batch_size += size
+                    continue
+                flush()
+                if isinstance(request, ReceiveSynthDefs):
+                    for synthdef in request.synthdefs:
+                        known[synthdef.actual_name] = synthdef.anonymous_name
+                elif isinstance(request, NewSynth) and isinstance(
+                    request.synthdef, SynthDef
+                ):
+                    name = request.synthdef.actual_name
+                    if known.get(name) != request.synthdef.anonymous_name:
+                        known[name] = request.synthdef.anonymous_name
+                        deferred_synthdefs.append(request.synthdef)
+                        deferred_requests.append(request)
+                        continue
+                elif isinstance(request, FreeSynthDef):
+                    for x in request.synthdefs:
+                        name = x.actual_name if isinstance(x, SynthDef) else x
+                        known.pop(name, None)
+                        self._synthdefs.pop(name, None)
+                        for in_flight in self._synthdefs_in_flight:
+                            in_flight[:] = [x for x in in_flight if x[0] != name]
+                elif isinstance(request, FreeAllSynthDefs):
+                    known.clear()
+                    self._synthdefs.clear()
+                    for in_flight in self._synthdefs_in_flight:
+                        in_flight.clear()
+                (deferred_requests if deferred_requests else resolved).append(request)
+            flush()
+            if deferred_requests:
+                resolved.append(
+                    ReceiveSynthDefs(
+                        synthdefs=deferred_synthdefs,
+                        on_completion=(
+                            deferred_requests[0]
+                            if len(deferred_requests) == 1
+                            else RequestBundle(contents=deferred_requests)
+                        ),
+                    )
+                )
+            for request in [*resolved, *deferred_requests]:
+                if isinstance(request, ReceiveSynthDefs):
+                    self._synthdefs_in_flight.append(
+                        [
+                            (synthdef.actual_name, synthdef.anonymous_name)
+                            for synthdef in request.synthdefs
+                        ]
+                    )
+        return resolved
+
     def _setup_osc_callbacks(self) -> None:
         for pattern in (
+            ["/d_removed"],
             ["/done"],
             ["/fail"],
             ["/n_end"],
@@ -284,21 +751,43 @@ class BaseServer(Context):
             ["/status.reply"],
         ):
             self._osc_protocol.register(
-                pattern=pattern, procedure=self._handle_osc_callbacks
+                pattern=pattern, procedure=self._handle_osc_callbacks, batched=True
             )
 
+    def _setup_osc_protocol(self) -> None:
+        """
+        Swap in an OSC protocol matching the transport named by the options.
+
+        Registered callbacks and captures carry over to the new protocol.
+        """
+        try:
+            osc_protocol_class = self._osc_protocol_classes[self._options.protocol]
+        except KeyError:
+            raise ValueError(f"Unsupported protocol: {self._options.protocol!r}")
+        if type(self._osc_protocol) is osc_protocol_class:
+            return
+        osc_protocol = osc_protocol_class()
+        osc_protocol.callbacks = self._osc_protocol.callbacks
+        osc_protocol.captures = self._osc_protocol.captures
+        self._osc_protocol = osc_protocol
+
     def _setup_shm(self) -> None:
+        # Shared memory is keyed by port, so only trust it for local servers.
+        if not self._is_local():
+            return
         try:
-            from ..realtime.shm import ServerSHM
+            from .shm import ServerSHM
 
             self._shm = ServerSHM(
                 self._options.port, self._options.control_bus_channel_count
             )
         except (ImportError, ModuleNotFoundError):
             pass
+        except RuntimeError:
+            logger.info("Shared memory unavailable")
 
     def _setup_system(self) -> None:
-        self._node_children[0] = []
+        self._node_tree.add_group(0)
         with self.at():
             for i in range(self._maximum_logins):
                 self.add_group(permanent=True, add_action="ADD_TO_TAIL", target_node=0)
@@ -310,12 +799,38 @@ class BaseServer(Context):
 
     def _teardown_shm(self) -> None:
         self._shm = None
+        self._shm_pending_writes.clear()
 
     def _teardown_state(self) -> None:
-        self._node_active.clear()
-        self._node_children.clear()
-        self._node_parents.clear()
+        self._node_tree.clear()
         self._buffers.clear()
+        self._synthdefs.clear()
+        self._synthdefs_in_flight.clear()
+
+    def _track_bus_writes(self, requests: Sequence[Requestable]) -> None:
+        bus_ids: List[int] = []
+        stack = list(requests)
+        while stack:
+            request = stack.pop()
+            if isinstance(request, RequestBundle):
+                stack.extend(request.contents)
+            elif isinstance(request, SetControlBus):
+                bus_ids.extend(int(bus_id) for bus_id, _ in request.items)
+            elif isinstance(request, SetControlBusRange):
+                for bus_id, values in request.items:
+                    bus_ids.extend(range(int(bus_id), int(bus_id) + len(values)))
+            elif isinstance(request, FillControlBusRange):
+                for bus_id, count, _ in request.items:
+                    bus_ids.extend(range(int(bus_id), int(bus_id) + count))
+            if (on_completion := getattr(request, "on_completion", None)) is not None:
+                stack.append(on_completion)
+        if not bus_ids:
+            return
+        with self._lock:
+            self._shm_write_count += 1
+            self._shm_pending_writes.update(
+                dict.fromkeys(bus_ids, self._shm_write_count)
+            )
 
     def _validate_can_request(self) -> None:
         if self._boot_status not in (BootStatus.BOOTING, BootStatus.ONLINE):
@@ -327,7 +842,7 @@ class BaseServer(Context):
 
     ### PUBLIC METHODS ###
 
-    def send(self, message: SupportsOsc) -> None:
+    def send(self, message: Union[SupportsOsc, OscBundle, OscMessage]) -> None:
         """
         Send a message to the execution context.
 
@@ -347,6 +862,19 @@ class BaseServer(Context):
         """
         self._latency = float(latency)
 
+    def set_maximum_bundle_size(self, size: Optional[int]) -> None:
+        """
+        Set the largest bundle datagram, in bytes, sent per moment.
+
+        Larger moments are split into several bundles sharing one timestamp.
+        ``None`` restores the default, chosen from the transport: unlimited
+        over TCP, a full UDP datagram over loopback, and an Ethernet MTU's
+        worth of UDP payload otherwise.
+
+        :param size: The size in bytes.
+        """
+        self._maximum_bundle_size = int(size) if size is not None else None
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -384,6 +912,15 @@ class BaseServer(Context):
         """
         return self._process_protocol
 
+    @property
+    def shared_memory(self) -> Optional["ServerSHM"]:
+        """
+        Get the server's shared memory interface, if connected to a local server.
+
+        Exposes the control buses for zero-copy reads and bulk writes.
+        """
+        return self._shm
+
     @property
     def status(self) -> Optional[StatusInfo]:
         """
@@ -400,6 +937,13 @@ class Server(BaseServer):
     :param kwargs: Keyword arguments for options.
     """
 
+    ### CLASS VARIABLES ###
+
+    _osc_protocol_classes: Dict[str, Type[OscProtocol]] = {
+        "tcp": ThreadedTcpOscProtocol,
+        "udp": ThreadedOscProtocol,
+    }
+
     ### INITIALIZER ###
 
     def __init__(self, options: Optional[Options] = None, **kwargs):
@@ -414,6 +958,7 @@ class Server(BaseServer):
 
     def _connect(self) -> None:
         logger.info("Connecting")
+        self._setup_osc_protocol()
         cast(ThreadedOscProtocol, self._osc_protocol).connect(
             ip_address=self._options.ip_address,
             port=self._options.port,
@@ -422,6 +967,7 @@ class Server(BaseServer):
             ),
         )
         self._setup_notifications()
+        self._setup_shm()
         self._contexts.add(self)
         self._osc_protocol.activate_healthcheck()
         self._setup_allocators()
@@ -459,6 +1005,12 @@ class Server(BaseServer):
             self._client_id = int(response.other[0])
             self._maximum_logins = int(response.other[1])
 
+    def _setup_osc_protocol(self) -> None:
+        # Pending (un)registrations must survive the swap too.
+        command_queue = cast(ThreadedOscProtocol, self._osc_protocol).command_queue
+        super()._setup_osc_protocol()
+        cast(ThreadedOscProtocol, self._osc_protocol).command_queue = command_queue
+
     def _shutdown(self):
         if self.is_owner:
             self.quit()
@@ -486,7 +1038,6 @@ class Server(BaseServer):
             raise
         self._is_owner = True
         self._connect()
-        self._setup_shm()
         return self
 
     def connect(self, *, options: Optional[Options] = None, **kwargs) -> "Server":
@@ -515,6 +1066,36 @@ class Server(BaseServer):
         self._disconnect()
         return self
 
+    def gather(
+        self,
+        requests: Sequence[Requestable],
+        timeout: float = 1.0,
+        window_size: int = GATHER_WINDOW_SIZE,
+    ) -> List[Optional["Response"]]:
+        """
+        Communicate many requests at once, pipelined.
+
+        Requests are packed into as few bundles as the transport allows and sent
+        in windows, each closed by a ``/sync`` whose reply releases the next window.
+        Responses are matched back to their requests in order, and the whole batch
+        shares a single timeout.
+
+        :param requests: The requests to communicate.
+        :param timeout: The overall timeout in seconds.
+        :param window_size: The number of requests in flight at once.
+        :returns: One response per request, or ``None`` for requests expecting no
+            response.
+        """
+        future: Future[bool] = Future()
+        collector, callbacks = self._gather_start(
+            requests, lambda: future.set_result(True), window_size
+        )
+        try:
+            future.result(timeout=timeout)
+        finally:
+            self._gather_stop(callbacks)
+        return collector.responses
+
     def get_buffer(
         self, buffer: Buffer, *indices: int, sync: bool = True
     ) -> Optional[Dict[int, float]]:
@@ -534,13 +1115,68 @@ class Server(BaseServer):
         self._add_requests(request)
         return None
 
+    def get_buffer_array(
+        self,
+        buffer: Buffer,
+        index: int = 0,
+        count: Optional[int] = None,
+        *,
+        timeout: float = 10.0,
+        window_size: Optional[int] = None,
+    ) -> "numpy.ndarray":
+        """
+        Get a range of buffer samples as a numpy ``float32`` array.
+
+        Local servers write the range to a temporary float WAV file via ``/b_write``,
+        which is then memory-mapped. Remote servers, or local ones whose write fails,
+        emit ``/b_getn`` requests in datagram-sized chunks, reassembled into a
+        preallocated array.
+
+        Requires numpy.
+
+        :param buffer: The buffer whose samples to get.
+        :param index: The sample index to start reading at.
+        :param count: The number of samples to read, defaulting to the rest of the
+            buffer.
+        :param timeout: The overall timeout in seconds.
+        :param window_size: The number of chunks in flight at once, defaulting to
+            as many as comfortably fit a UDP receive buffer.
+        """
+        import numpy
+
+        info = cast(BufferInfo, self.query_buffer(buffer)).items[0]
+        if count is None:
+            count = info.frame_count * info.channel_count - index
+        array = numpy.empty(count, dtype=numpy.float32)
+        if not count:
+            return array
+        if self._is_local():
+            with tempfile.TemporaryDirectory() as temp_directory:
+                path = Path(temp_directory) / "buffer.wav"
+                request, offset = self._get_buffer_write_request(
+                    buffer, index, count, info.channel_count, path
+                )
+                if (self.gather([request], timeout=timeout))[0] is not None:
+                    self._read_buffer_file(array, path, offset)
+                    return array
+        self._fill_buffer_array(
+            array,
+            index,
+            self.gather(
+                self._get_buffer_range_get_requests(buffer, index, count),
+                timeout=timeout,
+                window_size=self._get_buffer_window_size(window_size),
+            ),
+        )
+        return array
+
     def get_buffer_range(
         self, buffer: Buffer, index: int, count: int, sync: bool = True
     ) -> Optional[Sequence[float]]:
         """
         Get a buffer sample range.
 
-        Emit ``/b_getn`` requests.
+        Emit ``/b_getn`` requests, split into datagram-sized chunks for large ranges.
 
         :param buffer: The buffer whose samples to get.
         :param index: The sample index to start reading at.
@@ -548,19 +1184,23 @@ class Server(BaseServer):
         :param sync: If true, communicate the request immediately. Otherwise bundle it
             with the current request context.
         """
-        request = GetBufferRange(buffer_id=buffer, items=[(index, count)])
-        if sync:
-            return cast(GetBufferRangeInfo, request.communicate(server=self)).items[0][
-                -1
-            ]
-        self._add_requests(request)
-        return None
+        requests = self._get_buffer_range_get_requests(buffer, index, count)
+        if not sync:
+            self._add_requests(*requests)
+            return None
+        if len(requests) == 1:
+            return cast(GetBufferRangeInfo, requests[0].communicate(server=self)).items[
+                0
+            ][-1]
+        return self._join_buffer_ranges(self.gather(requests, timeout=10.0))
 
     def get_bus(self, bus: Bus, sync: bool = True) -> Optional[float]:
         """
         Get a control bus value.
 
-        Emit ``/c_get`` requests.
+        Emit ``/c_get`` requests, or read shared memory directly when synchronously
+        reading from a local server. Until this context's own writes to the bus
+        are confirmed applied, reads fall back to ``/c_get``.
 
         :param bus: The control bus whose value to get.
         :param sync: If true, communicate the request immediately. Otherwise bundle it
@@ -568,11 +1208,14 @@ class Server(BaseServer):
         """
         if bus.calculation_rate != CalculationRate.CONTROL:
             raise InvalidCalculationRate
+        if sync and (values := self._read_shm(bus.id_)) is not None:
+            return values[0]
         request = GetControlBus(bus_ids=[bus.id_])
         if sync:
-            return cast(GetControlBusInfo, request.communicate(server=self)).items[0][
-                -1
-            ]
+            write_count = self._shm_write_count
+            response = cast(GetControlBusInfo, request.communicate(server=self))
+            self._confirm_bus_writes(write_count)
+            return response.items[0][-1]
         self._add_requests(request)
         return None
 
@@ -582,7 +1225,9 @@ class Server(BaseServer):
         """
         Get a range of control bus values.
 
-        Emit ``/c_getn`` requests.
+        Emit ``/c_getn`` requests, or read shared memory directly when synchronously
+        reading from a local server. Until this context's own writes to the buses
+        are confirmed applied, reads fall back to ``/c_getn``.
 
         :param bus: The control bus to start reading at.
         :param count: The number of contiguous buses whose values to get.
@@ -591,11 +1236,14 @@ class Server(BaseServer):
         """
         if bus.calculation_rate != CalculationRate.CONTROL:
             raise InvalidCalculationRate
+        if sync and (values := self._read_shm(bus.id_, count)) is not None:
+            return values
         request = GetControlBusRange(items=[(bus.id_, count)])
         if sync:
-            return cast(GetControlBusRangeInfo, request.communicate(server=self)).items[
-                0
-            ][-1]
+            write_count = self._shm_write_count
+            response = cast(GetControlBusRangeInfo, request.communicate(server=self))
+            self._confirm_bus_writes(write_count)
+            return response.items[0][-1]
         self._add_requests(request)
         return None
 
@@ -775,6 +1423,35 @@ class Server(BaseServer):
         self.sync()
         return self
 
+    def set_buffer_array(
+        self,
+        buffer: Buffer,
+        index: int,
+        values: Sequence[float],
+        *,
+        timeout: float = 10.0,
+        window_size: Optional[int] = None,
+    ) -> None:
+        """
+        Set a range of buffer samples, paced for bulk uploads.
+
+        Emit ``/b_setn`` requests in datagram-sized chunks, a window of chunks at a
+        time, returning once the server has received them all. numpy arrays are
+        encoded without converting each value in turn.
+
+        :param buffer: The buffer to modify.
+        :param index: The sample index to start writing at.
+        :param values: The values to write.
+        :param timeout: The overall timeout in seconds.
+        :param window_size: The number of chunks in flight at once, defaulting to
+            as many as comfortably fit a UDP receive buffer.
+        """
+        self.gather(
+            self._get_buffer_range_set_requests(buffer, index, values),
+            timeout=timeout,
+            window_size=self._get_buffer_window_size(window_size),
+        )
+
     def sync(self, sync_id: Optional[int] = None) -> "Server":
         """
         Sync the server.
@@ -785,9 +1462,11 @@ class Server(BaseServer):
         """
         if self._boot_status not in (BootStatus.BOOTING, BootStatus.ONLINE):
             raise ServerOffline
+        write_count = self._shm_write_count
         Sync(
             sync_id=sync_id if sync_id is not None else self._get_next_sync_id()
         ).communicate(server=self)
+        self._confirm_bus_writes(write_count)
         return self
 
 
@@ -799,6 +1478,13 @@ class AsyncServer(BaseServer):
     :param kwargs: Keyword arguments for options.
     """
 
+    ### CLASS VARIABLES ###
+
+    _osc_protocol_classes: Dict[str, Type[OscProtocol]] = {
+        "tcp": AsyncTcpOscProtocol,
+        "udp": AsyncOscProtocol,
+    }
+
     ### INITIALIZER ###
 
     def __init__(self, options: Optional[Options] = None, **kwargs):
@@ -813,6 +1499,7 @@ class AsyncServer(BaseServer):
 
     async def _connect(self) -> None:
         logger.info("Connecting")
+        self._setup_osc_protocol()
         await cast(AsyncOscProtocol, self._osc_protocol).connect(
             ip_address=self._options.ip_address,
             port=self._options.port,
@@ -821,6 +1508,7 @@ class AsyncServer(BaseServer):
             ),
         )
         await self._setup_notifications()
+        self._setup_shm()
         self._contexts.add(self)
         self._osc_protocol.activate_healthcheck()
         self._setup_allocators()
@@ -916,6 +1604,36 @@ class AsyncServer(BaseServer):
         await self._disconnect()
         return self
 
+    async def gather(
+        self,
+        requests: Sequence[Requestable],
+        timeout: float = 1.0,
+        window_size: int = GATHER_WINDOW_SIZE,
+    ) -> List[Optional["Response"]]:
+        """
+        Communicate many requests at once, pipelined.
+
+        Requests are packed into as few bundles as the transport allows and sent
+        in windows, each closed by a ``/sync`` whose reply releases the next window.
+        Responses are matched back to their requests in order, and the whole batch
+        shares a single timeout.
+
+        :param requests: The requests to communicate.
+        :param timeout: The overall timeout in seconds.
+        :param window_size: The number of requests in flight at once.
+        :returns: One response per request, or ``None`` for requests expecting no
+            response.
+        """
+        future: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+        collector, callbacks = self._gather_start(
+            requests, lambda: future.set_result(True), window_size
+        )
+        try:
+            await asyncio.wait_for(future, timeout=timeout)
+        finally:
+            self._gather_stop(callbacks)
+        return collector.responses
+
     async def get_buffer(
         self, buffer: Buffer, *indices: int, sync: bool = True
     ) -> Optional[Dict[int, float]]:
@@ -937,13 +1655,68 @@ class AsyncServer(BaseServer):
         self._add_requests(request)
         return None
 
+    async def get_buffer_array(
+        self,
+        buffer: Buffer,
+        index: int = 0,
+        count: Optional[int] = None,
+        *,
+        timeout: float = 10.0,
+        window_size: Optional[int] = None,
+    ) -> "numpy.ndarray":
+        """
+        Get a range of buffer samples as a numpy ``float32`` array.
+
+        Local servers write the range to a temporary float WAV file via ``/b_write``,
+        which is then memory-mapped. Remote servers, or local ones whose write fails,
+        emit ``/b_getn`` requests in datagram-sized chunks, reassembled into a
+        preallocated array.
+
+        Requires numpy.
+
+        :param buffer: The buffer whose samples to get.
+        :param index: The sample index to start reading at.
+        :param count: The number of samples to read, defaulting to the rest of the
+            buffer.
+        :param timeout: The overall timeout in seconds.
+        :param window_size: The number of chunks in flight at once, defaulting to
+            as many as comfortably fit a UDP receive buffer.
+        """
+        import numpy
+
+        info = cast(BufferInfo, await self.query_buffer(buffer)).items[0]
+        if count is None:
+            count = info.frame_count * info.channel_count - index
+        array = numpy.empty(count, dtype=numpy.float32)
+        if not count:
+            return array
+        if self._is_local():
+            with tempfile.TemporaryDirectory() as temp_directory:
+                path = Path(temp_directory) / "buffer.wav"
+                request, offset = self._get_buffer_write_request(
+                    buffer, index, count, info.channel_count, path
+                )
+                if (await self.gather([request], timeout=timeout))[0] is not None:
+                    self._read_buffer_file(array, path, offset)
+                    return array
+        self._fill_buffer_array(
+            array,
+            index,
+            await self.gather(
+                self._get_buffer_range_get_requests(buffer, index, count),
+                timeout=timeout,
+                window_size=self._get_buffer_window_size(window_size),
+            ),
+        )
+        return array
+
     async def get_buffer_range(
         self, buffer: Buffer, index: int, count: int, sync: bool = True
     ) -> Optional[Sequence[float]]:
         """
         Get a buffer sample range.
 
-        Emit ``/b_getn`` requests.
+        Emit ``/b_getn`` requests, split into datagram-sized chunks for large ranges.
 
         :param buffer: The buffer whose samples to get.
         :param index: The sample index to start reading at.
@@ -951,19 +1724,23 @@ class AsyncServer(BaseServer):
         :param sync: If true, communicate the request immediately. Otherwise bundle it
             with the current request context.
         """
-        request = GetBufferRange(buffer_id=buffer, items=[(index, count)])
-        if sync:
+        requests = self._get_buffer_range_get_requests(buffer, index, count)
+        if not sync:
+            self._add_requests(*requests)
+            return None
+        if len(requests) == 1:
             return cast(
-                GetBufferRangeInfo, await request.communicate_async(server=self)
+                GetBufferRangeInfo, await requests[0].communicate_async(server=self)
             ).items[0][-1]
-        self._add_requests(request)
-        return None
+        return self._join_buffer_ranges(await self.gather(requests, timeout=10.0))
 
     async def get_bus(self, bus: Bus, sync: bool = True) -> Optional[float]:
         """
         Get a control bus value.
 
-        Emit ``/c_get`` requests.
+        Emit ``/c_get`` requests, or read shared memory directly when synchronously
+        reading from a local server. Until this context's own writes to the bus
+        are confirmed applied, reads fall back to ``/c_get``.
 
         :param bus: The control bus whose value to get.
         :param sync: If true, communicate the request immediately. Otherwise bundle it
@@ -971,11 +1748,16 @@ class AsyncServer(BaseServer):
         """
         if bus.calculation_rate != CalculationRate.CONTROL:
             raise InvalidCalculationRate
+        if sync and (values := self._read_shm(bus.id_)) is not None:
+            return values[0]
         request = GetControlBus(bus_ids=[bus.id_])
         if sync:
-            return cast(
+            write_count = self._shm_write_count
+            response = cast(
                 GetControlBusInfo, await request.communicate_async(server=self)
-            ).items[0][-1]
+            )
+            self._confirm_bus_writes(write_count)
+            return response.items[0][-1]
         self._add_requests(request)
         return None
 
@@ -985,7 +1767,9 @@ class AsyncServer(BaseServer):
         """
         Get a range of control bus values.
 
-        Emit ``/c_getn`` requests.
+        Emit ``/c_getn`` requests, or read shared memory directly when synchronously
+        reading from a local server. Until this context's own writes to the buses
+        are confirmed applied, reads fall back to ``/c_getn``.
 
         :param bus: The control bus to start reading at.
         :param count: The number of contiguous buses whose values to get.
@@ -994,11 +1778,16 @@ class AsyncServer(BaseServer):
         """
         if bus.calculation_rate != CalculationRate.CONTROL:
             raise InvalidCalculationRate
+        if sync and (values := self._read_shm(bus.id_, count)) is not None:
+            return values
         request = GetControlBusRange(items=[(bus.id_, count)])
         if sync:
-            return cast(
+            write_count = self._shm_write_count
+            response = cast(
                 GetControlBusRangeInfo, await request.communicate_async(server=self)
-            ).items[0][-1]
+            )
+            self._confirm_bus_writes(write_count)
+            return response.items[0][-1]
         self._add_requests(request)
         return None
 
@@ -1181,6 +1970,35 @@ class AsyncServer(BaseServer):
         await self.sync()
         return self
 
+    async def set_buffer_array(
+        self,
+        buffer: Buffer,
+        index: int,
+        values: Sequence[float],
+        *,
+        timeout: float = 10.0,
+        window_size: Optional[int] = None,
+    ) -> None:
+        """
+        Set a range of buffer samples, paced for bulk uploads.
+
+        Emit ``/b_setn`` requests in datagram-sized chunks, a window of chunks at a
+        time, returning once the server has received them all. numpy arrays are
+        encoded without converting each value in turn.
+
+        :param buffer: The buffer to modify.
+        :param index: The sample index to start writing at.
+        :param values: The values to write.
+        :param timeout: The overall timeout in seconds.
+        :param window_size: The number of chunks in flight at once, defaulting to
+            as many as comfortably fit a UDP receive buffer.
+        """
+        await self.gather(
+            self._get_buffer_range_set_requests(buffer, index, values),
+            timeout=timeout,
+            window_size=self._get_buffer_window_size(window_size),
+        )
+
     async def sync(self, sync_id: Optional[int] = None) -> "AsyncServer":
         """
         Sync the server.
@@ -1191,7 +2009,9 @@ class AsyncServer(BaseServer):
         """
         if self._boot_status not in (BootStatus.BOOTING, BootStatus.ONLINE):
             raise ServerOffline
+        write_count = self._shm_write_count
         await Sync(
             sync_id=sync_id if sync_id is not None else self._get_next_sync_id()
         ).communicate_async(server=self)
+        self._confirm_bus_writes(write_count)
         return self
@@ -3,21 +3,28 @@ Classes for modeling requests to :term:`scsynth`.
 """
 
 import asyncio
+import collections
 import dataclasses
+import functools
 import logging
+import struct
 from abc import ABC, abstractmethod
 from concurrent.futures import Future
 from os import PathLike
 from typing import (
     TYPE_CHECKING,
+    Any,
+    Deque,
     Dict,
     List,
     Optional,
     Sequence,
+    Set,
     SupportsFloat,
     SupportsInt,
     Tuple,
     Union,
+    cast,
 )
 
 try:
@@ -28,7 +35,7 @@ except ImportError:
 from uqbar.objects import new
 
 from ..enums import AddAction, HeaderFormat, RequestName, SampleFormat
-from ..osc import OscBundle, OscMessage
+from ..osc import LazyOscMessage, OscBundle, OscMessage, OscTemplate
 from ..synthdefs import SynthDef, SynthDefCompiler
 from ..typing import AddActionLike, HeaderFormatLike, SampleFormatLike, SupportsOsc
 from .responses import Response
@@ -41,6 +48,11 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=256)
+def _get_osc_template(address, *arguments) -> OscTemplate:
+    return OscTemplate(address, *arguments)
+
+
 class Requestable(ABC):
     """
     Abstract base for request-like classes.
@@ -176,6 +188,88 @@ class RequestBundle(Requestable):
         )
 
 
+class ResponseCollector:
+    """
+    Demultiplexes the responses to many pipelined requestables.
+
+    Responses are matched against each requestable's success and failure
+    patterns, earliest unanswered requestable first, so a whole batch shares a
+    handful of address-level callbacks rather than registering one per request.
+
+    ::
+
+        >>> from supriya.contexts.requests import ResponseCollector
+        >>> from supriya.osc import OscMessage
+        >>> collector = ResponseCollector(
+        ...     [
+        ...         (["/c_set"], None),
+        ...         (["/n_info", 1000], ["/fail", "/n_query"]),
+        ...         (None, None),
+        ...         (["/c_set"], None),
+        ...     ]
+        ... )
+        >>> sorted(collector.addresses)
+        ['/c_set', '/fail', '/n_info']
+        >>> collector(OscMessage("/c_set", 0, 0.5))
+        >>> collector(OscMessage("/fail", "/n_query", "Node 1000 not found"))
+        >>> collector(OscMessage("/c_set", 1, 0.25))
+        >>> for response in collector.responses:
+        ...     print(response)
+        ...
+        GetControlBusInfo(items=[(0, 0.5)])
+        FailInfo(command_name='/n_query', error='Node 1000 not found', other=())
+        None
+        GetControlBusInfo(items=[(1, 0.25)])
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        patterns: Sequence[
+            Tuple[
+                Optional[Sequence[Union[float, str]]],
+                Optional[Sequence[Union[float, str]]],
+            ]
+        ],
+    ) -> None:
+        self.addresses: Set[str] = set()
+        self.pending: Dict[Tuple, Deque[int]] = {}
+        self.resolved: List[bool] = [False] * len(patterns)
+        self.responses: List[Optional[Response]] = [None] * len(patterns)
+        lengths: Set[int] = set()
+        for index, (success_pattern, failure_pattern) in enumerate(patterns):
+            for pattern in (success_pattern, failure_pattern):
+                if not pattern:
+                    continue
+                key = tuple(pattern)
+                self.pending.setdefault(key, collections.deque()).append(index)
+                self.addresses.add(cast(str, key[0]))
+                lengths.add(len(key))
+        self.lengths = sorted(lengths)
+
+    ### SPECIAL METHODS ###
+
+    def __call__(self, message: OscMessage) -> None:
+        best_key, best_index = None, -1
+        for length in self.lengths:
+            key = (message.address, *message.unpack(length - 1))
+            if len(key) < length:
+                break
+            indices = self.pending.get(key)
+            if not indices:
+                continue
+            while indices and self.resolved[indices[0]]:
+                indices.popleft()
+            if indices and (best_key is None or indices[0] < best_index):
+                best_key, best_index = key, indices[0]
+        if best_key is None:
+            return
+        self.pending[best_key].popleft()
+        self.resolved[best_index] = True
+        self.responses[best_index] = Response.from_osc(message)
+
+
 @dataclasses.dataclass
 class AllocateBuffer(Request):
     """
@@ -1300,6 +1394,18 @@ class NewSynth(Request):
         ... )
         >>> request.to_osc()
         OscMessage('/s_new', 'default', 1001, 1, 1000, 'amplitude', 0.5, 'frequency', 432.0, 'panning', 'c0')
+
+    ::
+
+        >>> request = NewSynth(
+        ...     synthdef=default,
+        ...     synth_id=1002,
+        ...     add_action="ADD_TO_TAIL",
+        ...     target_node_id=1000,
+        ...     variant="bright",
+        ... )
+        >>> request.to_osc()
+        OscMessage('/s_new', 'default.bright', 1002, 1, 1000)
     """
 
     synthdef: Union[SynthDef, str]
@@ -1307,17 +1413,44 @@ class NewSynth(Request):
     add_action: AddActionLike
     target_node_id: SupportsInt
     controls: Optional[Dict[Union[int, str], Union[SupportsFloat, str]]] = None
+    variant: Optional[str] = None
 
     def to_osc(self) -> OscMessage:
-        contents: List[Union[float, str]] = [
+        synthdef_name = (
             self.synthdef.actual_name
             if isinstance(self.synthdef, SynthDef)
-            else self.synthdef,
+            else self.synthdef
+        )
+        if self.variant:
+            synthdef_name = f"{synthdef_name}.{self.variant}"
+        controls = sorted((self.controls or {}).items())
+        if not any(isinstance(value, str) for _, value in controls):
+            # Numeric-only controls: reuse a template per synthdef and control names
+            template = _get_osc_template(
+                RequestName.SYNTH_NEW,
+                synthdef_name,
+                int,
+                int,
+                int,
+                *(
+                    x
+                    for key, _ in controls
+                    for x in (key if isinstance(key, str) else int(key), float)
+                ),
+            )
+            return template.render(
+                int(self.synth_id),
+                int(AddAction.from_expr(self.add_action)),
+                int(self.target_node_id),
+                *(float(value) for _, value in controls),
+            )
+        contents: List[Union[float, str]] = [
+            synthdef_name,
             int(self.synth_id),
             int(AddAction.from_expr(self.add_action)),
             int(self.target_node_id),
         ]
-        for key, value in sorted((self.controls or {}).items()):
+        for key, value in controls:
             contents.append(key if isinstance(key, str) else int(key))
             contents.append(value if isinstance(value, str) else float(value))
         return OscMessage(RequestName.SYNTH_NEW, *contents)
@@ -1745,20 +1878,36 @@ class SetBufferRange(Request):
     buffer_id: SupportsInt
     items: Sequence[Tuple[int, Sequence[float]]]
 
+    # Merged requests stop growing past this many values, leaving chunked uploads
+    # in datagram-sized messages.
+    _maximum_merged_value_count = 256
+
     @classmethod
     def merge(cls, requests: List["Request"]) -> List["Request"]:
-        items_by_buffer_id: Dict[int, List[Tuple[int, Sequence[float]]]] = {}
+        groups_by_buffer_id: Dict[
+            int, List[Tuple[List[int], List[Tuple[int, Sequence[float]]]]]
+        ] = {}
         for request in requests:
-            if isinstance(request, cls):
-                items_by_buffer_id.setdefault(int(request.buffer_id), []).extend(
-                    request.items
-                )
+            if not isinstance(request, cls):
+                continue
+            groups = groups_by_buffer_id.setdefault(int(request.buffer_id), [])
+            for index, values in request.items:
+                if not groups or (
+                    groups[-1][0][0]
+                    and groups[-1][0][0] + len(values) > cls._maximum_merged_value_count
+                ):
+                    groups.append(([0], []))
+                groups[-1][0][0] += len(values)
+                groups[-1][1].append((index, values))
         return [
             cls(buffer_id=buffer_id, items=items)
-            for buffer_id, items in sorted(items_by_buffer_id.items())
+            for buffer_id, groups in sorted(groups_by_buffer_id.items())
+            for _, items in groups
         ]
 
     def to_osc(self) -> OscMessage:
+        if self.items and all(hasattr(values, "dtype") for _, values in self.items):
+            return self._to_osc_from_arrays()
         contents: List[float] = [int(self.buffer_id)]
         for index, values in self.items:
             contents.extend(
@@ -1766,6 +1915,26 @@ class SetBufferRange(Request):
             )
         return OscMessage(RequestName.BUFFER_SET_CONTIGUOUS, *contents)
 
+    def _to_osc_from_arrays(self) -> OscMessage:
+        # Encode numpy arrays wholesale, rather than packing each value in turn,
+        # and only decode the message's contents if something reads them.
+        type_tags = ",i"
+        encoded_contents = [struct.pack(">i", int(self.buffer_id))]
+        for index, values in self.items:
+            values = cast(Any, values).reshape(-1)
+            type_tags += "ii" + "f" * len(values)
+            encoded_contents.append(struct.pack(">ii", int(index), len(values)))
+            encoded_contents.append(values.astype(">f4").tobytes())
+        return LazyOscMessage(
+            b"".join(
+                [
+                    OscMessage._encode_string(RequestName.BUFFER_SET_CONTIGUOUS.value),
+                    OscMessage._encode_string(type_tags),
+                    *encoded_contents,
+                ]
+            )
+        )
+
 
 @dataclasses.dataclass
 class SetControlBus(Request):
@@ -1859,14 +2028,17 @@ class SetNodeControl(Request):
     items: Sequence[Tuple[Union[int, str], Union[float, Sequence[float]]]]
 
     def to_osc(self) -> OscMessage:
-        contents: List[Union[float, str, List[float]]] = [int(self.node_id)]
+        arguments: List[Union[type, str, int, Tuple[type, ...]]] = [int]
+        contents: List[float] = [int(self.node_id)]
         for control, values in self.items:
-            contents.append(control if isinstance(control, str) else int(control))
+            arguments.append(control if isinstance(control, str) else int(control))
             if isinstance(values, Sequence):
-                contents.append([float(value) for value in values])
+                arguments.append((float,) * len(values))
+                contents.extend(float(value) for value in values)
             else:
+                arguments.append(float)
                 contents.append(float(values))
-        return OscMessage(RequestName.NODE_SET, *contents)
+        return _get_osc_template(RequestName.NODE_SET, *arguments).render(*contents)
 
 
 @dataclasses.dataclass
@@ -1,6 +1,8 @@
 # cython: language_level=3
 # distutils: language = c++
 
+from cpython.buffer cimport PyBUF_FORMAT
+
 from .shm cimport server_shared_memory_client
 
 
@@ -8,7 +10,18 @@ cdef class ServerSHM:
     """
     Server shared memory interface.
 
-    Currently supports reading control busses only.
+    Exposes the server's control buses for reading and writing without any OSC
+    round trip. Indexing and slicing read values, item and slice assignment
+    write them, and the buffer protocol exposes the whole control bus region
+    without copying::
+
+        >>> shm = ServerSHM(57110, 16384)  # doctest: +SKIP
+        >>> shm[0:4] = [0.1, 0.2, 0.3, 0.4]  # doctest: +SKIP
+        >>> shm.as_array()[:4]  # doctest: +SKIP
+        array([0.1, 0.2, 0.3, 0.4], dtype=float32)
+
+    Views into the shared memory keep this object alive, but become invalid
+    once the server quits.
 
     .. warning::
 
@@ -17,22 +30,90 @@ cdef class ServerSHM:
     """
     cdef server_shared_memory_client* client
     cdef unsigned int bus_count
+    cdef float* buses
+    cdef Py_ssize_t shape[1]
+    cdef Py_ssize_t strides[1]
 
     def __cinit__(self, unsigned int port_number, unsigned int bus_count):
         self.client = new server_shared_memory_client(port_number)
         self.bus_count = bus_count
+        self.buses = self.client.get_control_busses()
+        self.shape[0] = bus_count
+        self.strides[0] = sizeof(float)
 
     def __dealloc__(self):
         del self.client
 
+    def __getbuffer__(self, Py_buffer* buffer, int flags):
+        buffer.buf = <char*> self.buses
+        buffer.format = NULL
+        if flags & PyBUF_FORMAT:
+            buffer.format = "f"
+        buffer.internal = NULL
+        buffer.itemsize = sizeof(float)
+        buffer.len = self.bus_count * sizeof(float)
+        buffer.ndim = 1
+        buffer.obj = self
+        buffer.readonly = 0
+        buffer.shape = self.shape
+        buffer.strides = self.strides
+        buffer.suboffsets = NULL
+
+    def __releasebuffer__(self, Py_buffer* buffer):
+        pass
+
     def __getitem__(self, item):
+        cdef Py_ssize_t index, start, stop, step
         if isinstance(item, int):
-            if item < 0 or item >= self.bus_count:
+            index = item
+            if index < 0 or index >= self.bus_count:
                 raise ValueError("index out of bounds")
-            return self.client.get_control_busses()[item]
+            return self.buses[index]
         elif isinstance(item, slice):
-            result = []
-            for index in range(*item.indices(self.bus_count)):
-                result.append(self.client.get_control_busses()[index])
-            return result
-        raise ValueError(item)
\ No newline at end of file
+            start, stop, step = item.indices(self.bus_count)
+            return [self.buses[index] for index in range(start, stop, step)]
+        raise ValueError(item)
+
+    def __len__(self):
+        return self.bus_count
+
+    def __setitem__(self, item, value):
+        cdef Py_ssize_t index, start, stop, step, count, i
+        cdef const float[:] source
+        if isinstance(item, int):
+            index = item
+            if index < 0 or index >= self.bus_count:
+                raise ValueError("index out of bounds")
+            self.buses[index] = value
+            return
+        elif not isinstance(item, slice):
+            raise ValueError(item)
+        start, stop, step = item.indices(self.bus_count)
+        count = len(range(start, stop, step))
+        if len(value) != count:
+            raise ValueError(f"expected {count} values, got {len(value)}")
+        try:
+            # float32 buffers, e.g. numpy arrays, are copied without boxing
+            source = value
+        except (TypeError, ValueError):
+            for i, x in enumerate(value):
+                self.buses[start + i * step] = x
+            return
+        for i in range(count):
+            self.buses[start + i * step] = source[i]
+
+    def as_array(self):
+        """
+        Get the control buses as a zero-copy, writable numpy ``float32`` array.
+
+        Requires numpy.
+        """
+        import numpy
+
+        return numpy.asarray(self)
+
+    def as_memoryview(self):
+        """
+        Get the control buses as a zero-copy, writable ``memoryview``.
+        """
+        return memoryview(self)
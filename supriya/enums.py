@@ -124,18 +124,21 @@ class CalculationRate(IntEnumeration):
 
         Return calculation-rate.
         """
+        if isinstance(expr, cls):
+            return expr
+        elif isinstance(expr, (int, float)):
+            return CalculationRate.SCALAR
+
         from .synthdefs import Parameter
         from .ugens import OutputProxy, UGen
 
-        if isinstance(expr, (int, float)) and not isinstance(expr, cls):
-            return CalculationRate.SCALAR
-        elif isinstance(expr, (OutputProxy, UGen)):
+        if isinstance(expr, (OutputProxy, UGen)):
             return expr.calculation_rate
         elif isinstance(expr, Parameter):
             name = expr.parameter_rate.name
             if name == "TRIGGER":
                 return CalculationRate.CONTROL
-            return CalculationRate.from_expr(name)
+            return CalculationRate[name]
         elif isinstance(expr, str):
             return super().from_expr(expr)
         elif isinstance(expr, Sequence):
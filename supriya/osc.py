@@ -4,7 +4,6 @@ Tools for sending, receiving and handling OSC messages.
 
 import abc
 import asyncio
-import collections
 import contextlib
 import dataclasses
 import datetime
@@ -15,6 +14,7 @@ import queue
 import socket
 import socketserver
 import struct
+import sys
 import threading
 import time
 from collections.abc import Sequence as SequenceABC
@@ -22,6 +22,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Iterable,
     List,
     NamedTuple,
     Optional,
@@ -29,12 +30,19 @@ from typing import (
     Set,
     Tuple,
     Union,
+    cast,
 )
 
 from uqbar.objects import get_repr
 
+from . import tracing
 from .utils import group_iterable_by_count
 
+try:
+    from . import _osc  # type: ignore
+except (ImportError, ModuleNotFoundError):
+    _osc = None
+
 osc_protocol_logger = logging.getLogger(__name__)
 osc_in_logger = logging.getLogger("supriya.osc.in")
 osc_out_logger = logging.getLogger("supriya.osc.out")
@@ -146,6 +154,11 @@ class OscMessage:
               96   61 00 00 00  62 00 00 00  63 00 00 00  64 00 00 00   |a...b...c...d...|
     """
 
+    ### CLASS VARIABLES ###
+
+    # Pre-rendered datagram, set by OscTemplate.render() and LazyOscMessage
+    _datagram: Optional[bytes] = None
+
     ### INITIALIZER ###
 
     def __init__(self, address, *contents) -> None:
@@ -159,7 +172,7 @@ class OscMessage:
     ### SPECIAL METHODS ###
 
     def __eq__(self, other) -> bool:
-        if type(self) is not type(other):
+        if not isinstance(other, OscMessage):
             return False
         if self.address != other.address:
             return False
@@ -246,6 +259,10 @@ class OscMessage:
     ### PUBLIC METHODS ###
 
     def to_datagram(self) -> bytes:
+        if self._datagram is not None:
+            return self._datagram
+        if _osc is not None:
+            return _osc.encode_message(self)
         # address can be a string or (in SuperCollider) an int
         if isinstance(self.address, str):
             encoded_address = self._encode_string(self.address)
@@ -263,6 +280,8 @@ class OscMessage:
 
     @classmethod
     def from_datagram(cls, datagram):
+        if _osc is not None:
+            return _osc.decode_message(cls, datagram)
         remainder = datagram
         address, remainder = cls._decode_string(remainder)
         type_tags, remainder = cls._decode_string(remainder)
@@ -306,6 +325,18 @@ class OscMessage:
                 raise RuntimeError(f"Unable to parse type {type_tag!r}")
         return cls(address, *contents)
 
+    def unpack(self, count: int) -> Tuple:
+        """
+        Get the message's first ``count`` arguments.
+
+        ::
+
+            >>> OscMessage("/n_go", 1000, 1, -1, -1, 0).unpack(2)
+            (1000, 1)
+
+        """
+        return self.contents[:count]
+
     def to_list(self):
         result = [self.address]
         for x in self.contents:
@@ -316,6 +347,98 @@ class OscMessage:
         return result
 
 
+class LazyOscMessage(OscMessage):
+    """
+    An OSC message decoded on demand from a datagram, e.g. one just received.
+
+    Only the address and type tags are parsed up front. Arguments are decoded
+    in full on first access to ``contents``, while :py:meth:`unpack` reads
+    leading scalar arguments straight from the datagram. Contents already known,
+    e.g. those just encoded, can be passed to skip decoding entirely.
+
+    ::
+
+        >>> from supriya.osc import LazyOscMessage, OscMessage
+        >>> datagram = OscMessage("/n_go", 1000, 1, -1, -1, 0).to_datagram()
+        >>> message = LazyOscMessage(datagram)
+        >>> message.address, message.type_tags
+        ('/n_go', ',iiiii')
+        >>> message.unpack(2)
+        (1000, 1)
+        >>> message
+        OscMessage('/n_go', 1000, 1, -1, -1, 0)
+        >>> message == OscMessage("/n_go", 1000, 1, -1, -1, 0)
+        True
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    _scalars = {
+        "d": struct.Struct(">d"),
+        "f": struct.Struct(">f"),
+        "i": struct.Struct(">i"),
+    }
+
+    _constants = {"F": False, "N": None, "T": True}
+
+    ### INITIALIZER ###
+
+    def __init__(self, datagram: bytes, contents: Optional[Tuple] = None) -> None:
+        address_stop = datagram.index(b"\x00")
+        type_tags_start = (address_stop // 4 + 1) * 4
+        type_tags_stop = datagram.index(b"\x00", type_tags_start)
+        self.address = str(datagram[:address_stop], "ascii")
+        self.type_tags = str(datagram[type_tags_start:type_tags_stop], "ascii")
+        self._arguments_start = (type_tags_stop // 4 + 1) * 4
+        self._contents: Optional[Tuple] = contents
+        self._datagram = datagram
+
+    ### SPECIAL METHODS ###
+
+    def __repr__(self) -> str:
+        return "OscMessage({})".format(
+            ", ".join(repr(_) for _ in [self.address, *self.contents])
+        )
+
+    ### PUBLIC METHODS ###
+
+    @classmethod
+    def from_datagram(cls, datagram):
+        return cls(datagram)
+
+    def unpack(self, count: int) -> Tuple:
+        if self._contents is not None:
+            return self._contents[:count]
+        datagram, offset, values = (
+            cast(bytes, self._datagram),
+            self._arguments_start,
+            [],
+        )
+        for type_tag in self.type_tags[1 : count + 1]:
+            if (scalar := self._scalars.get(type_tag)) is not None:
+                values.append(scalar.unpack_from(datagram, offset)[0])
+                offset += scalar.size
+            elif type_tag in self._constants:
+                values.append(self._constants[type_tag])
+            elif type_tag == "s":
+                stop = datagram.index(b"\x00", offset)
+                values.append(str(datagram[offset:stop], "ascii"))
+                offset = (stop // 4 + 1) * 4
+            else:
+                # Arrays and blobs need the full decoder.
+                return self.contents[:count]
+        return tuple(values)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def contents(self) -> Tuple:  # type: ignore
+        if self._contents is None:
+            self._contents = OscMessage.from_datagram(self._datagram).contents
+        return self._contents
+
+
 class OscBundle:
     """
     An OSC bundle.
@@ -460,6 +583,8 @@ class OscBundle:
 
     @classmethod
     def from_datagram(cls, datagram):
+        if _osc is not None:
+            return _osc.decode_bundle(cls, datagram)
         if not datagram.startswith(BUNDLE_PREFIX):
             raise ValueError("datagram is not a bundle")
         remainder = datagram[8:]
@@ -477,26 +602,61 @@ class OscBundle:
         return osc_bundle
 
     @classmethod
-    def partition(cls, messages, timestamp=None):
-        bundles = []
-        contents = []
-        message = collections.deque(messages)
-        remaining = maximum = 8192 - len(BUNDLE_PREFIX) - 4
-        while messages:
-            message = messages.popleft()
+    def partition(
+        cls, messages, timestamp=None, maximum_size: int = 8192
+    ) -> List["OscBundle"]:
+        """
+        Greedily pack ``messages`` into bundles sharing ``timestamp``, each of
+        whose datagrams fits within ``maximum_size`` bytes.
+
+        Message order is preserved, and each message is encoded only once:
+        bundles hold :py:class:`LazyOscMessage` copies of the messages passed
+        in, carrying their datagrams. A message too large to share a bundle is
+        bundled on its own.
+
+        ::
+
+            >>> from supriya.osc import OscBundle, OscMessage
+            >>> messages = [OscMessage("/n_free", i) for i in range(4)]
+            >>> for bundle in OscBundle.partition(messages, maximum_size=64):
+            ...     bundle
+            ...
+            OscBundle(
+                contents=(
+                    OscMessage('/n_free', 0),
+                    OscMessage('/n_free', 1),
+                ),
+            )
+            OscBundle(
+                contents=(
+                    OscMessage('/n_free', 2),
+                    OscMessage('/n_free', 3),
+                ),
+            )
+
+        """
+        bundles: List[OscBundle] = []
+        contents: List[Union[OscBundle, OscMessage]] = []
+        maximum = remaining = maximum_size - len(BUNDLE_PREFIX) - 8
+        for message in messages:
             datagram = message.to_datagram()
-            remaining -= len(datagram) + 4
-            if remaining > 0:
-                contents.append(message)
-            else:
+            if isinstance(message, OscMessage) and not isinstance(
+                message, LazyOscMessage
+            ):
+                message = LazyOscMessage(datagram, message.contents)
+            size = len(datagram) + 4
+            if contents and size > remaining:
                 bundles.append(cls(timestamp=timestamp, contents=contents))
-                contents = [message]
-                remaining = maximum
+                contents, remaining = [], maximum
+            contents.append(message)
+            remaining -= size
         if contents:
             bundles.append(cls(timestamp=timestamp, contents=contents))
         return bundles
 
     def to_datagram(self, realtime=True) -> bytes:
+        if _osc is not None:
+            return _osc.encode_bundle(self, realtime=realtime)
         datagram = BUNDLE_PREFIX
         datagram += self._encode_date(self.timestamp, realtime=realtime)
         for content in self.contents:
@@ -511,6 +671,140 @@ class OscBundle:
         return result
 
 
+class OscTemplate:
+    """
+    A precompiled OSC message shape.
+
+    The types ``int`` and ``float`` act as slots to be filled in at render time, and
+    lists act as OSC arrays. Every other argument is a constant. The address, type
+    tags and constants are encoded once, so rendering only packs the slot values.
+
+    ::
+
+        >>> from supriya.osc import OscMessage, OscTemplate
+        >>> template = OscTemplate("/n_set", int, "frequency", float, "pan", [float, 0.5])
+        >>> template
+        OscTemplate('/n_set', int, 'frequency', float, 'pan', [float, 0.5])
+
+    ::
+
+        >>> osc_message = template.render(1000, 443.0, 0.25)
+        >>> osc_message
+        OscMessage('/n_set', 1000, 'frequency', 443.0, 'pan', [0.25, 0.5])
+
+    ::
+
+        >>> osc_message.to_datagram() == OscMessage(
+        ...     "/n_set", 1000, "frequency", 443.0, "pan", [0.25, 0.5]
+        ... ).to_datagram()
+        True
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(self, address, *arguments) -> None:
+        if isinstance(address, enum.Enum):
+            address = address.value
+        if not isinstance(address, (str, int)):
+            raise ValueError(f"address must be int or str, got {address}")
+        self.address = address
+        self.arguments = tuple(arguments)
+        self._contents: List[Any] = []
+        self._converters: List[Callable] = []
+        self._struct_arguments: List[Any] = []
+        self._struct_indices: List[int] = []
+        format_: List[str] = []
+        type_tags = "," + self._compile(self.arguments, self._contents, format_)
+        if isinstance(address, str):
+            encoded_address = OscMessage._encode_string(address)
+        else:
+            encoded_address = struct.pack(">i", address)
+        encoded_type_tags = OscMessage._encode_string(type_tags)
+        self._struct_arguments[:0] = [encoded_address, encoded_type_tags]
+        self._struct_indices = [index + 2 for index in self._struct_indices]
+        self._struct = struct.Struct(
+            ">{}s{}s{}".format(
+                len(encoded_address), len(encoded_type_tags), "".join(format_)
+            )
+        )
+
+    ### SPECIAL METHODS ###
+
+    def __repr__(self) -> str:
+        return "{}({})".format(
+            type(self).__name__,
+            ", ".join(
+                self._format_argument(_) for _ in [self.address, *self.arguments]
+            ),
+        )
+
+    ### PRIVATE METHODS ###
+
+    def _compile(self, arguments, contents, format_) -> str:
+        type_tags = ""
+        for argument in arguments:
+            if argument is int or argument is float:
+                type_tags += "i" if argument is int else "f"
+                format_.append(type_tags[-1])
+                self._converters.append(argument)
+                self._struct_indices.append(len(self._struct_arguments))
+                self._struct_arguments.append(None)
+                contents.append(argument)
+            elif isinstance(argument, (list, tuple)):
+                sub_contents: List[Any] = []
+                type_tags += "[" + self._compile(argument, sub_contents, format_) + "]"
+                contents.append(sub_contents)
+            else:
+                sub_type_tags, encoded_value = OscMessage._encode_value(argument)
+                type_tags += sub_type_tags
+                if encoded_value:
+                    format_.append(f"{len(encoded_value)}s")
+                    self._struct_arguments.append(encoded_value)
+                contents.append(argument)
+        return type_tags
+
+    @classmethod
+    def _fill(cls, contents, values):
+        return [
+            next(values)
+            if x is int or x is float
+            else cls._fill(x, values)
+            if isinstance(x, list)
+            else x
+            for x in contents
+        ]
+
+    @classmethod
+    def _format_argument(cls, argument) -> str:
+        if argument is int or argument is float:
+            return argument.__name__
+        elif isinstance(argument, (list, tuple)):
+            return "[{}]".format(", ".join(cls._format_argument(_) for _ in argument))
+        return repr(argument)
+
+    ### PUBLIC METHODS ###
+
+    def render(self, *values) -> OscMessage:
+        """
+        Render an OSC message, filling this template's slots with ``values``.
+        """
+        if len(values) != len(self._converters):
+            raise ValueError(
+                f"expected {len(self._converters)} values, got {len(values)}"
+            )
+        values = tuple(
+            converter(value) for converter, value in zip(self._converters, values)
+        )
+        struct_arguments = self._struct_arguments.copy()
+        for index, value in zip(self._struct_indices, values):
+            struct_arguments[index] = value
+        osc_message = OscMessage(
+            self.address, *self._fill(self._contents, iter(values))
+        )
+        osc_message._datagram = self._struct.pack(*struct_arguments)
+        return osc_message
+
+
 class OscProtocolOffline(Exception):
     pass
 
@@ -519,11 +813,135 @@ class OscProtocolAlreadyConnected(Exception):
     pass
 
 
-class OscCallback(NamedTuple):
+@dataclasses.dataclass(eq=False)
+class OscCallback:
+    """
+    A registered OSC callback.
+
+    Callbacks compare and hash by identity, and double as handles for
+    unregistration: each remembers the trie nodes it is attached to.
+
+    Batched callbacks' procedures are called with a list of messages: every
+    consecutive match among those received together, in one datagram, bundle
+    or stream read, rather than once per message.
+    """
+
     pattern: Tuple[Union[str, int, float], ...]
     procedure: Callable
     failure_pattern: Optional[Tuple[Union[str, int, float], ...]] = None
     once: bool = False
+    batched: bool = False
+    nodes: List["OscCallbackNode"] = dataclasses.field(
+        default_factory=list, init=False, repr=False
+    )
+
+
+class OscCallbackNode:
+    """
+    A node in an :py:class:`OscCallbackTrie`.
+    """
+
+    __slots__ = ("callbacks", "children", "key", "parent")
+
+    def __init__(self, key=None, parent: Optional["OscCallbackNode"] = None) -> None:
+        # A dict, rather than a set, keeps dispatch in registration order.
+        self.callbacks: Dict[OscCallback, None] = {}
+        self.children: Dict[Any, OscCallbackNode] = {}
+        self.key = key
+        self.parent = parent
+
+
+class OscCallbackTrie:
+    """
+    Callbacks keyed by address and leading arguments.
+
+    A message matches every callback whose pattern is a prefix of its address
+    followed by its arguments. Addresses are interned, and the encoded form of
+    every registered address is tracked so that datagrams nobody listens for
+    can be rejected without decoding them.
+
+    ::
+
+        >>> from supriya.osc import OscCallback, OscCallbackTrie, OscMessage
+        >>> trie = OscCallbackTrie()
+        >>> callback_a = OscCallback(pattern=("/n_go",), procedure=print)
+        >>> callback_b = OscCallback(pattern=("/n_go", 1000), procedure=print)
+        >>> trie.add(callback_a)
+        >>> trie.add(callback_b)
+        >>> trie.match(OscMessage("/n_go", 1000, 1)) == [callback_a, callback_b]
+        True
+        >>> trie.match(OscMessage("/n_go", 1001, 1)) == [callback_a]
+        True
+        >>> trie.remove(callback_a)
+        >>> trie.match(OscMessage("/n_go", 1001, 1))
+        []
+        >>> trie.accepts(OscMessage("/n_end", 1000).to_datagram())
+        False
+
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(self) -> None:
+        self.addresses: Set[bytes] = set()
+        self.root = OscCallbackNode()
+
+    ### PUBLIC METHODS ###
+
+    def accepts(self, datagram: bytes) -> bool:
+        """
+        Check whether a datagram could match any callback, without decoding it.
+        """
+        if datagram[:1] != b"/":
+            return True  # bundles, or messages addressed by command number
+        return datagram[: datagram.find(b"\x00")] in self.addresses
+
+    def add(self, callback: OscCallback) -> None:
+        patterns = [callback.pattern]
+        if callback.failure_pattern:
+            patterns.append(callback.failure_pattern)
+        for pattern in patterns:
+            node = self.root
+            for item in pattern:
+                if isinstance(item, str):
+                    item = sys.intern(item)
+                if (child := node.children.get(item)) is None:
+                    child = node.children[item] = OscCallbackNode(item, node)
+                    if node is self.root and isinstance(item, str):
+                        self.addresses.add(item.encode())
+                node = child
+            node.callbacks[callback] = None
+            callback.nodes.append(node)
+
+    def match(self, message: "OscMessage") -> List[OscCallback]:
+        node = self.root.children.get(message.address)
+        if node is None:
+            return []
+        matching_callbacks = list(node.callbacks)
+        if not node.children:
+            # Spare lazy messages from decoding their arguments.
+            return matching_callbacks
+        for item in message.contents:
+            try:
+                node = node.children.get(item)
+            except TypeError:  # unhashable, e.g. arrays
+                break
+            if node is None:
+                break
+            matching_callbacks.extend(node.callbacks)
+        return matching_callbacks
+
+    def remove(self, callback: OscCallback) -> None:
+        for node in callback.nodes:
+            node.callbacks.pop(callback, None)
+            while not node.callbacks and not node.children and node.parent is not None:
+                parent = node.parent
+                if parent.children.get(node.key) is node:
+                    del parent.children[node.key]
+                    if parent is self.root and isinstance(node.key, str):
+                        self.addresses.discard(node.key.encode())
+                node = parent
+        callback.nodes.clear()
 
 
 @dataclasses.dataclass
@@ -541,7 +959,7 @@ class OscProtocol(metaclass=abc.ABCMeta):
     ### INITIALIZER ###
 
     def __init__(self) -> None:
-        self.callbacks: Dict[Any, Any] = {}
+        self.callbacks = OscCallbackTrie()
         self.captures: Set[Capture] = set()
         self.healthcheck = None
         self.healthcheck_osc_callback = None
@@ -553,50 +971,42 @@ class OscProtocol(metaclass=abc.ABCMeta):
     ### PRIVATE METHODS ###
 
     def _add_callback(self, callback: OscCallback):
-        patterns = [callback.pattern]
-        if callback.failure_pattern:
-            patterns.append(callback.failure_pattern)
-        for pattern in patterns:
-            callback_map = self.callbacks
-            for item in pattern:
-                callbacks, callback_map = callback_map.setdefault(item, ([], {}))
-            callbacks.append(callback)
+        self.callbacks.add(callback)
 
     def _disconnect(self) -> None:
         raise NotImplementedError
 
     def _match_callbacks(self, message):
-        items = (message.address,) + message.contents
-        matching_callbacks = []
-        callback_map = self.callbacks
-        for item in items:
-            if item not in callback_map:
-                break
-            callbacks, callback_map = callback_map[item]
-            matching_callbacks.extend(callbacks)
+        matching_callbacks = self.callbacks.match(message)
         for callback in matching_callbacks:
             if callback.once:
-                self.unregister(callback)
+                # Matching only happens where callbacks are (un)registered,
+                # so one-shots can be dropped immediately.
+                self._remove_callback(callback)
         return matching_callbacks
 
-    def _remove_callback(self, callback: OscCallback):
-        def delete(pattern, original_callback_map):
-            key = pattern.pop(0)
-            if key not in original_callback_map:
-                return
-            callbacks, callback_map = original_callback_map[key]
-            if pattern:
-                delete(pattern, callback_map)
-            if callback in callbacks:
-                callbacks.remove(callback)
-            if not callbacks and not callback_map:
-                original_callback_map.pop(key)
+    def _receive(self, datagrams: Iterable[bytes]) -> List[Tuple[Callable, Any]]:
+        """
+        Match datagrams received together to the procedures to call, in order.
 
-        patterns = [callback.pattern]
-        if callback.failure_pattern:
-            patterns.append(callback.failure_pattern)
-        for pattern in patterns:
-            delete(list(pattern), self.callbacks)
+        Consecutive matches for the same batched callback are merged into a
+        single call.
+        """
+        calls: List[Tuple[Callable, Any]] = []
+        previous_callback: Optional[OscCallback] = None
+        for datagram in datagrams:
+            for callback, message in self._validate_receive(datagram):
+                if not callback.batched:
+                    calls.append((callback.procedure, message))
+                elif callback is previous_callback:
+                    calls[-1][1].append(message)
+                else:
+                    calls.append((callback.procedure, [message]))
+                previous_callback = callback
+        return calls
+
+    def _remove_callback(self, callback: OscCallback):
+        self.callbacks.remove(callback)
 
     def _pass_healthcheck(self, message):
         osc_protocol_logger.info(f"[{self.ip_address}:{self.port}] healthcheck: passed")
@@ -619,7 +1029,7 @@ class OscProtocol(metaclass=abc.ABCMeta):
             self.unregister(self.healthcheck_osc_callback)
 
     def _validate_callback(
-        self, pattern, procedure, *, failure_pattern=None, once=False
+        self, pattern, procedure, *, failure_pattern=None, once=False, batched=False
     ):
         if isinstance(pattern, (str, int, float)):
             pattern = [pattern]
@@ -632,21 +1042,40 @@ class OscProtocol(metaclass=abc.ABCMeta):
             failure_pattern=failure_pattern,
             procedure=procedure,
             once=bool(once),
+            batched=bool(batched),
         )
 
     def _validate_receive(self, datagram):
-        udp_in_logger.debug(f"[{self.ip_address}:{self.port}] {datagram}")
-        try:
-            message = OscMessage.from_datagram(datagram)
-        except Exception:
-            raise
-        osc_in_logger.debug(f"[{self.ip_address}:{self.port}] {message!r}")
+        if udp_in_logger.isEnabledFor(logging.DEBUG):
+            udp_in_logger.debug(f"[{self.ip_address}:{self.port}] {datagram}")
+        is_logging = osc_in_logger.isEnabledFor(logging.DEBUG)
+        if (
+            not self.captures
+            and not is_logging
+            and not tracing.enabled
+            and not self.callbacks.accepts(datagram)
+        ):
+            return
+        if datagram.startswith(BUNDLE_PREFIX):
+            message = OscBundle.from_datagram(datagram)
+        else:
+            # Arguments are only decoded once something reads them.
+            message = LazyOscMessage(datagram)
+        if is_logging:
+            osc_in_logger.debug(f"[{self.ip_address}:{self.port}] {message!r}")
+        if tracing.enabled:
+            tracing.record("receive", f"{self.ip_address}:{self.port}", message=message)
         for capture in self.captures:
             capture.messages.append(
                 CaptureEntry(timestamp=time.time(), label="R", message=message)
             )
-        for callback in self._match_callbacks(message):
-            yield callback.procedure, message
+        stack = [message]
+        while stack:
+            if isinstance(message := stack.pop(), OscBundle):
+                stack.extend(reversed(message.contents))
+                continue
+            for callback in self._match_callbacks(message):
+                yield callback, message
 
     def _validate_send(self, message):
         if not self.is_running:
@@ -657,13 +1086,17 @@ class OscProtocol(metaclass=abc.ABCMeta):
             message = OscMessage(message)
         elif isinstance(message, SequenceABC):
             message = OscMessage(*message)
-        osc_out_logger.debug(f"[{self.ip_address}:{self.port}] {message!r}")
+        if osc_out_logger.isEnabledFor(logging.DEBUG):
+            osc_out_logger.debug(f"[{self.ip_address}:{self.port}] {message!r}")
+        if tracing.enabled:
+            tracing.record("send", f"{self.ip_address}:{self.port}", message=message)
         for capture in self.captures:
             capture.messages.append(
                 CaptureEntry(timestamp=time.time(), label="S", message=message)
             )
         datagram = message.to_datagram()
-        udp_out_logger.debug(f"[{self.ip_address}:{self.port}] {datagram}")
+        if udp_out_logger.isEnabledFor(logging.DEBUG):
+            udp_out_logger.debug(f"[{self.ip_address}:{self.port}] {datagram}")
         return datagram
 
     ### PUBLIC METHODS ###
@@ -684,10 +1117,11 @@ class OscProtocol(metaclass=abc.ABCMeta):
     def register(
         self,
         pattern: Sequence[Union[str, float]],
-        procedure: Callable[[OscMessage], None],
+        procedure: Callable[[Any], None],
         *,
         failure_pattern: Optional[Sequence[Union[str, float]]] = None,
         once: bool = False,
+        batched: bool = False,
     ) -> OscCallback:
         raise NotImplementedError
 
@@ -700,6 +1134,61 @@ class OscProtocol(metaclass=abc.ABCMeta):
         raise NotImplementedError
 
 
+class OscStreamBuffer:
+    """
+    Reassembles length-prefixed OSC packets from a TCP byte stream.
+
+    ::
+
+        >>> from supriya.osc import OscMessage, OscStreamBuffer
+        >>> datagram = OscMessage("/status").to_datagram()
+        >>> stream = OscStreamBuffer.frame(datagram) * 2
+        >>> buffer_ = OscStreamBuffer()
+        >>> buffer_.feed(stream[:5])
+        []
+        >>> buffer_.feed(stream[5:])
+        [b'/status\\x00,\\x00\\x00\\x00', b'/status\\x00,\\x00\\x00\\x00']
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    _header = struct.Struct(">I")
+
+    ### INITIALIZER ###
+
+    def __init__(self) -> None:
+        self.buffer = bytearray()
+
+    ### PUBLIC METHODS ###
+
+    def clear(self) -> None:
+        self.buffer.clear()
+
+    def feed(self, data: bytes) -> List[bytes]:
+        buffer_ = self.buffer
+        buffer_ += data
+        datagrams = []
+        offset, size = 0, len(buffer_)
+        while size - offset >= 4:
+            (length,) = self._header.unpack_from(buffer_, offset)
+            if size - offset - 4 < length:
+                break
+            datagrams.append(bytes(buffer_[offset + 4 : offset + 4 + length]))
+            offset += 4 + length
+        if offset:
+            del buffer_[:offset]
+        return datagrams
+
+    @classmethod
+    def frame(cls, datagram: bytes) -> bytes:
+        return cls._header.pack(len(datagram)) + datagram
+
+    @classmethod
+    def header(cls, datagram: bytes) -> bytes:
+        return cls._header.pack(len(datagram))
+
+
 class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
     ### INITIALIZER ###
 
@@ -722,13 +1211,24 @@ class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
         if self.healthcheck_task:
             self.healthcheck_task.cancel()
 
+    def _dispatch(self, datagrams: Iterable[bytes]) -> None:
+        loop = asyncio.get_running_loop()
+        for procedure, message in self._receive(datagrams):
+            if inspect.iscoroutinefunction(procedure):
+                task = loop.create_task(procedure(message))
+                self.background_tasks.add(task)
+                task.add_done_callback(self.background_tasks.discard)
+            else:
+                procedure(message)
+
     async def _run_healthcheck(self):
         while self.is_running:
             if self.attempts >= self.healthcheck.max_attempts:
                 osc_protocol_logger.info(
                     f"[{self.ip_address}:{self.port}] health check: failure limit exceeded"
                 )
-                self.exit_future.set_result(True)
+                if not self.exit_future.done():
+                    self.exit_future.set_result(True)
                 self._teardown()
                 self.transport.close()
                 obj_ = self.healthcheck.callback()
@@ -787,14 +1287,7 @@ class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
         self.exit_future.set_result(True)
 
     def datagram_received(self, data, addr):
-        loop = asyncio.get_running_loop()
-        for callback, message in self._validate_receive(data):
-            if inspect.iscoroutinefunction(callback):
-                task = loop.create_task(callback(message))
-                self.background_tasks.add(task)
-                task.add_done_callback(self.background_tasks.discard)
-            else:
-                callback(message)
+        self._dispatch((data,))
 
     def error_received(self, exc):
         osc_out_logger.warning(f"[{self.ip_address}:{self.port}] errored: {exc}")
@@ -802,24 +1295,30 @@ class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
     def register(
         self,
         pattern: Sequence[Union[str, float]],
-        procedure: Callable[[OscMessage], None],
+        procedure: Callable[[Any], None],
         *,
         failure_pattern: Optional[Sequence[Union[str, float]]] = None,
         once: bool = False,
+        batched: bool = False,
     ) -> OscCallback:
         osc_protocol_logger.info(
             f"[{self.ip_address}:{self.port}] registering pattern: {pattern!r}"
         )
         callback = self._validate_callback(
-            pattern, procedure, failure_pattern=failure_pattern, once=once
+            pattern,
+            procedure,
+            failure_pattern=failure_pattern,
+            once=once,
+            batched=batched,
         )
         self._add_callback(callback)
         return callback
 
     def send(self, message):
-        osc_protocol_logger.debug(
-            f"[{self.ip_address}:{self.port}] sending: {message!r}"
-        )
+        if osc_protocol_logger.isEnabledFor(logging.DEBUG):
+            osc_protocol_logger.debug(
+                f"[{self.ip_address}:{self.port}] sending: {message!r}"
+            )
         datagram = self._validate_send(message)
         return self.transport.sendto(datagram)
 
@@ -827,9 +1326,66 @@ class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
         self._remove_callback(callback)
 
 
+class AsyncTcpOscProtocol(AsyncOscProtocol):
+    """
+    An asyncio OSC protocol speaking length-prefixed OSC over TCP.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(self) -> None:
+        AsyncOscProtocol.__init__(self)
+        self.stream_buffer = OscStreamBuffer()
+
+    ### PUBLIC METHODS ###
+
+    async def connect(
+        self, ip_address: str, port: int, *, healthcheck: Optional[HealthCheck] = None
+    ):
+        osc_protocol_logger.info(f"[{self.ip_address}:{self.port}] connecting...")
+        if self.is_running:
+            osc_protocol_logger.info(
+                f"[{self.ip_address}:{self.port}] already connected!"
+            )
+            raise OscProtocolAlreadyConnected
+        self._setup(ip_address, port, healthcheck)
+        self.stream_buffer.clear()
+        loop = asyncio.get_running_loop()
+        self.exit_future = loop.create_future()
+        await loop.create_connection(lambda: self, ip_address, port)
+        if self.healthcheck and self.healthcheck.active:
+            self.healthcheck_task = asyncio.get_running_loop().create_task(
+                self._run_healthcheck()
+            )
+        osc_protocol_logger.info(f"[{self.ip_address}:{self.port}] ...connected")
+
+    def connection_lost(self, exc):
+        osc_protocol_logger.info(f"[{self.ip_address}:{self.port}] connection lost")
+        if not self.exit_future.done():
+            self.exit_future.set_result(True)
+
+    def data_received(self, data):
+        self._dispatch(self.stream_buffer.feed(data))
+
+    def eof_received(self):
+        osc_protocol_logger.info(f"[{self.ip_address}:{self.port}] eof received")
+
+    def send(self, message):
+        if osc_protocol_logger.isEnabledFor(logging.DEBUG):
+            osc_protocol_logger.debug(
+                f"[{self.ip_address}:{self.port}] sending: {message!r}"
+            )
+        datagram = self._validate_send(message)
+        # Header and payload leave in a single write, without concatenating.
+        return self.transport.writelines((OscStreamBuffer.header(datagram), datagram))
+
+
 class ThreadedOscServer(socketserver.UDPServer):
     osc_protocol: "ThreadedOscProtocol"
 
+    # Receive whole datagrams, e.g. large /b_setn replies, rather than 8 KiB.
+    max_packet_size = 65536
+
     def verify_request(self, request, client_address):
         self.osc_protocol._process_command_queue()
         return True
@@ -842,7 +1398,7 @@ class ThreadedOscServer(socketserver.UDPServer):
 class ThreadedOscHandler(socketserver.BaseRequestHandler):
     def handle(self):
         data = self.request[0]
-        for procedure, message in self.server.osc_protocol._validate_receive(data):
+        for procedure, message in self.server.osc_protocol._receive((data,)):
             procedure(message)
 
 
@@ -907,10 +1463,13 @@ class ThreadedOscProtocol(OscProtocol):
         osc_protocol_logger.info(
             f"[{self.ip_address}:{self.port}] healthcheck: failure limit exceeded"
         )
-        self.osc_server._BaseServer__shutdown_request = True
+        self._stop_serving()
         self.disconnect()
         self.healthcheck.callback()
 
+    def _stop_serving(self):
+        self.osc_server._BaseServer__shutdown_request = True
+
     def _server_factory(self, ip_address, port):
         server = ThreadedOscServer(
             (self.ip_address, self.port), ThreadedOscHandler, bind_and_activate=False
@@ -948,16 +1507,21 @@ class ThreadedOscProtocol(OscProtocol):
     def register(
         self,
         pattern: Sequence[Union[str, float]],
-        procedure: Callable[[OscMessage], None],
+        procedure: Callable[[Any], None],
         *,
         failure_pattern: Optional[Sequence[Union[str, float]]] = None,
         once: bool = False,
+        batched: bool = False,
     ) -> OscCallback:
         """
         Register a callback.
         """
         callback = self._validate_callback(
-            pattern, procedure, failure_pattern=failure_pattern, once=once
+            pattern,
+            procedure,
+            failure_pattern=failure_pattern,
+            once=once,
+            batched=batched,
         )
         # Command queue prevents lock contention.
         self.command_queue.put(("add", callback))
@@ -979,6 +1543,117 @@ class ThreadedOscProtocol(OscProtocol):
         self.command_queue.put(("remove", callback))
 
 
+class ThreadedTcpOscProtocol(ThreadedOscProtocol):
+    """
+    A threaded OSC protocol speaking length-prefixed OSC over TCP.
+
+    Incoming data is read in large chunks and split into packets locally,
+    rather than issuing one receive call per packet.
+    """
+
+    ### CLASS VARIABLES ###
+
+    chunk_size = 65536
+    poll_interval = 0.5
+
+    ### INITIALIZER ###
+
+    def __init__(self):
+        ThreadedOscProtocol.__init__(self)
+        self.send_lock = threading.Lock()
+        self.socket: Optional[socket.socket] = None
+        self.stream_buffer = OscStreamBuffer()
+
+    ### PRIVATE METHODS ###
+
+    def _close_socket(self) -> None:
+        with self.send_lock:
+            sock, self.socket = self.socket, None
+        if sock is None:
+            return
+        try:
+            # Wake up the reader thread if it is blocked in recv().
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        sock.close()
+
+    def _disconnect(self) -> None:
+        with self.lock:
+            if not self.is_running:
+                osc_protocol_logger.info(
+                    f"{self.ip_address}:{self.port} already disconnected!"
+                )
+                return
+            self._teardown()
+            self._close_socket()
+            self.osc_server_thread = None
+
+    def _serve(self, sock: socket.socket) -> None:
+        while self.is_running:
+            if self.healthcheck and self.healthcheck.active:
+                self._run_healthcheck()
+            if self.socket is not sock:
+                # Connection gone, keep servicing the healthcheck until it
+                # gives up or until disconnected.
+                self._process_command_queue()
+                time.sleep(self.poll_interval)
+                continue
+            try:
+                data = sock.recv(self.chunk_size)
+            except socket.timeout:
+                self._process_command_queue()
+                continue
+            except OSError:
+                data = b""
+            self._process_command_queue()
+            if not data:
+                osc_protocol_logger.info(
+                    f"[{self.ip_address}:{self.port}] connection lost"
+                )
+                self._close_socket()
+                continue
+            for procedure, message in self._receive(self.stream_buffer.feed(data)):
+                procedure(message)
+
+    def _stop_serving(self):
+        pass
+
+    ### PUBLIC METHODS ###
+
+    def connect(
+        self, ip_address: str, port: int, *, healthcheck: Optional[HealthCheck] = None
+    ):
+        osc_protocol_logger.info(f"[{self.ip_address}:{self.port}] connecting...")
+        if self.is_running:
+            osc_protocol_logger.info(
+                f"[{self.ip_address}:{self.port}] already connected!"
+            )
+            raise OscProtocolAlreadyConnected
+        self._setup(ip_address, port, healthcheck)
+        self.healthcheck_deadline = time.time()
+        self.stream_buffer.clear()
+        sock = socket.create_connection((ip_address, port))
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.settimeout(self.poll_interval)
+        self.socket = sock
+        self.is_running = True
+        self.osc_server_thread = threading.Thread(target=self._serve, args=(sock,))
+        self.osc_server_thread.daemon = True
+        self.osc_server_thread.start()
+        osc_protocol_logger.info(f"[{self.ip_address}:{self.port}] ...connected")
+
+    def send(self, message) -> None:
+        datagram = self._validate_send(message)
+        with self.send_lock:
+            if self.socket is None:
+                osc_out_logger.warning(
+                    f"[{self.ip_address}:{self.port}] connection lost, dropping packet"
+                )
+                return
+            self.socket.sendall(OscStreamBuffer.frame(datagram))
+
+
 class CaptureEntry(NamedTuple):
     timestamp: float
     label: str
@@ -1089,13 +1764,19 @@ def format_datagram(datagram):
 
 __all__ = [
     "AsyncOscProtocol",
+    "AsyncTcpOscProtocol",
     "Capture",
     "CaptureEntry",
     "HealthCheck",
+    "LazyOscMessage",
     "OscBundle",
     "OscCallback",
+    "OscCallbackTrie",
     "OscMessage",
     "OscProtocol",
+    "OscStreamBuffer",
+    "OscTemplate",
     "ThreadedOscProtocol",
+    "ThreadedTcpOscProtocol",
     "find_free_port",
 ]
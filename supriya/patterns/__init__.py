@@ -1,3 +1,4 @@
+from .compilers import PatternCompiler
 from .eventpatterns import ChainPattern, EventPattern, MonoEventPattern, UpdatePattern
 from .events import (
     BusAllocateEvent,
@@ -45,6 +46,7 @@ __all__ = [
     "NullEvent",
     "ParallelPattern",
     "Pattern",
+    "PatternCompiler",
     "PatternPlayer",
     "Priority",
     "RandomPattern",
@@ -0,0 +1,159 @@
+import heapq
+from typing import Dict, Generator, List, Optional, Tuple, Union
+from uuid import UUID
+
+from ..contexts import ContextObject, Node, Score
+from ..contexts.core import Moment
+from ..conversions import offset_to_seconds
+from .events import Event, Priority
+from .patterns import Pattern
+
+
+class PatternCompiler:
+    """
+    A pattern compiler.
+
+    Compiles a pattern directly into a score, as playing it under an offline
+    clock would, but without the clock: events are expanded and performed in
+    offset order from a plain heap, inside a single moment whose requests are
+    appended to the score's timeline as each offset completes.
+
+    :param pattern: The pattern to compile.
+    :param score: The score to compile into.
+    :param at: The score timestamp, in seconds, to start compiling at.
+    :param beats_per_minute: The tempo to convert event offsets to seconds with.
+    :param target_node: The node to target events at by default.
+    :param until: The offset to stop the pattern at, freeing any sounding notes.
+    """
+
+    def __init__(
+        self,
+        pattern: Pattern,
+        score: Score,
+        *,
+        at: float = 0.0,
+        beats_per_minute: float = 120.0,
+        target_node: Optional[Node] = None,
+        until: Optional[float] = None,
+    ) -> None:
+        if beats_per_minute <= 0:
+            raise ValueError(beats_per_minute)
+        self._pattern = pattern
+        self._score = score
+        self._at = float(at)
+        self._beats_per_minute = float(beats_per_minute)
+        self._target_node = target_node
+        self._until = until
+        self._heap: List[Tuple[float, Priority, Tuple[int, int], Optional[Event]]] = []
+        self._index = -1
+        self._is_stopping = False
+        self._iterator: Optional[Generator[Event, bool, None]] = None
+        self._proxies_by_uuid: Dict[Union[UUID, Tuple[UUID, int]], ContextObject] = {}
+        self._notes_by_uuid: Dict[Union[UUID, Tuple[UUID, int]], float] = {}
+
+    ### PRIVATE METHODS ###
+
+    def _consume_iterator(self, current_offset: float) -> bool:
+        # As PatternPlayer._consume_iterator(), returning True if stopped before
+        # the pattern ever started.
+        if self._iterator is None:
+            if self._is_stopping:
+                return True
+            self._iterator = iter(self._pattern)
+        try:
+            if self._index < 0:
+                event = next(self._iterator)
+            else:
+                event = self._iterator.send(self._is_stopping)
+        except StopIteration:
+            return False
+        self._index += 1
+        for subindex, (expanded_offset, priority, expanded_event) in enumerate(
+            event.expand(current_offset)
+        ):
+            heapq.heappush(
+                self._heap,
+                (expanded_offset, priority, (self._index, subindex), expanded_event),
+            )
+        heapq.heappush(
+            self._heap,
+            (
+                float(current_offset + event.delta),
+                Priority.NONE,
+                (self._index, 0),
+                None,
+            ),
+        )
+        return False
+
+    def _flush(self, moment: Moment, current_offset: float) -> None:
+        # As leaving a per-offset Score.at() moment, without entering one.
+        if not moment.requests:
+            return
+        requests = self._score._apply_completions(moment.requests)
+        moment.requests.clear()
+        if not requests:
+            return
+        timestamp = self._get_seconds(current_offset) + self._score.latency
+        self._score._requests.setdefault(timestamp, []).extend(requests)
+
+    def _get_seconds(self, offset: float) -> float:
+        return offset_to_seconds(
+            beats_per_minute=self._beats_per_minute,
+            current_offset=offset,
+            previous_offset=0.0,
+            previous_seconds=self._at,
+            beat_duration=1 / 4,
+        )
+
+    def _stop(self, moment: Moment, current_offset: float) -> None:
+        # As PatternPlayer._stop_callback(): shift everything pending to start
+        # at the stop offset, and free any sounding notes.
+        self._is_stopping = True
+        delta = self._heap[0][0] - current_offset
+        self._heap = [
+            (offset - delta, priority, index, event)
+            for offset, priority, index, event in self._heap
+        ]
+        heapq.heapify(self._heap)
+        if not self._notes_by_uuid:
+            return
+        while self._notes_by_uuid:
+            uuid, _ = self._notes_by_uuid.popitem()
+            if not isinstance(node := self._proxies_by_uuid.pop(uuid), Node):
+                raise RuntimeError
+            self._score.free_node(node)
+        self._flush(moment, current_offset)
+
+    ### PUBLIC METHODS ###
+
+    def compile(self) -> None:
+        """
+        Compile the pattern into the score.
+        """
+        heapq.heappush(self._heap, (0.0, Priority.NONE, (0, 0), None))
+        until = self._until or None
+        with self._score.at(self._at) as moment:
+            while self._heap:
+                current_offset = self._heap[0][0]
+                if until is not None and current_offset >= until:
+                    self._stop(moment, until)
+                    until = None
+                    continue
+                events: List[Tuple[Event, Priority]] = []
+                while self._heap and self._heap[0][0] == current_offset:
+                    _, priority, _, event = heapq.heappop(self._heap)
+                    if event is not None:
+                        events.append((event, priority))
+                    elif self._consume_iterator(current_offset):
+                        return
+                for event, priority in events:
+                    event.perform(
+                        self._score,
+                        self._proxies_by_uuid,
+                        current_offset=current_offset,
+                        notes_mapping=self._notes_by_uuid,
+                        priority=priority,
+                        target_node=self._target_node,
+                    )
+                self._flush(moment, current_offset)
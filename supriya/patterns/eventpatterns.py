@@ -1,3 +1,4 @@
+import inspect
 from typing import Type
 from uuid import uuid4
 
@@ -16,6 +17,35 @@ class EventPattern(Pattern):
         self._patterns = patterns
         self._event_type = event_type
 
+    def _get_block_draw_counts(self, count):
+        import numpy
+
+        all_draw_counts = []
+        for _, pattern in self._get_block_patterns():
+            draw_counts = pattern._get_block_draw_counts(count)
+            if draw_counts is None:
+                return None
+            all_draw_counts.append(draw_counts)
+        count = min([len(draw_counts) for draw_counts in all_draw_counts] + [count])
+        total_draw_counts = numpy.zeros(count, dtype=int)
+        for draw_counts in all_draw_counts:
+            total_draw_counts += draw_counts[:count]
+        return total_draw_counts
+
+    def _get_block_keys(self):
+        return sorted(set(self._patterns) | {"delta"})
+
+    def _get_block_patterns(self):
+        return [
+            (
+                name,
+                pattern
+                if isinstance(pattern, Pattern)
+                else SequencePattern([pattern], iterations=None),
+            )
+            for name, pattern in sorted(self._patterns.items())
+        ]
+
     def _iterate(self, state=None):
         patterns = self._prepare_patterns()
         iterator_pairs = sorted(patterns.items())
@@ -37,6 +67,20 @@ class EventPattern(Pattern):
             patterns[name] = iter(pattern)
         return patterns
 
+    def _render_block(self, draws, positions):
+        import numpy
+
+        count = len(positions)
+        columns = {}
+        # Each event draws for each key in turn, in key order.
+        for name, pattern in self._get_block_patterns():
+            columns[name] = pattern._render_block(draws, positions)
+            positions = positions + pattern._get_block_draw_counts(count)
+        if "delta" not in columns:
+            delta = inspect.signature(self.event_type).parameters["delta"].default
+            columns["delta"] = numpy.full(count, delta)
+        return columns
+
     @property
     def event_type(self) -> Type[Event]:
         return self._event_type
@@ -1,3 +1,6 @@
+import itertools
+from collections.abc import Sequence
+
 from uqbar.enums import IntEnumeration
 
 from .patterns import Pattern, SequencePattern
@@ -11,6 +14,14 @@ class ChoicePattern(SequencePattern):
             weights = tuple(abs(float(x)) for x in weights)
         self._weights = weights or None
 
+    def _get_block_draw_counts(self, count):
+        import numpy
+
+        # Forbidding repetitions redraws a variable number of times.
+        if self.forbid_repetitions or not self._has_block_scalars():
+            return None
+        return numpy.ones(self._get_block_count(count, 1), dtype=int)
+
     def _iterate(self, state=None):
         should_stop = False
         rng = self._get_rng()
@@ -45,6 +56,21 @@ class ChoicePattern(SequencePattern):
             sum_of_weights += weight
         return index
 
+    def _render_block(self, draws, positions):
+        import numpy
+
+        numbers = draws[positions]
+        if self.weights:
+            # The first index whose cumulative weight reaches the needle, as
+            # found by _find_index_weighted(), summing in the same order.
+            needles = numbers * sum(self.weights)
+            bounds = numpy.array(list(itertools.accumulate(self.weights)))
+            indices = numpy.searchsorted(bounds, needles, side="left")
+            indices = numpy.minimum(indices, len(self.weights) - 1)
+        else:
+            indices = self._get_block_indices(numbers, len(self._sequence))
+        return self._to_block_array(self._sequence)[indices]
+
     @property
     def forbid_repetitions(self):
         return self._forbid_repetitions
@@ -70,6 +96,15 @@ class RandomPattern(Pattern):
         self._minimum = self._freeze_recursive(minimum)
         self._maximum = self._freeze_recursive(maximum)
 
+    def _get_block_draw_counts(self, count):
+        import numpy
+
+        if isinstance(self._minimum, Sequence) or isinstance(self._maximum, Sequence):
+            return None
+        if self._iterations is not None:
+            count = min(count, self._iterations)
+        return numpy.ones(count, dtype=int)
+
     def _iterate(self, state=None):
         def procedure(one, two):
             minimum, maximum = sorted([one, two])
@@ -82,6 +117,10 @@ class RandomPattern(Pattern):
             if (yield expr):
                 return
 
+    def _render_block(self, draws, positions):
+        minimum, maximum = sorted([self._minimum, self._maximum])
+        return (draws[positions] * (maximum - minimum)) + minimum
+
     @property
     def distribution(self):
         return self._distribution
@@ -108,6 +147,18 @@ class ShufflePattern(SequencePattern):
         super().__init__(sequence, iterations=iterations)
         self._forbid_repetitions = bool(forbid_repetitions)
 
+    def _get_block_draw_counts(self, count):
+        import numpy
+
+        # Forbidding repetitions reshuffles a variable number of times.
+        if self.forbid_repetitions or not self._has_block_scalars():
+            return None
+        length = len(self._sequence)
+        draw_counts = numpy.zeros(self._get_block_count(count, length), dtype=int)
+        # Each iteration draws for the whole shuffle before its first value.
+        draw_counts[:: length or 1] = max(length - 1, 0)
+        return draw_counts
+
     def _iterate(self, state=None):
         should_stop = False
         rng = self._get_rng()
@@ -140,6 +191,27 @@ class ShufflePattern(SequencePattern):
             shuffled_indices.append(indices.pop())
         return shuffled_indices
 
+    def _render_block(self, draws, positions):
+        import numpy
+
+        length, count = len(self._sequence), len(positions)
+        if not count:
+            return self._to_block_array(self._sequence)[:0]
+        # Shuffle every iteration at once, popping from each row in step, as
+        # _shuffle() does.
+        starts = positions[::length]
+        rows = numpy.arange(len(starts))
+        remaining = numpy.tile(numpy.arange(length), (len(starts), 1))
+        shuffled_indices = numpy.empty_like(remaining)
+        for i in range(length - 1):
+            indices = self._get_block_indices(draws[starts + i], length - i)
+            shuffled_indices[:, i] = remaining[rows, indices]
+            mask = numpy.ones(remaining.shape, dtype=bool)
+            mask[rows, indices] = False
+            remaining = remaining[mask].reshape(len(starts), length - i - 1)
+        shuffled_indices[:, -1] = remaining[:, 0]
+        return self._to_block_array(self._sequence)[shuffled_indices.ravel()[:count]]
+
     @property
     def forbid_repetitions(self):
         return self._forbid_repetitions
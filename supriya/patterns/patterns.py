@@ -7,7 +7,18 @@ import itertools
 import operator
 import random
 from collections.abc import Sequence
-from typing import Callable, Coroutine, Dict, Generator, Iterator, Optional
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Coroutine,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Optional,
+    Union,
+    cast,
+)
 from uuid import UUID
 
 from uqbar.objects import get_vars
@@ -18,12 +29,19 @@ from supriya.contexts import Context, Node, Score
 
 from .events import CompositeEvent, Event, Priority
 
+if TYPE_CHECKING:
+    import numpy
+
 
 class Pattern(metaclass=abc.ABCMeta):
     ### CLASSMETHODS ###
 
     _rngs: Dict[int, Iterator[float]] = {}
 
+    #: The number of events first rendered by ``to_arrays()`` when not given a
+    #: count, doubled until enough have been rendered.
+    _initial_block_size = 1024
+
     ### SPECIAL METHODS ###
 
     def __abs__(self):
@@ -147,6 +165,28 @@ class Pattern(metaclass=abc.ABCMeta):
             return tuple(self._freeze_recursive(_) for _ in value)
         return value
 
+    def _get_block_draw_counts(self, count: int) -> Optional["numpy.ndarray"]:
+        """
+        Get the number of RNG draws made before each of this pattern's first
+        ``count`` values, or None if the pattern can't be rendered in blocks.
+
+        The array's length is the number of values the pattern yields, up to
+        ``count``.
+
+        Patterns returning an array also implement ``_render_block(draws,
+        positions)``, rendering their first ``len(positions)`` values, the ith
+        using RNG draws from ``draws[positions[i]]`` onward, and raising
+        ArithmeticError wherever numpy's arithmetic would diverge from Python's.
+        """
+        return None
+
+    def _get_block_keys(self) -> Optional[List[str]]:
+        """
+        Get the column names of a block-rendered event pattern, or None if the
+        pattern isn't an event pattern.
+        """
+        return None
+
     def _get_rng(self):
         identifier = None
         try:
@@ -166,6 +206,33 @@ class Pattern(metaclass=abc.ABCMeta):
             return self._rngs[identifier]
         return self._get_stdlib_rng()
 
+    def _get_seeded_block(self, seed: int, count: int) -> "numpy.ndarray":
+        """
+        Get the first ``count`` values of ``_get_seeded_rng(seed)`` as an array.
+        """
+        import numpy
+
+        modulus = 0x80000000
+        # Each step maps x to (a * x + c) % modulus; track the a and c of the
+        # composed maps for 1, 2, 3... steps, doubling the count each pass.
+        multipliers = numpy.array([1_103_515_245], dtype=numpy.uint64)
+        increments = numpy.array([12345], dtype=numpy.uint64)
+        while len(multipliers) < count:
+            multiplier, increment = multipliers[-1], increments[-1]
+            multipliers = numpy.concatenate(
+                [multipliers, (multipliers * multiplier) % modulus]
+            )
+            increments = numpy.concatenate(
+                [
+                    increments,
+                    (multipliers[: len(increments)] * increment + increments) % modulus,
+                ]
+            )
+        seeds = (
+            multipliers[:count] * numpy.uint64(seed % modulus) + increments[:count]
+        ) % modulus
+        return seeds.astype(numpy.float64) / 0x7FFFFFFF
+
     def _get_seeded_rng(self, seed: int = 1) -> Iterator[float]:
         while True:
             seed = (seed * 1_103_515_245 + 12345) & 0x7FFFFFFF
@@ -187,12 +254,52 @@ class Pattern(metaclass=abc.ABCMeta):
             for _ in range(iterations):
                 yield True
 
+    def _render_block_by_draws(self, draw_counts):
+        import numpy
+
+        positions = numpy.cumsum(draw_counts) - draw_counts
+        draws = numpy.array([random.random() for _ in range(int(draw_counts.sum()))])
+        return self._render_block(draws, positions)
+
+    def _render_block_by_iteration(
+        self, count: int
+    ) -> Union["numpy.ndarray", Dict[str, "numpy.ndarray"]]:
+        items = list(itertools.islice(self, count))
+        keys = self._get_block_keys()
+        if keys is None:
+            return self._to_block_array(items)
+        columns = {}
+        for key in keys:
+            values = []
+            for event in items:
+                event_vars = vars(event)
+                values.append(
+                    event_vars[key] if key in event_vars else event_vars["kwargs"][key]
+                )
+            columns[key] = self._to_block_array(values)
+        return columns
+
     def _setup_state(self) -> Optional[Dict]:
         return None
 
     def _setup_peripherals(self, state):
         return None, None
 
+    @staticmethod
+    def _to_block_array(values: Sequence) -> "numpy.ndarray":
+        import numpy
+
+        if all(
+            type(value) in (bool, float)
+            or (type(value) is int and -(2**63) <= value < 2**63)
+            for value in values
+        ):
+            return numpy.array(values)
+        array = numpy.empty(len(values), dtype=object)
+        for i, value in enumerate(values):
+            array[i] = value
+        return array
+
     ### PUBLIC METHODS ###
 
     def play(
@@ -231,6 +338,155 @@ class Pattern(metaclass=abc.ABCMeta):
         player.play(quantization=quantization, at=at, until=until)
         return player
 
+    def render_block(
+        self, count: int
+    ) -> Union["numpy.ndarray", Dict[str, "numpy.ndarray"]]:
+        """
+        Render the pattern's first ``count`` values into a numpy array.
+
+        Event patterns render into a dictionary of arrays, one per key, plus
+        ``delta``.
+
+        Sequences, random choices, shuffles, random numbers and arithmetic on
+        them are evaluated in bulk. Other patterns are iterated. Either way,
+        the values, including those drawn from seeded or unseeded random number
+        generators, are identical to iterating the pattern.
+
+        ::
+
+            >>> import supriya.patterns
+            >>> pattern = supriya.patterns.SeedPattern(
+            ...     supriya.patterns.ChoicePattern([1, 2, 3], iterations=None) * 10
+            ... )
+            >>> pattern.render_block(8)
+            array([10, 20, 30, 20, 30, 30, 30, 20])
+            >>> list(itertools.islice(pattern, 8))
+            [10, 20, 30, 20, 30, 30, 30, 20]
+        """
+        count = int(count)
+        if count < 0:
+            raise ValueError(count)
+        draw_counts = self._get_block_draw_counts(count)
+        if draw_counts is None:
+            return self._render_block_by_iteration(count)
+        random_state = random.getstate()
+        try:
+            return self._render_block_by_draws(draw_counts)
+        except ArithmeticError:
+            # Overflow or division by zero: redraw and let Python decide.
+            random.setstate(random_state)
+            return self._render_block_by_iteration(count)
+
+    def to_arrays(
+        self, count: Optional[int] = None, until: Optional[float] = None
+    ) -> Dict[str, "numpy.ndarray"]:
+        """
+        Render an event pattern into a dictionary of numpy arrays.
+
+        The dictionary holds one array per key, plus ``delta`` and each event's
+        ``offset`` in beats.
+
+        Rendering stops after ``count`` events, before the first event at or
+        after offset ``until``, or when the pattern stops, whichever is first.
+
+        ::
+
+            >>> import supriya.patterns
+            >>> pattern = supriya.patterns.EventPattern(
+            ...     delta=supriya.patterns.SequencePattern([0.25, 0.5], None),
+            ...     frequency=supriya.patterns.SequencePattern([440, 550, 660]),
+            ... )
+            >>> arrays = pattern.to_arrays(until=0.75)
+            >>> for key, array in sorted(arrays.items()):
+            ...     print(key, array)
+            ...
+            delta [0.25 0.5 ]
+            frequency [440 550]
+            offset [0.   0.25]
+        """
+        import numpy
+
+        if self._get_block_keys() is None:
+            raise ValueError(f"Not an event pattern: {self!r}")
+        if count is None and until is None and self.is_infinite:
+            raise ValueError("Infinite patterns require a count or until")
+        block_size = self._initial_block_size if count is None else int(count)
+        if until is not None and count is not None:
+            block_size = min(block_size, self._initial_block_size)
+        # Re-render from the start with each larger block, so any unseeded
+        # random numbers must be redrawn identically.
+        random_state = random.getstate()
+        while True:
+            random.setstate(random_state)
+            columns = cast(Dict[str, "numpy.ndarray"], self.render_block(block_size))
+            deltas = columns["delta"]
+            offsets = numpy.concatenate(
+                [numpy.zeros(min(len(deltas), 1)), numpy.cumsum(deltas[:-1])]
+            )
+            if until is not None and len(offsets) and offsets[-1] >= until:
+                break
+            if len(deltas) < block_size or block_size == count:
+                break
+            block_size *= 2
+            if count is not None:
+                block_size = min(block_size, count)
+        stop = len(offsets)
+        if until is not None:
+            stop = int(numpy.searchsorted(offsets, until, side="left"))
+        columns = {key: array[:stop] for key, array in columns.items()}
+        columns["offset"] = offsets[:stop]
+        return columns
+
+    def to_score(
+        self,
+        score: Score,
+        *,
+        at: float = 0.0,
+        beats_per_minute: float = 120.0,
+        target_node: Optional[Node] = None,
+        until: Optional[float] = None,
+    ) -> Score:
+        """
+        Compile the pattern into ``score``.
+
+        Equivalent to playing the pattern into the score under an offline clock,
+        but without the clock's scheduling overhead.
+
+        ::
+
+            >>> import supriya.patterns
+            >>> from supriya.contexts import Score
+            >>> pattern = supriya.patterns.EventPattern(
+            ...     frequency=supriya.patterns.SequencePattern([330, 550]),
+            ...     delta=0.25,
+            ... )
+            >>> for bundle in pattern.to_score(Score()).iterate_osc_bundles():
+            ...     print(bundle.timestamp, bundle.contents)
+            ...
+            0.0 (OscMessage('/s_new', 'default', 1000, 0, 0, 'frequency', 330.0),)
+            0.5 (OscMessage('/s_new', 'default', 1001, 0, 0, 'frequency', 550.0),)
+            2.0 (OscMessage('/n_set', 1000, 'gate', 0.0),)
+            2.5 (OscMessage('/n_set', 1001, 'gate', 0.0),)
+
+        :param score: The score to compile into.
+        :param at: The score timestamp, in seconds, to start compiling at.
+        :param beats_per_minute: The tempo to convert event offsets to seconds with.
+        :param target_node: The node to target events at by default.
+        :param until: The offset to stop the pattern at, freeing any sounding
+            notes.
+        """
+        from .compilers import PatternCompiler  # Avoid circular import
+
+        PatternCompiler(
+            self,
+            score,
+            at=at,
+            beats_per_minute=beats_per_minute,
+            target_node=target_node,
+            until=until,
+        ).compile()
+        return score
+
     ### PUBLIC PROPERTIES ###
 
     @abc.abstractproperty
@@ -248,6 +504,21 @@ class BinaryOpPattern(Pattern):
 
     ### PRIVATE METHODS ###
 
+    def _get_block_draw_counts(self, count):
+        pattern_one, pattern_two = self._get_block_patterns()
+        draw_counts_one = pattern_one._get_block_draw_counts(count)
+        draw_counts_two = pattern_two._get_block_draw_counts(count)
+        if draw_counts_one is None or draw_counts_two is None:
+            return None
+        count = min(len(draw_counts_one), len(draw_counts_two))
+        return draw_counts_one[:count] + draw_counts_two[:count]
+
+    def _get_block_patterns(self):
+        return tuple(
+            expr if isinstance(expr, Pattern) else SequencePattern([expr], None)
+            for expr in (self.expr_one, self.expr_two)
+        )
+
     def _iterate(self, state=None):
         expr_one = self.expr_one
         if not isinstance(expr_one, Pattern):
@@ -261,6 +532,41 @@ class BinaryOpPattern(Pattern):
         for item_one, item_two in zip(expr_one, expr_two):
             yield self._apply_recursive(operator, item_one, item_two)
 
+    def _render_block(self, draws, positions):
+        import numpy
+
+        pattern_one, pattern_two = self._get_block_patterns()
+        # Each value draws for the first operand, then the second.
+        values_one = pattern_one._render_block(draws, positions)
+        positions = positions + pattern_one._get_block_draw_counts(len(positions))
+        values_two = pattern_two._render_block(draws, positions)
+        # Python does arithmetic on booleans as integers.
+        if values_one.dtype.kind == "b":
+            values_one = values_one.astype(int)
+        if values_two.dtype.kind == "b":
+            values_two = values_two.astype(int)
+        if (
+            self.operator == "**"
+            and values_one.dtype.kind in "iu"
+            and values_two.dtype.kind in "iu"
+            and (values_two < 0).any()
+        ):
+            # Integers to negative powers are floats in Python, errors in numpy.
+            values_one = values_one.astype(float)
+        operator = self._string_to_operator()
+        with numpy.errstate(all="raise"):
+            values = operator(values_one, values_two)
+            if (
+                values.dtype.kind in "iu"
+                and (
+                    abs(operator(values_one.astype(float), values_two.astype(float)))
+                    >= 2**62
+                ).any()
+            ):
+                # numpy integers wrap silently, Python integers don't.
+                raise OverflowError
+        return values
+
     def _string_to_operator(self):
         operators = {
             "%": operator.__mod__,
@@ -307,6 +613,14 @@ class UnaryOpPattern(Pattern):
 
     ### PRIVATE METHODS ###
 
+    def _get_block_draw_counts(self, count):
+        return self._get_block_pattern()._get_block_draw_counts(count)
+
+    def _get_block_pattern(self):
+        if isinstance(self.expr, Pattern):
+            return self.expr
+        return SequencePattern([self.expr], None)
+
     def _iterate(self, state=None):
         expr = self.expr
         if not isinstance(expr, Pattern):
@@ -316,6 +630,18 @@ class UnaryOpPattern(Pattern):
         for item in expr:
             yield self._apply_recursive(operator, item)
 
+    def _render_block(self, draws, positions):
+        import numpy
+
+        values = self._get_block_pattern()._render_block(draws, positions)
+        # Python does arithmetic on booleans as integers.
+        if values.dtype.kind == "b":
+            values = values.astype(int)
+        if values.dtype.kind == "i" and (values == numpy.iinfo(values.dtype).min).any():
+            # Negating the smallest integer wraps in numpy.
+            raise OverflowError
+        return self._string_to_operator()(values)
+
     def _string_to_operator(self):
         operators = {
             "~": operator.invert,
@@ -351,6 +677,18 @@ class SeedPattern(Pattern):
 
     ### PRIVATE METHODS ###
 
+    def _get_block_draw_counts(self, count):
+        import numpy
+
+        draw_counts = self._pattern._get_block_draw_counts(count)
+        if draw_counts is None:
+            return None
+        # Draws come from this pattern's own RNG, not the enclosing one.
+        return numpy.zeros(len(draw_counts), dtype=int)
+
+    def _get_block_keys(self):
+        return self._pattern._get_block_keys()
+
     def _iterate(self, state=None):
         try:
             identifier = id(inspect.currentframe())
@@ -360,6 +698,15 @@ class SeedPattern(Pattern):
         finally:
             del self._rngs[identifier]
 
+    def _render_block(self, draws, positions):
+        import numpy
+
+        draw_counts = self._pattern._get_block_draw_counts(len(positions))
+        return self._pattern._render_block(
+            self._get_seeded_block(self.seed, int(draw_counts.sum())),
+            numpy.cumsum(draw_counts) - draw_counts,
+        )
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -390,6 +737,32 @@ class SequencePattern(Pattern):
 
     ### PRIVATE METHODS ###
 
+    def _get_block_count(self, count, values_per_iteration):
+        if self._iterations is None:
+            return count
+        return min(count, values_per_iteration * self._iterations)
+
+    def _get_block_draw_counts(self, count):
+        import numpy
+
+        if not self._has_block_scalars():
+            return None
+        count = self._get_block_count(count, len(self._sequence))
+        return numpy.zeros(count, dtype=int)
+
+    @staticmethod
+    def _get_block_indices(numbers, length):
+        # As int(number * 0x7FFFFFFF) % length, for each number.
+        return (numbers * 0x7FFFFFFF).astype(int) % length
+
+    def _has_block_scalars(self):
+        # Nested patterns and multichannel values can't be rendered in blocks.
+        return not any(
+            isinstance(x, Pattern)
+            or (isinstance(x, Sequence) and not isinstance(x, str))
+            for x in self._sequence
+        )
+
     def _iterate(self, state=None):
         should_stop = False
         for _ in self._loop(self._iterations):
@@ -409,6 +782,11 @@ class SequencePattern(Pattern):
                 if should_stop:
                     return
 
+    def _render_block(self, draws, positions):
+        import numpy
+
+        return numpy.resize(self._to_block_array(self._sequence), len(positions))
+
     ### PUBLIC PROPERTIES ###
 
     @property
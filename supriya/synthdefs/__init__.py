@@ -1,8 +1,9 @@
 """
 Tools for constructing and compiling synthesizer definitions (SynthDefs).
 """
-from .builders import SynthDefBuilder, synthdef
-from .compilers import SynthDefCompiler, SynthDefDecompiler
+from .builders import SynthDefBuilder, build_many, synthdef
+from .caches import SynthDefCache
+from .compilers import DecompiledSynthDef, SynthDefCompiler, SynthDefDecompiler
 from .controls import AudioControl, Control, LagControl, Parameter, Range, TrigControl
 from .envelopes import Envelope
 from .factories import SynthDefFactory
@@ -13,6 +14,7 @@ __all__ = [
     "AudioControl",
     "BinaryOpUGen",
     "Control",
+    "DecompiledSynthDef",
     "Envelope",
     "LagControl",
     "MultiOutUGen",
@@ -23,11 +25,13 @@ __all__ = [
     "SuperColliderSynthDef",
     "SynthDef",
     "SynthDefBuilder",
+    "SynthDefCache",
     "SynthDefCompiler",
     "SynthDefDecompiler",
     "SynthDefFactory",
     "SynthDefGrapher",
     "TrigControl",
     "UGenSortBundle",
+    "build_many",
     "synthdef",
 ]
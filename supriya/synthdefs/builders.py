@@ -1,9 +1,11 @@
 import collections
+import concurrent.futures
 import copy
 import inspect
+import os
 import threading
 import uuid
-from typing import Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 from uqbar.objects import new
 
@@ -11,6 +13,7 @@ from supriya.enums import ParameterRate
 from supriya.ugens import Impulse, Poll
 
 from ..ugens import OutputProxy, UGen
+from .caches import SynthDefCache
 from .controls import Control, Parameter
 from .synthdefs import SynthDef
 
@@ -61,12 +64,21 @@ class SynthDefBuilder:
 
     _active_builders: List["SynthDefBuilder"] = _local._active_builders
 
-    __slots__ = ("_name", "_parameters", "_ugens", "_uuid")
+    #: Cache consulted by :py:meth:`build`, or ``None`` to always build afresh.
+    cache: Optional[SynthDefCache] = SynthDefCache()
+
+    __slots__ = ("_name", "_parameters", "_ugens", "_uuid", "_variants")
 
     ### INITIALIZER ###
 
-    def __init__(self, name: Optional[str] = None, **kwargs) -> None:
+    def __init__(
+        self,
+        name: Optional[str] = None,
+        variants: Optional[Dict[str, Dict[str, Union[float, Sequence[float]]]]] = None,
+        **kwargs,
+    ) -> None:
         self._name = name
+        self._variants = variants
         self._uuid = uuid.uuid4()
         self._parameters: Dict[Optional[str], Parameter] = collections.OrderedDict()
         self._ugens: List[Union[Parameter, UGen]] = []
@@ -129,14 +141,7 @@ class SynthDefBuilder:
         self._parameters[name] = parameter
         return parameter
 
-    ### PUBLIC METHODS ###
-
-    def build(self, name: Optional[str] = None, optimize: bool = True) -> SynthDef:
-        # Calling build() creates controls each time, so strip out
-        # previously created ones. This could be made cleaner by preventing
-        # Control subclasses from being aggregated into SynthDefBuilders in
-        # the first place.
-        self._ugens[:] = [ugen for ugen in self._ugens if not isinstance(ugen, Control)]
+    def _build(self, name: Optional[str] = None, optimize: bool = True) -> SynthDef:
         name = self.name or name
         with self:
             ugens: List[Union[Parameter, UGen]] = []
@@ -151,9 +156,23 @@ class SynthDefBuilder:
             ) = SynthDef._build_control_mapping(parameters)
             SynthDef._remap_controls(ugens, control_mapping)
             ugens = control_ugens + ugens
-            synthdef = SynthDef(ugens, name=name, optimize=optimize)
+            synthdef = SynthDef(
+                ugens, name=name, optimize=optimize, variants=self._variants
+            )
         return synthdef
 
+    ### PUBLIC METHODS ###
+
+    def build(self, name: Optional[str] = None, optimize: bool = True) -> SynthDef:
+        # Calling build() creates controls each time, so strip out
+        # previously created ones. This could be made cleaner by preventing
+        # Control subclasses from being aggregated into SynthDefBuilders in
+        # the first place.
+        self._ugens[:] = [ugen for ugen in self._ugens if not isinstance(ugen, Control)]
+        if self.cache is None:
+            return self._build(name=name, optimize=optimize)
+        return self.cache.build(self, name=name, optimize=optimize)
+
     def poll_ugen(
         self,
         ugen: UGen,
@@ -176,6 +195,86 @@ class SynthDefBuilder:
         return self._name
 
 
+def _build_compiled(job) -> bytes:
+    target, kwargs = job
+    if hasattr(target, "build"):
+        # SynthDefFactory and SynthDefBuilder instances
+        result = target.build(**kwargs)
+    else:
+        result = target(**kwargs)
+    if isinstance(result, SynthDefBuilder):
+        result = result.build()
+    return result.compile()
+
+
+def build_many(
+    jobs: Sequence[Any],
+    compiled: bool = False,
+    process_count: Optional[int] = None,
+) -> Union[List[SynthDef], List[bytes]]:
+    """
+    Build and compile many SynthDefs across a pool of processes.
+
+    Each job is a SynthDef factory, a callable returning a SynthDef or
+    SynthDef builder, or a pair of either and a dictionary of keyword
+    arguments to build or call it with. Jobs are sent to other processes, so
+    must be picklable: lambdas and closures are not.
+
+    ::
+
+        >>> def build_sine(frequency=440):
+        ...     with supriya.synthdefs.SynthDefBuilder(frequency=frequency) as builder:
+        ...         supriya.ugens.Out.ar(
+        ...             bus=0,
+        ...             source=supriya.ugens.SinOsc.ar(frequency=builder["frequency"]),
+        ...         )
+        ...     return builder
+        ...
+
+    ::
+
+        >>> factory = supriya.synthdefs.SynthDefFactory().with_input().with_output()
+        >>> synthdefs = supriya.synthdefs.build_many(
+        ...     [
+        ...         build_sine,
+        ...         (build_sine, dict(frequency=220)),
+        ...         (factory, dict(name="factory")),
+        ...     ],
+        ...     process_count=1,
+        ... )
+        >>> [synthdef.actual_name for synthdef in synthdefs]
+        ['...', '...', 'factory']
+
+    Results keep the order of ``jobs`` and don't depend on
+    ``process_count``. SynthDefs are reconstructed from their compiled bytes,
+    which carry no parameter ranges or units. Pass ``compiled=True`` to get
+    the bytes instead, e.g. for uploading directly.
+
+    :param jobs: The SynthDefs to build.
+    :param compiled: Return compiled bytes rather than SynthDefs.
+    :param process_count: Build across a pool of this many processes, by
+        default one per CPU, or in this process if ``1``.
+    """
+    from .compilers import SynthDefDecompiler
+
+    normalized_jobs = [job if isinstance(job, tuple) else (job, {}) for job in jobs]
+    if process_count == 1:
+        results = [_build_compiled(job) for job in normalized_jobs]
+    else:
+        process_count = process_count or os.cpu_count() or 1
+        with concurrent.futures.ProcessPoolExecutor(process_count) as executor:
+            results = list(
+                executor.map(
+                    _build_compiled,
+                    normalized_jobs,
+                    chunksize=max(1, len(normalized_jobs) // (process_count * 4)),
+                )
+            )
+    if compiled:
+        return results
+    return [SynthDefDecompiler.decompile_synthdef(result) for result in results]
+
+
 def synthdef(*args: Union[str, Tuple[str, float]]) -> Callable[[Callable], SynthDef]:
     """
     Decorator for quickly constructing SynthDefs from functions.
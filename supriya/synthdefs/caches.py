@@ -0,0 +1,240 @@
+import collections
+import hashlib
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+
+from .._version import __version__
+from ..ugens import OutputProxy
+from .controls import Parameter
+from .synthdefs import SynthDef
+
+if TYPE_CHECKING:
+    from .builders import SynthDefBuilder
+
+
+class SynthDefCache:
+    """
+    A content-addressed cache of built SynthDefs.
+
+    Keys are structural hashes of a builder's graph, its name, the optimization
+    flag and supriya's version, so rebuilding an identical graph returns the
+    SynthDef built the first time without re-running the build pipeline.
+
+    ::
+
+        >>> cache = supriya.synthdefs.SynthDefCache()
+        >>> def build():
+        ...     with supriya.synthdefs.SynthDefBuilder(frequency=440) as builder:
+        ...         supriya.ugens.Out.ar(
+        ...             bus=0,
+        ...             source=supriya.ugens.SinOsc.ar(frequency=builder["frequency"]),
+        ...         )
+        ...     return builder
+        ...
+
+    ::
+
+        >>> synthdef = cache.build(build())
+        >>> cache.build(build()) is synthdef
+        True
+        >>> cache.hits, cache.misses
+        (1, 1)
+
+    Built SynthDefs are held in memory, least-recently-used first out. When
+    ``persistent``, their compiled bytes are also stored under
+    ``directory_path``, by default under :py:data:`supriya.output_path`, and
+    decompiled on a memory miss.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        maximum_size: int = 256,
+        persistent: bool = False,
+        directory_path: Optional[Union[os.PathLike, str]] = None,
+    ) -> None:
+        self._directory_path = Path(directory_path) if directory_path else None
+        self._entries: "collections.OrderedDict[str, SynthDef]" = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.maximum_size = maximum_size
+        self.misses = 0
+        self.persistent = persistent
+
+    ### SPECIAL METHODS ###
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    ### PRIVATE METHODS ###
+
+    def _read(
+        self, key: str, builder: "SynthDefBuilder", name: Optional[str]
+    ) -> Optional[SynthDef]:
+        from .compilers import SynthDefDecompiler
+
+        try:
+            compiled_synthdef = (self.directory_path / f"{key}.scsyndef").read_bytes()
+        except OSError:
+            return None
+        try:
+            synthdef = SynthDefDecompiler.decompile_synthdefs(compiled_synthdef)[0]
+        except Exception:
+            return None
+        # The compiled format carries neither names of anonymous SynthDefs nor
+        # parameter ranges and units, so restore them from the build arguments.
+        synthdef._name = name
+        for parameter_name, parameter in synthdef.parameters.items():
+            original_parameter = builder._parameters.get(parameter_name)
+            if original_parameter is not None:
+                parameter.range_ = original_parameter.range_
+                parameter.unit = original_parameter.unit
+        return synthdef
+
+    def _store(self, key: str, synthdef: SynthDef) -> None:
+        self._entries[key] = synthdef
+        while len(self._entries) > self.maximum_size:
+            self._entries.popitem(last=False)
+
+    def _write(self, key: str, synthdef: SynthDef) -> None:
+        try:
+            self.directory_path.mkdir(parents=True, exist_ok=True)
+            # Write atomically, as other processes may share the directory.
+            with tempfile.NamedTemporaryFile(
+                dir=self.directory_path, suffix=".tmp", delete=False
+            ) as file_pointer:
+                file_pointer.write(synthdef.compile())
+            os.replace(file_pointer.name, self.directory_path / f"{key}.scsyndef")
+        except OSError:
+            pass
+
+    ### PUBLIC METHODS ###
+
+    def build(
+        self,
+        builder: "SynthDefBuilder",
+        name: Optional[str] = None,
+        optimize: bool = True,
+    ) -> SynthDef:
+        """
+        Build a SynthDef from ``builder``, or return the cached equivalent.
+        """
+        key = self.get_key(builder, name=name, optimize=optimize)
+        if key is not None:
+            with self._lock:
+                if (synthdef := self._entries.get(key)) is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return synthdef
+            if self.persistent and (
+                synthdef := self._read(key, builder, builder.name or name)
+            ):
+                with self._lock:
+                    self._store(key, synthdef)
+                    self.hits += 1
+                return synthdef
+        synthdef = builder._build(name=name, optimize=optimize)
+        with self._lock:
+            self.misses += 1
+            if key is not None:
+                self._store(key, synthdef)
+        if key is not None and self.persistent:
+            self._write(key, synthdef)
+        return synthdef
+
+    def get_key(
+        self,
+        builder: "SynthDefBuilder",
+        name: Optional[str] = None,
+        optimize: bool = True,
+    ) -> Optional[str]:
+        """
+        Get the structural hash identifying ``builder``'s graph.
+
+        Returns ``None`` if the graph can't be hashed, e.g. because it
+        references ugens from outside the builder.
+        """
+        md5 = hashlib.md5()
+        name = builder.name or name
+        md5.update(
+            repr((__version__, name, bool(optimize), builder._variants)).encode()
+        )
+        indices: Dict[int, int] = {}
+        for parameter in builder._parameters.values():
+            indices[id(parameter)] = len(indices)
+            md5.update(repr(parameter).encode())
+        for ugen in builder._ugens:
+            if isinstance(ugen, Parameter):
+                continue
+            indices[id(ugen)] = len(indices)
+            inputs: List[Union[Tuple[int, int], str]] = []
+            for input_ in ugen._inputs:
+                if isinstance(input_, OutputProxy):
+                    if (index := indices.get(id(input_.source))) is None:
+                        return None
+                    inputs.append((index, input_.output_index))
+                else:
+                    inputs.append(float(input_).hex())
+            attributes = sorted(
+                (key, repr(value))
+                for key, value in getattr(ugen, "__dict__", {}).items()
+            )
+            md5.update(
+                repr(
+                    (
+                        type(ugen).__module__,
+                        type(ugen).__qualname__,
+                        int(ugen.calculation_rate),
+                        ugen._special_index,
+                        inputs,
+                        attributes,
+                    )
+                ).encode()
+            )
+        return md5.hexdigest()
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """
+        Invalidate the entry for ``key``, or all entries if ``key`` is ``None``.
+
+        Entries persisted on disk are removed too, if the cache is persistent.
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+        if not self.persistent or not self.directory_path.exists():
+            return
+        paths = (
+            self.directory_path.glob("*.scsyndef")
+            if key is None
+            else [self.directory_path / f"{key}.scsyndef"]
+        )
+        for path in paths:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def directory_path(self) -> Path:
+        """
+        Get the directory compiled SynthDefs persist in.
+        """
+        if self._directory_path is None:
+            from .. import output_path
+
+            return output_path / "synthdefs"
+        return self._directory_path
@@ -1,12 +1,22 @@
 import collections
+import concurrent.futures
+import hashlib
+import os
+import pathlib
 import struct
 from collections.abc import Sequence
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
 
-from .. import utils
 from ..enums import CalculationRate, ParameterRate
 from ..ugens import OutputProxy, UGen
 from .controls import Control, Parameter
 
+_UGEN_HEADER = struct.Struct(">BIIH")
+
+_UINT16 = struct.Struct(">H")
+
+_UINT32 = struct.Struct(">I")
+
 
 class SynthDefCompiler:
     @staticmethod
@@ -96,7 +106,7 @@ class SynthDefCompiler:
         result.append(SynthDefCompiler.encode_unsigned_int_32bit(len(synthdef.ugens)))
         for ugen_index, ugen in enumerate(synthdef.ugens):
             result.append(SynthDefCompiler.compile_ugen(ugen, synthdef))
-        result.append(SynthDefCompiler.encode_unsigned_int_16bit(0))
+        result.append(SynthDefCompiler.compile_variants(synthdef))
         result = bytes().join(result)
         return result
 
@@ -105,18 +115,43 @@ class SynthDefCompiler:
         result = []
         if isinstance(input_, float):
             result.append(SynthDefCompiler.encode_unsigned_int_32bit(0xFFFFFFFF))
-            constant_index = synthdef._constants.index(input_)
+            constant_index = synthdef._constant_indices[input_]
             result.append(SynthDefCompiler.encode_unsigned_int_32bit(constant_index))
         elif isinstance(input_, OutputProxy):
             ugen = input_.source
             output_index = input_.output_index
-            ugen_index = synthdef._ugens.index(ugen)
+            ugen_index = synthdef._ugen_indices[ugen]
             result.append(SynthDefCompiler.encode_unsigned_int_32bit(ugen_index))
             result.append(SynthDefCompiler.encode_unsigned_int_32bit(output_index))
         else:
             raise Exception("Unhandled input spec: {}".format(input_))
         return bytes().join(result)
 
+    @staticmethod
+    def compile_variants(synthdef):
+        result = [SynthDefCompiler.encode_unsigned_int_16bit(len(synthdef._variants))]
+        if not synthdef._variants:
+            return result[0]
+        # Each variant stores a full set of initial control values.
+        defaults, indices = [], {}
+        for index, parameter in synthdef.indexed_parameters:
+            value = parameter.value
+            if not isinstance(value, tuple):
+                value = (value,)
+            indices[parameter.name] = index
+            defaults[len(defaults) :] = [0.0] * (index + len(value) - len(defaults))
+            defaults[index : index + len(value)] = value
+        for variant_name, settings in synthdef._variants.items():
+            values = list(defaults)
+            for parameter_name, value in settings.items():
+                if not isinstance(value, tuple):
+                    value = (value,)
+                index = indices[parameter_name]
+                values[index : index + len(value)] = value
+            result.append(SynthDefCompiler.encode_string(variant_name))
+            result.extend(SynthDefCompiler.encode_float(x) for x in values)
+        return bytes().join(result)
+
     @staticmethod
     def encode_string(value):
         result = bytes(struct.pack(">B", len(value)))
@@ -140,6 +175,218 @@ class SynthDefCompiler:
         return bytes(struct.pack(">I", int(value)))
 
 
+class DecompiledUGen(NamedTuple):
+    """
+    A UGen as stored in a compiled SynthDef.
+
+    Inputs are pairs of UGen index and output index. Constants are referenced
+    by a UGen index of -1 and their index into the SynthDef's constants.
+    """
+
+    name: str
+    calculation_rate: int
+    special_index: int
+    inputs: Tuple[Tuple[int, int], ...]
+    output_rates: bytes
+
+
+class DecompiledSynthDef:
+    """
+    A compiled SynthDef decoded without building its UGens.
+
+    Names, parameters, variants and channel counts are read straight from the
+    decoded fields. The :py:class:`SynthDef` itself is only built when
+    :py:attr:`synthdef` is first accessed.
+
+    ::
+
+        >>> compiled_synthdef = supriya.assets.synthdefs.default.compile()
+        >>> decompiled = supriya.synthdefs.SynthDefDecompiler.scan_synthdefs(
+        ...     compiled_synthdef
+        ... )[0]
+        >>> decompiled
+        <DecompiledSynthDef: default>
+
+    ::
+
+        >>> decompiled.parameters["frequency"], decompiled.parameters["pan"]
+        (440.0, 0.5)
+        >>> decompiled.audio_output_channel_count
+        2
+
+    ::
+
+        >>> decompiled.synthdef == supriya.assets.synthdefs.default
+        True
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        "_data",
+        "_graph_start",
+        "_name",
+        "_parameter_indices",
+        "_parameter_values",
+        "_start",
+        "_stop",
+        "_synthdef",
+        "_variant_values",
+        "constants",
+        "ugens",
+    )
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        data: Union[bytes, memoryview],
+        start: int,
+        graph_start: int,
+        stop: int,
+        name: str,
+        constants: Tuple[float, ...],
+        parameter_values: Tuple[float, ...],
+        parameter_indices: Dict[str, int],
+        ugens: Tuple[DecompiledUGen, ...],
+        variant_values: Dict[str, Tuple[float, ...]],
+    ) -> None:
+        self._data = data
+        self._graph_start = graph_start
+        self._name = name
+        self._parameter_indices = parameter_indices
+        self._parameter_values = parameter_values
+        self._start = start
+        self._stop = stop
+        self._synthdef = None
+        self._variant_values = variant_values
+        self.constants = constants
+        self.ugens = ugens
+
+    ### SPECIAL METHODS ###
+
+    def __getstate__(self):
+        # Keep only this SynthDef's own bytes, e.g. when pickling across processes.
+        state = {name: getattr(self, name) for name in self.__slots__}
+        state.update(
+            _data=bytes(self._data[self._start : self._stop]),
+            _graph_start=self._graph_start - self._start,
+            _start=0,
+            _stop=self._stop - self._start,
+            _synthdef=None,
+        )
+        return state
+
+    def __repr__(self) -> str:
+        return "<{}: {}>".format(type(self).__name__, self.actual_name)
+
+    def __setstate__(self, state) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    ### PRIVATE METHODS ###
+
+    def _get_channel_count(self, is_input: bool, calculation_rate: int) -> int:
+        from .. import ugens
+
+        channel_counts = []
+        for ugen in self.ugens:
+            if ugen.calculation_rate != calculation_rate:
+                continue
+            ugen_class = getattr(ugens, ugen.name, None)
+            if ugen_class is None:
+                continue
+            if is_input and ugen_class._is_input:
+                channel_counts.append(len(ugen.output_rates))
+            elif not is_input and ugen_class._is_output:
+                # All inputs but the leading, non-source ones are channels.
+                channel_counts.append(
+                    len(ugen.inputs) - len(ugen_class._ordered_input_names) + 1
+                )
+        if len(channel_counts) == 1:
+            return channel_counts[0]
+        elif not channel_counts:
+            return 0
+        raise ValueError
+
+    def _slice_values(
+        self, values: Tuple[float, ...]
+    ) -> Dict[str, Union[float, Tuple[float, ...]]]:
+        # Split a flat array of control values by parameter, in file order.
+        bounds = sorted(self._parameter_indices.values()) + [len(values)]
+        stops = {start: stop for start, stop in zip(bounds, bounds[1:])}
+        sliced: Dict[str, Union[float, Tuple[float, ...]]] = {}
+        for name, start in self._parameter_indices.items():
+            value = values[start : stops[start]]
+            sliced[name] = value[0] if len(value) == 1 else value
+        return sliced
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def actual_name(self) -> str:
+        return self.name or self.anonymous_name
+
+    @property
+    def anonymous_name(self) -> str:
+        md5 = hashlib.md5()
+        md5.update(self._data[self._graph_start : self._stop])
+        return md5.hexdigest()
+
+    @property
+    def audio_input_channel_count(self) -> int:
+        return self._get_channel_count(True, CalculationRate.AUDIO)
+
+    @property
+    def audio_output_channel_count(self) -> int:
+        return self._get_channel_count(False, CalculationRate.AUDIO)
+
+    @property
+    def control_input_channel_count(self) -> int:
+        return self._get_channel_count(True, CalculationRate.CONTROL)
+
+    @property
+    def control_output_channel_count(self) -> int:
+        return self._get_channel_count(False, CalculationRate.CONTROL)
+
+    @property
+    def name(self) -> Optional[str]:
+        if self._name == self.anonymous_name:
+            return None
+        return self._name
+
+    @property
+    def parameters(self) -> Dict[str, Union[float, Tuple[float, ...]]]:
+        """
+        Get the initial values of the SynthDef's parameters, by name.
+        """
+        return self._slice_values(self._parameter_values)
+
+    @property
+    def synthdef(self):
+        """
+        Get the SynthDef, building its UGens on first access.
+        """
+        if self._synthdef is None:
+            self._synthdef = SynthDefDecompiler._materialize_synthdef(self)
+        return self._synthdef
+
+    @property
+    def variants(self) -> Dict[str, Dict[str, Union[float, Tuple[float, ...]]]]:
+        """
+        Get the SynthDef's variants, as the parameter values they override.
+        """
+        defaults = self.parameters
+        return {
+            variant_name: {
+                name: value
+                for name, value in self._slice_values(values).items()
+                if value != defaults[name]
+            }
+            for variant_name, values in self._variant_values.items()
+        }
+
+
 class SynthDefDecompiler:
     """
     SynthDef decompiler.
@@ -224,88 +471,64 @@ class SynthDefDecompiler:
     ### PRIVATE METHODS ###
 
     @staticmethod
-    def _decode_constants(value, index):
-        sdd = SynthDefDecompiler
-        constants = []
-        constants_count, index = sdd._decode_int_32bit(value, index)
-        for _ in range(constants_count):
-            constant, index = sdd._decode_float(value, index)
-            constants.append(constant)
-        return constants, index
+    def _collect_parameters_for_control(
+        calculation_rate,
+        indexed_parameters,
+        inputs,
+        output_count,
+        starting_control_index,
+        ugen_class,
+    ):
+        from .controls import TrigControl
 
-    @staticmethod
-    def _decode_parameters(value, index):
-        sdd = SynthDefDecompiler
-        parameter_values = []
-        parameter_count, index = sdd._decode_int_32bit(value, index)
-        for _ in range(parameter_count):
-            parameter_value, index = sdd._decode_float(value, index)
-            parameter_values.append(parameter_value)
-        parameter_count, index = sdd._decode_int_32bit(value, index)
-        parameter_names = []
-        parameter_indices = []
-        for _ in range(parameter_count):
-            parameter_name, index = sdd._decode_string(value, index)
-            parameter_index, index = sdd._decode_int_32bit(value, index)
-            parameter_names.append(parameter_name)
-            parameter_indices.append(parameter_index)
-        indexed_parameters = []
-        if parameter_count:
-            pairs = tuple(zip(parameter_indices, parameter_names))
-            pairs = sorted(pairs, key=lambda x: x[0])
-            iterator = utils.iterate_nwise(pairs)
-            for (index_one, name_one), (index_two, name_two) in iterator:
-                value = parameter_values[index_one:index_two]
-                if len(value) == 1:
-                    value = value[0]
-                parameter = Parameter(name=name_one, value=value)
-                indexed_parameters.append((index_one, parameter))
-            index_one, name_one = pairs[-1]
-            value = parameter_values[index_one:]
-            if len(value) == 1:
-                value = value[0]
-            parameter = Parameter(name=name_one, value=value)
-            indexed_parameters.append((index_one, parameter))
-            indexed_parameters.sort(key=lambda x: parameter_names.index(x[1].name))
-        indexed_parameters = collections.OrderedDict(indexed_parameters)
-        return indexed_parameters, index
+        parameter_rate = ParameterRate.CONTROL
+        if issubclass(ugen_class, TrigControl):
+            parameter_rate = ParameterRate.TRIGGER
+        elif calculation_rate == CalculationRate.SCALAR:
+            parameter_rate = ParameterRate.SCALAR
+        elif calculation_rate == CalculationRate.AUDIO:
+            parameter_rate = ParameterRate.AUDIO
+        parameters = []
+        collected_output_count = 0
+        lag = 0.0
+        while collected_output_count < output_count:
+            if inputs:
+                lag = inputs[collected_output_count]
+            parameter = indexed_parameters[
+                starting_control_index + collected_output_count
+            ]
+            parameter.parameter_rate = parameter_rate
+            if lag:
+                parameter.lag = lag
+            parameters.append(parameter)
+            collected_output_count += len(parameter)
+        return parameters
 
     @staticmethod
-    def _decompile_synthdef(value, index):
+    def _materialize_synthdef(decompiled):
         from .. import synthdefs, ugens
         from .synthdefs import SynthDef
 
         sdd = SynthDefDecompiler
-        synthdef = None
-        name, index = sdd._decode_string(value, index)
-        constants, index = sdd._decode_constants(value, index)
-        indexed_parameters, index = sdd._decode_parameters(value, index)
+        indexed_parameters = collections.OrderedDict(
+            (decompiled._parameter_indices[name], Parameter(name=name, value=value))
+            for name, value in decompiled.parameters.items()
+        )
+        constants = decompiled.constants
         decompiled_ugens = []
-        ugen_count, index = sdd._decode_int_32bit(value, index)
-        for i in range(ugen_count):
-            ugen_name, index = sdd._decode_string(value, index)
-            calculation_rate, index = sdd._decode_int_8bit(value, index)
-            calculation_rate = CalculationRate(calculation_rate)
-            input_count, index = sdd._decode_int_32bit(value, index)
-            output_count, index = sdd._decode_int_32bit(value, index)
-            special_index, index = sdd._decode_int_16bit(value, index)
-            inputs = []
-            for _ in range(input_count):
-                ugen_index, index = sdd._decode_int_32bit(value, index)
-                if ugen_index == 0xFFFFFFFF:
-                    constant_index, index = sdd._decode_int_32bit(value, index)
-                    constant_index = int(constant_index)
-                    inputs.append(constants[constant_index])
-                else:
-                    ugen = decompiled_ugens[ugen_index]
-                    ugen_output_index, index = sdd._decode_int_32bit(value, index)
-                    output_proxy = ugen[ugen_output_index]
-                    inputs.append(output_proxy)
-            for _ in range(output_count):
-                output_rate, index = sdd._decode_int_8bit(value, index)
-            ugen_class = getattr(ugens, ugen_name, None)
+        for ugen_spec in decompiled.ugens:
+            calculation_rate = CalculationRate(ugen_spec.calculation_rate)
+            special_index = ugen_spec.special_index
+            output_count = len(ugen_spec.output_rates)
+            inputs = [
+                constants[output_index]
+                if ugen_index == -1
+                else decompiled_ugens[ugen_index][output_index]
+                for ugen_index, output_index in ugen_spec.inputs
+            ]
+            ugen_class = getattr(ugens, ugen_spec.name, None)
             if ugen_class is None:
-                ugen_class = getattr(synthdefs, ugen_name)
+                ugen_class = getattr(synthdefs, ugen_spec.name)
             ugen = UGen.__new__(ugen_class)
             if issubclass(ugen_class, Control):
                 starting_control_index = special_index
@@ -342,78 +565,91 @@ class SynthDefDecompiler:
                     **kwargs,
                 )
             decompiled_ugens.append(ugen)
-        variants_count, index = sdd._decode_int_16bit(value, index)
-        synthdef = SynthDef(ugens=decompiled_ugens, name=name, decompiled=True)
-        if synthdef.name == synthdef.anonymous_name:
-            synthdef._name = None
-        return synthdef, index
+        return SynthDef(
+            ugens=decompiled_ugens,
+            name=decompiled.name,
+            decompiled=True,
+            variants=decompiled.variants,
+        )
 
     @staticmethod
-    def _decode_string(value, index):
-        length = struct.unpack(">B", value[index : index + 1])[0]
-        index += 1
-        result = value[index : index + length]
-        result = result.decode("ascii")
-        index += length
-        return result, index
+    def _scan_file(path):
+        return SynthDefDecompiler.scan_synthdefs(pathlib.Path(path).read_bytes())
 
     @staticmethod
-    def _decode_float(value, index):
-        result = struct.unpack(">f", value[index : index + 4])[0]
+    def _scan_synthdef(view, index):
+        start = index
+        name = str(view[index + 1 : index + 1 + view[index]], "ascii")
+        index += 1 + view[index]
+        graph_start = index
+        # constants
+        (count,) = _UINT32.unpack_from(view, index)
+        constants = struct.unpack_from(f">{count}f", view, index + 4)
+        index += 4 + 4 * count
+        # parameters
+        (count,) = _UINT32.unpack_from(view, index)
+        parameter_values = struct.unpack_from(f">{count}f", view, index + 4)
+        index += 4 + 4 * count
+        (count,) = _UINT32.unpack_from(view, index)
         index += 4
-        return result, index
-
-    @staticmethod
-    def _decode_int_8bit(value, index):
-        result = struct.unpack(">B", value[index : index + 1])[0]
-        index += 1
-        return result, index
-
-    @staticmethod
-    def _decode_int_16bit(value, index):
-        result = struct.unpack(">H", value[index : index + 2])[0]
-        index += 2
-        return result, index
-
-    @staticmethod
-    def _decode_int_32bit(value, index):
-        result = struct.unpack(">I", value[index : index + 4])[0]
+        parameter_indices = {}
+        for _ in range(count):
+            parameter_name = str(view[index + 1 : index + 1 + view[index]], "ascii")
+            index += 1 + view[index]
+            (parameter_indices[parameter_name],) = _UINT32.unpack_from(view, index)
+            index += 4
+        # ugens
+        (count,) = _UINT32.unpack_from(view, index)
         index += 4
-        return result, index
-
-    @staticmethod
-    def _collect_parameters_for_control(
-        calculation_rate,
-        indexed_parameters,
-        inputs,
-        output_count,
-        starting_control_index,
-        ugen_class,
-    ):
-        from .controls import TrigControl
-
-        parameter_rate = ParameterRate.CONTROL
-        if issubclass(ugen_class, TrigControl):
-            parameter_rate = ParameterRate.TRIGGER
-        elif calculation_rate == CalculationRate.SCALAR:
-            parameter_rate = ParameterRate.SCALAR
-        elif calculation_rate == CalculationRate.AUDIO:
-            parameter_rate = ParameterRate.AUDIO
-        parameters = []
-        collected_output_count = 0
-        lag = 0.0
-        while collected_output_count < output_count:
-            if inputs:
-                lag = inputs[collected_output_count]
-            parameter = indexed_parameters[
-                starting_control_index + collected_output_count
-            ]
-            parameter.parameter_rate = parameter_rate
-            if lag:
-                parameter.lag = lag
-            parameters.append(parameter)
-            collected_output_count += len(parameter)
-        return parameters
+        ugens = []
+        for _ in range(count):
+            ugen_name = str(view[index + 1 : index + 1 + view[index]], "ascii")
+            index += 1 + view[index]
+            (
+                calculation_rate,
+                input_count,
+                output_count,
+                special_index,
+            ) = _UGEN_HEADER.unpack_from(view, index)
+            index += _UGEN_HEADER.size
+            # Signed, so constants' 0xFFFFFFFF UGen index reads as -1.
+            inputs = struct.unpack_from(f">{2 * input_count}i", view, index)
+            index += 8 * input_count
+            output_rates = bytes(view[index : index + output_count])
+            index += output_count
+            ugens.append(
+                DecompiledUGen(
+                    ugen_name,
+                    calculation_rate,
+                    special_index,
+                    tuple(zip(inputs[::2], inputs[1::2])),
+                    output_rates,
+                )
+            )
+        # variants
+        (count,) = _UINT16.unpack_from(view, index)
+        index += 2
+        variant_values = {}
+        for _ in range(count):
+            variant_name = str(view[index + 1 : index + 1 + view[index]], "ascii")
+            index += 1 + view[index]
+            variant_values[variant_name] = struct.unpack_from(
+                f">{len(parameter_values)}f", view, index
+            )
+            index += 4 * len(parameter_values)
+        decompiled = DecompiledSynthDef(
+            data=view,
+            start=start,
+            graph_start=graph_start,
+            stop=index,
+            name=name,
+            constants=constants,
+            parameter_values=parameter_values,
+            parameter_indices=parameter_indices,
+            ugens=tuple(ugens),
+            variant_values=variant_values,
+        )
+        return decompiled, index
 
     ### PUBLIC METHODS ###
 
@@ -425,13 +661,50 @@ class SynthDefDecompiler:
 
     @staticmethod
     def decompile_synthdefs(value):
-        synthdefs = []
-        sdd = SynthDefDecompiler
-        index = 4
-        assert value[:index] == b"SCgf"
-        file_version, index = sdd._decode_int_32bit(value, index)
-        synthdef_count, index = sdd._decode_int_16bit(value, index)
+        return [
+            decompiled.synthdef
+            for decompiled in SynthDefDecompiler.scan_synthdefs(value)
+        ]
+
+    @staticmethod
+    def scan_directory(
+        path: os.PathLike,
+        pattern: str = "*.scsyndef",
+        process_count: Optional[int] = None,
+    ) -> Dict[pathlib.Path, List[DecompiledSynthDef]]:
+        """
+        Scan the compiled SynthDef files in a directory without building their
+        UGens.
+
+        :param path: The directory to scan.
+        :param pattern: The glob pattern selecting files to scan.
+        :param process_count: Scan files across a pool of this many processes,
+            or in this process if ``None``.
+        """
+        paths = sorted(pathlib.Path(path).glob(pattern))
+        if process_count is None:
+            return {path: SynthDefDecompiler._scan_file(path) for path in paths}
+        with concurrent.futures.ProcessPoolExecutor(process_count) as executor:
+            results = executor.map(
+                SynthDefDecompiler._scan_file,
+                paths,
+                chunksize=max(1, len(paths) // (process_count * 4)),
+            )
+            return dict(zip(paths, results))
+
+    @staticmethod
+    def scan_synthdefs(value: bytes) -> List[DecompiledSynthDef]:
+        """
+        Decode compiled SynthDefs without building their UGens.
+
+        :param value: The compiled SynthDefs, e.g. a ``.scsyndef`` file's contents.
+        """
+        view = memoryview(value)
+        if view[:4] != b"SCgf":
+            raise ValueError(bytes(view[:4]))
+        (synthdef_count,) = _UINT16.unpack_from(view, 8)
+        index, decompiled_synthdefs = 10, []
         for _ in range(synthdef_count):
-            synthdef, index = sdd._decompile_synthdef(value, index)
-            synthdefs.append(synthdef)
-        return synthdefs
+            decompiled, index = SynthDefDecompiler._scan_synthdef(view, index)
+            decompiled_synthdefs.append(decompiled)
+        return decompiled_synthdefs
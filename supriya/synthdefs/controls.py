@@ -1,5 +1,5 @@
 import collections
-import dataclasses
+import uuid
 from collections.abc import Sequence
 from typing import Optional, Tuple, Union
 
@@ -117,35 +117,72 @@ class Range:
         return self._maximum - self._minimum
 
 
-@dataclasses.dataclass(unsafe_hash=True)
 class Parameter(UGenMethodMixin):
-    lag: Optional[float] = None
-    name: Optional[str] = None
-    parameter_rate: int = ParameterRate.CONTROL
-    range_: Optional[Range] = None
-    unit: Optional[Unit] = None
-    value: Union[float, Tuple[float, ...]] = 0.0
-
-    def __post_init__(self):
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_uuid", "lag", "name", "parameter_rate", "range_", "unit", "value")
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        lag: Optional[float] = None,
+        name: Optional[str] = None,
+        parameter_rate: int = ParameterRate.CONTROL,
+        range_: Optional[Range] = None,
+        unit: Optional[Unit] = None,
+        value: Union[float, Tuple[float, ...]] = 0.0,
+    ) -> None:
+        self.lag = lag
+        self.name = name
+        self.range_ = range_
+        self.unit = unit
         try:
-            self.value = float(self.value)
+            self.value: Union[float, Tuple[float, ...]] = float(value)  # type: ignore
         except TypeError:
-            self.value = tuple(float(_) for _ in self.value)
-        self.parameter_rate = ParameterRate.from_expr(self.parameter_rate)
-        self._uuid = None
+            self.value = tuple(float(_) for _ in value)  # type: ignore
+        self.parameter_rate = ParameterRate.from_expr(parameter_rate)
+        self._uuid: Optional[uuid.UUID] = None
 
     ### SPECIAL METHODS ###
 
+    def __eq__(self, expr):
+        if type(expr) is not type(self):
+            return NotImplemented
+        return self._get_fields() == expr._get_fields()
+
     def __getitem__(self, i):
         return self._get_output_proxy(i)
 
+    def __hash__(self):
+        return hash(self._get_fields())
+
     def __len__(self):
         if isinstance(self.value, float):
             return 1
         return len(self.value)
 
+    def __repr__(self):
+        return "{}({})".format(
+            type(self).__name__,
+            ", ".join(
+                f"{name}={value!r}"
+                for name, value in zip(self.__slots__[1:], self._get_fields())
+            ),
+        )
+
     ### PRIVATE METHODS ###
 
+    def _get_fields(self):
+        return (
+            self.lag,
+            self.name,
+            self.parameter_rate,
+            self.range_,
+            self.unit,
+            self.value,
+        )
+
     def _get_source(self):
         return self
 
@@ -57,7 +57,7 @@ class SynthDef:
 
     ### INITIALIZER ###
 
-    def __init__(self, ugens, name=None, optimize=True, **kwargs):
+    def __init__(self, ugens, name=None, optimize=True, variants=None, **kwargs):
         self._name = name
         ugens = list(copy.deepcopy(ugens))
         assert all(isinstance(_, UGen) for _ in ugens)
@@ -67,9 +67,12 @@ class SynthDef:
             ugens = self._optimize_ugen_graph(ugens)
         ugens = self._sort_ugens_topologically(ugens)
         self._ugens = tuple(ugens)
-        self._constants = self._collect_constants(self._ugens)
+        self._ugen_indices = {ugen: i for i, ugen in enumerate(self._ugens)}
+        self._constant_indices = self._collect_constants(self._ugens)
+        self._constants = tuple(self._constant_indices)
         self._control_ugens = self._collect_control_ugens(self._ugens)
         self._indexed_parameters = self._collect_indexed_parameters(self._control_ugens)
+        self._variants = self._collect_variants(self._indexed_parameters, variants)
         self._compiled_ugen_graph = SynthDefCompiler.compile_ugen_graph(self)
 
     ### SPECIAL METHODS ###
@@ -181,10 +184,13 @@ class SynthDef:
 
         def get_ugen_names():
             grouped_ugens = {}
+            group_indices = {}
             named_ugens = {}
             for ugen in self._ugens:
                 key = (type(ugen), ugen.calculation_rate, ugen.special_index)
-                grouped_ugens.setdefault(key, []).append(ugen)
+                group = grouped_ugens.setdefault(key, [])
+                group_indices[ugen] = len(group)
+                group.append(ugen)
             for ugen in self._ugens:
                 parts = [type(ugen).__name__]
                 if isinstance(ugen, BinaryOpUGen):
@@ -197,7 +203,7 @@ class SynthDef:
                 key = (type(ugen), ugen.calculation_rate, ugen.special_index)
                 related_ugens = grouped_ugens[key]
                 if len(related_ugens) > 1:
-                    parts.append("/{}".format(related_ugens.index(ugen)))
+                    parts.append("/{}".format(group_indices[ugen]))
                 named_ugens[ugen] = "".join(parts)
             return named_ugens
 
@@ -259,6 +265,12 @@ class SynthDef:
                 result.append(f"    -   {ugen_name}:")
                 for parameter_name, parameter_value in ugen_dict.items():
                     result.append(f"            {parameter_name}: {parameter_value}")
+        if self._variants:
+            result.append("    variants:")
+            for variant_name, settings in self._variants.items():
+                result.append(f"        {variant_name}:")
+                for parameter_name, parameter_value in settings.items():
+                    result.append(f"            {parameter_name}: {parameter_value}")
         return "\n".join(result)
 
     ### PRIVATE METHODS ###
@@ -337,7 +349,8 @@ class SynthDef:
             for i, output_proxy in enumerate(control._get_parameter_output_proxies()):
                 control_mapping[output_proxy] = control[i]
         control_ugens = tuple(control_ugens)
-        indexed_parameters.sort(key=lambda pair: parameters.index(pair[1]))
+        parameter_indices = {parameter: i for i, parameter in enumerate(parameters)}
+        indexed_parameters.sort(key=lambda pair: parameter_indices[pair[1]])
         indexed_parameters = tuple(indexed_parameters)
         return control_ugens, control_mapping, indexed_parameters
 
@@ -408,15 +421,14 @@ class SynthDef:
         return ugens
 
     @staticmethod
-    def _collect_constants(ugens) -> Tuple[float, ...]:
-        constants = []
+    def _collect_constants(ugens) -> Dict[float, int]:
+        # Maps each distinct constant to its index, in order of first appearance.
+        constants: Dict[float, int] = {}
         for ugen in ugens:
             for input_ in ugen._inputs:
-                if not isinstance(input_, float):
-                    continue
-                if input_ not in constants:
-                    constants.append(input_)
-        return tuple(constants)
+                if isinstance(input_, float) and input_ not in constants:
+                    constants[input_] = len(constants)
+        return constants
 
     @staticmethod
     def _collect_control_ugens(ugens):
@@ -436,6 +448,61 @@ class SynthDef:
             indexed_parameters.append(parameters[parameter_name])
         return tuple(indexed_parameters)
 
+    @staticmethod
+    def _collect_variants(
+        indexed_parameters, variants
+    ) -> Dict[str, Dict[str, Union[float, Tuple[float, ...]]]]:
+        parameters = {parameter.name: parameter for _, parameter in indexed_parameters}
+        collected: Dict[str, Dict[str, Union[float, Tuple[float, ...]]]] = {}
+        for variant_name, settings in (variants or {}).items():
+            if not variant_name or "." in variant_name:
+                raise ValueError(variant_name)
+            collected[variant_name] = {}
+            for parameter_name, value in settings.items():
+                if parameter_name not in parameters:
+                    raise ValueError(parameter_name)
+                if isinstance(value, Sequence):
+                    value = tuple(float(x) for x in value)
+                    if len(value) != len(parameters[parameter_name]):
+                        raise ValueError(value)
+                    if len(value) == 1:
+                        value = value[0]
+                elif len(parameters[parameter_name]) != 1:
+                    raise ValueError(value)
+                else:
+                    value = float(value)
+                collected[variant_name][parameter_name] = value
+        # Order settings as the parameters are, as decompilation does.
+        for variant_name, settings in collected.items():
+            collected[variant_name] = {
+                name: settings[name] for name in parameters if name in settings
+            }
+        return collected
+
+    @staticmethod
+    def _eliminate_common_subexpressions(ugens):
+        # Hash-conses pure ugens, rewiring the consumers of each duplicate to
+        # the first equivalent ugen. Duplicates are left for dead code
+        # elimination.
+        canonical_ugens = {}
+        replacements = {}
+        for ugen in ugens:
+            if replacements:
+                ugen._inputs = tuple(replacements.get(x, x) for x in ugen._inputs)
+            key = ugen._get_common_subexpression_key()
+            if key is None:
+                continue
+            canonical_ugen = canonical_ugens.setdefault(key, ugen)
+            if canonical_ugen is ugen:
+                continue
+            for i in range(len(ugen)):
+                replacements[OutputProxy(ugen, i)] = OutputProxy(canonical_ugen, i)
+        if replacements:
+            # Catch consumers which precede their inputs in graph order.
+            for ugen in ugens:
+                ugen._inputs = tuple(replacements.get(x, x) for x in ugen._inputs)
+        return ugens
+
     @staticmethod
     def _extract_parameters(ugens):
         parameters = set()
@@ -446,6 +513,45 @@ class SynthDef:
         parameters = tuple(sorted(parameters, key=lambda x: x.name))
         return ugens, parameters
 
+    @staticmethod
+    def _fuse_ugens(ugens):
+        # Replaces ugens with fused equivalents, in graph order so fused ugens
+        # can be fused again by their own consumers. Absorbed inputs had no
+        # other consumers and are dropped.
+        from .builders import SynthDefBuilder
+
+        ugens = list(ugens)
+        if not ugens:
+            return ugens
+        consumer_counts = collections.Counter(
+            input_.source
+            for ugen in ugens
+            for input_ in ugen._inputs
+            if isinstance(input_, OutputProxy)
+        )
+        absorbed_ugens = set()
+        visited_ugens = set()
+        replacements = {}
+        # Construct fused ugens in a scope of their own, so they neither fail
+        # the input scope check nor leak into the builder being built.
+        scope = SynthDefBuilder()
+        scope._uuid = ugens[0]._uuid
+        with scope:
+            for i, ugen in enumerate(ugens):
+                if replacements:
+                    ugen._inputs = tuple(replacements.get(x, x) for x in ugen._inputs)
+                result = ugen._fuse(consumer_counts)
+                visited_ugens.add(ugen)
+                if result is None or result[1] not in visited_ugens:
+                    continue
+                fused_ugen, absorbed_ugen = result
+                absorbed_ugens.add(absorbed_ugen)
+                consumer_counts[fused_ugen] = consumer_counts[ugen]
+                replacements[OutputProxy(ugen, 0)] = OutputProxy(fused_ugen, 0)
+                visited_ugens.add(fused_ugen)
+                ugens[i] = fused_ugen
+        return [ugen for ugen in ugens if ugen not in absorbed_ugens]
+
     @staticmethod
     def _initialize_topological_sort(ugens):
         ugens = list(ugens)
@@ -455,20 +561,19 @@ class SynthDef:
             sort_bundles[ugen] = UGenSortBundle(ugen, width_first_antecedents)
             if ugen._is_width_first:
                 width_first_antecedents.append(ugen)
+        # Descendants are registered in graph order, so need no further sorting.
         for ugen in ugens:
-            sort_bundle = sort_bundles[ugen]
-            sort_bundle._initialize_topological_sort(sort_bundles)
-            sort_bundle.descendants[:] = sorted(
-                sort_bundles[ugen].descendants, key=lambda x: ugens.index(ugen)
-            )
+            sort_bundles[ugen]._initialize_topological_sort(sort_bundles)
         return sort_bundles
 
     @staticmethod
     def _optimize_ugen_graph(ugens):
+        ugens = SynthDef._simplify_ugen_graph(ugens)
+        ugens = SynthDef._eliminate_common_subexpressions(ugens)
         sort_bundles = SynthDef._initialize_topological_sort(ugens)
         for ugen in ugens:
             ugen._optimize_graph(sort_bundles)
-        return tuple(sort_bundles)
+        return tuple(SynthDef._fuse_ugens(sort_bundles))
 
     @staticmethod
     def _remap_controls(ugens, control_mapping):
@@ -480,6 +585,34 @@ class SynthDef:
                     inputs[i] = output_proxy
             ugen._inputs = tuple(inputs)
 
+    @staticmethod
+    def _simplify_ugen_graph(ugens):
+        # Folds constants and applies algebraic identities, rewiring consumers
+        # of each simplified ugen to its replacement. Orphaned ugens are left
+        # for dead code elimination.
+        replacements = {}
+        for ugen in ugens:
+            if replacements:
+                ugen._inputs = tuple(replacements.get(x, x) for x in ugen._inputs)
+            replacement = ugen._simplify()
+            if replacement is None:
+                continue
+            # Never lower a ugen's rate, except control-rate values which may
+            # become constant: consumers expecting audio-rate buffers would
+            # otherwise read past a constant's single value.
+            rate = CalculationRate.from_expr(replacement)
+            if rate != ugen.calculation_rate and not (
+                ugen.calculation_rate == CalculationRate.CONTROL
+                and rate == CalculationRate.SCALAR
+            ):
+                continue
+            replacements[OutputProxy(ugen, 0)] = replacement
+        if replacements:
+            # Catch consumers which precede their inputs in graph order.
+            for ugen in ugens:
+                ugen._inputs = tuple(replacements.get(x, x) for x in ugen._inputs)
+        return ugens
+
     @staticmethod
     def _sort_ugens_topologically(ugens):
         sort_bundles = SynthDef._initialize_topological_sort(ugens)
@@ -839,13 +972,43 @@ class SynthDef:
     def ugens(self) -> Tuple[UGen, ...]:
         return self._ugens
 
+    @property
+    def variants(self) -> Dict[str, Dict[str, Union[float, Tuple[float, ...]]]]:
+        """
+        Get the SynthDef's variants: named sets of control values overriding
+        its defaults, selected via ``name.variant`` when creating synths.
+        """
+        return {
+            variant_name: dict(settings)
+            for variant_name, settings in self._variants.items()
+        }
+
 
 class UGenSortBundle:
+    """
+    A UGen's edges in the graph being sorted.
+
+    Antecedents and descendants are insertion-ordered dicts used as sets, keeping
+    the sort deterministic while making membership tests and removals constant
+    time.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        "antecedents",
+        "descendants",
+        "is_available",
+        "ugen",
+        "width_first_antecedents",
+    )
+
     ### INITIALIZER ###
 
     def __init__(self, ugen, width_first_antecedents):
-        self.antecedents = []
-        self.descendants = []
+        self.antecedents = {}
+        self.descendants = {}
+        self.is_available = False
         self.ugen = ugen
         self.width_first_antecedents = tuple(width_first_antecedents)
 
@@ -857,36 +1020,30 @@ class UGenSortBundle:
                 input_ = input_.source
             elif not isinstance(input_, UGen):
                 continue
-            input_sort_bundle = sort_bundles[input_]
-            if input_ not in self.antecedents:
-                self.antecedents.append(input_)
-            if self.ugen not in input_sort_bundle.descendants:
-                input_sort_bundle.descendants.append(self.ugen)
+            self.antecedents[input_] = None
+            sort_bundles[input_].descendants[self.ugen] = None
         for input_ in self.width_first_antecedents:
-            input_sort_bundle = sort_bundles[input_]
-            if input_ not in self.antecedents:
-                self.antecedents.append(input_)
-            if self.ugen not in input_sort_bundle.descendants:
-                input_sort_bundle.descendants.append(self.ugen)
+            self.antecedents[input_] = None
+            sort_bundles[input_].descendants[self.ugen] = None
 
     def _make_available(self, available_ugens):
-        if not self.antecedents:
-            if self.ugen not in available_ugens:
-                available_ugens.append(self.ugen)
+        if not self.antecedents and not self.is_available:
+            self.is_available = True
+            available_ugens.append(self.ugen)
 
     def _schedule(self, available_ugens, out_stack, sort_bundles):
         for ugen in reversed(self.descendants):
             sort_bundle = sort_bundles[ugen]
-            sort_bundle.antecedents.remove(self.ugen)
+            del sort_bundle.antecedents[self.ugen]
             sort_bundle._make_available(available_ugens)
         out_stack.append(self.ugen)
 
     ### PUBLIC METHODS ###
 
     def clear(self) -> None:
-        self.antecedents[:] = []
-        self.descendants[:] = []
-        self.width_first_antecedents[:] = []
+        self.antecedents.clear()
+        self.descendants.clear()
+        self.width_first_antecedents = ()
 
 
 class SuperColliderSynthDef:
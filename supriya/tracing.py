@@ -0,0 +1,121 @@
+"""
+Structured tracing of clock and OSC activity.
+
+Tracing is off by default, and costs a single flag check per traced call site
+while off. Turn it on to record :py:class:`TraceEvent` tuples rather than
+formatting debug log text::
+
+    >>> import supriya.tracing
+    >>> from supriya.clocks import OfflineClock
+    >>> clock = OfflineClock()
+    >>> with supriya.tracing.trace() as events:
+    ...     _ = clock.schedule(lambda context: None, schedule_at=1.0)
+    ...     clock.start()
+    ...
+    >>> for event in events:
+    ...     print(event.kind, event.event_id, event.seconds, event.lateness)
+    ...
+    enqueue 0 None None
+    schedule 0 2.0 None
+    perform 0 2.0 0.0
+"""
+
+import collections
+import contextlib
+import time
+from typing import Any, Deque, Iterator, List, NamedTuple, Optional
+
+#: Whether trace events are being recorded.
+#: Check before calling :py:func:`record`.
+enabled = False
+
+_events: Deque["TraceEvent"] = collections.deque()
+
+
+class TraceEvent(NamedTuple):
+    """
+    A traced event.
+    """
+
+    #: Wall-clock time the event was recorded, per ``time.time()``.
+    timestamp: float
+    #: The kind of event, e.g. "perform" or "send".
+    kind: str
+    #: The name of the clock, or the address of the OSC protocol, tracing.
+    source: Optional[str]
+    #: The clock event ID, if any.
+    event_id: Optional[int] = None
+    #: The clock time the event was due, if any.
+    seconds: Optional[float] = None
+    #: Seconds between when the event was due and when it was performed, if any.
+    lateness: Optional[float] = None
+    #: The OSC message or bundle sent or received, if any.
+    message: Any = None
+
+
+def get_events() -> List[TraceEvent]:
+    """
+    Get the trace events recorded so far.
+    """
+    return list(_events)
+
+
+def record(
+    kind: str,
+    source: Optional[str],
+    event_id: Optional[int] = None,
+    seconds: Optional[float] = None,
+    lateness: Optional[float] = None,
+    message: Any = None,
+) -> None:
+    """
+    Record a trace event.
+
+    Records unconditionally: call sites should check :py:data:`enabled` first.
+    """
+    _events.append(
+        TraceEvent(
+            timestamp=time.time(),
+            kind=kind,
+            source=source,
+            event_id=event_id,
+            seconds=seconds,
+            lateness=lateness,
+            message=message,
+        )
+    )
+
+
+def start(maximum_length: Optional[int] = None) -> None:
+    """
+    Start recording trace events, discarding any recorded previously.
+
+    Only the most recent ``maximum_length`` events are kept, if given.
+    """
+    global _events, enabled
+    _events = collections.deque(maxlen=maximum_length)
+    enabled = True
+
+
+def stop() -> List[TraceEvent]:
+    """
+    Stop recording trace events, and return those recorded.
+    """
+    global enabled
+    enabled = False
+    return get_events()
+
+
+@contextlib.contextmanager
+def trace(maximum_length: Optional[int] = None) -> Iterator[List[TraceEvent]]:
+    """
+    Record trace events for the duration of the context.
+
+    The yielded list is filled with the recorded events on exit.
+    """
+    events: List[TraceEvent] = []
+    start(maximum_length)
+    try:
+        yield events
+    finally:
+        events.extend(stop())
@@ -1,6 +1,8 @@
 import abc
 import copy
+import functools
 import inspect
+import math
 from collections.abc import Iterable, Sequence
 from enum import Enum
 from typing import Callable, NamedTuple, Optional, SupportsFloat, Tuple, Type, Union
@@ -15,6 +17,14 @@ from ..enums import (
 from ..typing import UGenInputMap
 
 
+@functools.lru_cache(maxsize=None)
+def _get_synthdef_classes():
+    # Resolved on first use, as supriya.synthdefs imports this module.
+    from ..synthdefs import Parameter, SynthDefBuilder
+
+    return Parameter, SynthDefBuilder
+
+
 def _create_fn(
     cls, name, args, body, return_type, globals_=None, decorator=None, override=False
 ):
@@ -263,6 +273,10 @@ def ugen(
 
 
 class UGenMethodMixin:
+    ### CLASS VARIABLES ###
+
+    __slots__ = ()
+
     ### SPECIAL METHODS ###
 
     def __abs__(self) -> "UGenMethodMixin":
@@ -2151,14 +2165,22 @@ class UGenMethodMixin:
 
     @staticmethod
     def _compute_binary_op(left, right, operator):
-        result = []
+        operator = BinaryOperator.from_expr(operator)
+        special_index = operator.value
+        if not isinstance(left, Sequence) and not isinstance(right, Sequence):
+            # Single-channel operands need no multichannel expansion.
+            return BinaryOpUGen._new_single(
+                calculation_rate=UGenMethodMixin._compute_binary_rate(left, right),
+                left=left,
+                right=right,
+                special_index=special_index,
+            )
         if not isinstance(left, Sequence):
             left = (left,)
         if not isinstance(right, Sequence):
             right = (right,)
         dictionary = {"left": left, "right": right}
-        operator = BinaryOperator.from_expr(operator)
-        special_index = operator.value
+        result = []
         for expanded_dict in UGen._expand_dictionary(dictionary):
             left = expanded_dict["left"]
             right = expanded_dict["right"]
@@ -2176,8 +2198,15 @@ class UGenMethodMixin:
 
     @staticmethod
     def _compute_binary_rate(ugen_a, ugen_b):
-        a_rate = CalculationRate.from_expr(ugen_a)
-        b_rate = CalculationRate.from_expr(ugen_b)
+        ugen_prototype = (OutputProxy, UGen)
+        if isinstance(ugen_a, ugen_prototype):
+            a_rate = ugen_a.calculation_rate
+        else:
+            a_rate = CalculationRate.from_expr(ugen_a)
+        if isinstance(ugen_b, ugen_prototype):
+            b_rate = ugen_b.calculation_rate
+        else:
+            b_rate = CalculationRate.from_expr(ugen_b)
         if a_rate == CalculationRate.DEMAND or a_rate == CalculationRate.DEMAND:
             return CalculationRate.DEMAND
         elif a_rate == CalculationRate.AUDIO or b_rate == CalculationRate.AUDIO:
@@ -3483,6 +3512,10 @@ class UGenArray(UGenMethodMixin, Sequence):
 
 
 class OutputProxy(UGenMethodMixin):
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_output_index", "_source")
+
     ### INITIALIZER ###
 
     def __init__(self, source=None, output_index=None):
@@ -3578,8 +3611,7 @@ class UGen(UGenMethodMixin):
     ### INITIALIZER ###
 
     def __init__(self, calculation_rate=None, special_index=0, **kwargs):
-        from ..synthdefs import Parameter, SynthDefBuilder
-
+        Parameter, SynthDefBuilder = _get_synthdef_classes()
         calculation_rate = CalculationRate.from_expr(calculation_rate)
         if self._valid_calculation_rates:
             assert calculation_rate in self._valid_calculation_rates
@@ -3587,20 +3619,17 @@ class UGen(UGenMethodMixin):
         self._inputs = []
         self._input_names = []
         self._special_index = special_index
-        ugenlike_prototype = (UGen, Parameter)
-        for input_name in self._ordered_input_names:
-            input_value = None
-            if input_name in kwargs:
-                input_value = kwargs.pop(input_name)
-            if isinstance(input_value, ugenlike_prototype):
+        for input_name, is_unexpanded in self._get_input_metadata():
+            input_value = kwargs.pop(input_name, None)
+            if isinstance(input_value, (UGen, Parameter)):
                 assert len(input_value) == 1
                 input_value = input_value[0]
-            else:
+            elif type(input_value) is not float:
                 try:
                     input_value = float(input_value)
                 except TypeError:
                     pass
-            if self._is_unexpanded_input_name(input_name):
+            if is_unexpanded:
                 if not isinstance(input_value, Sequence):
                     input_value = (input_value,)
                 if isinstance(input_value, Sequence):
@@ -3612,7 +3641,6 @@ class UGen(UGenMethodMixin):
             self._configure_input(input_name, input_value)
         if kwargs:
             raise ValueError(kwargs)
-        assert all(isinstance(_, (OutputProxy, float)) for _ in self.inputs)
         self._validate_inputs()
         self._uuid = None
         if SynthDefBuilder._active_builders:
@@ -3690,7 +3718,7 @@ class UGen(UGenMethodMixin):
         raise ValueError(expr)
 
     def _add_constant_input(self, name, value):
-        self._inputs.append(float(value))
+        self._inputs.append(value if type(value) is float else float(value))
         self._input_names.append(name)
 
     def _add_ugen_input(self, name, ugen, output_index=None):
@@ -3724,11 +3752,14 @@ class UGen(UGenMethodMixin):
         return True
 
     def _configure_input(self, name, value):
-        from ..synthdefs import Parameter
-
+        Parameter, _ = _get_synthdef_classes()
         ugen_prototype = (OutputProxy, Parameter, UGen)
-        if hasattr(value, "__float__"):
+        if type(value) is float:
+            self._add_constant_input(name, value)
+        elif hasattr(value, "__float__"):
             self._add_constant_input(name, float(value))
+        elif isinstance(value, OutputProxy):
+            self._add_ugen_input(name, value)
         elif isinstance(value, ugen_prototype):
             self._add_ugen_input(name, value._get_source(), value._get_output_number())
         elif isinstance(value, Sequence):
@@ -3775,8 +3806,7 @@ class UGen(UGenMethodMixin):
             [('bus', 8), ('source', (1, 2, 3))]
             [('bus', 9), ('source', (1, 2, 3))]
         """
-        from ..synthdefs import Parameter
-
+        Parameter, _ = _get_synthdef_classes()
         dictionary = dictionary.copy()
         cached_unexpanded_inputs = {}
         if unexpanded_input_names is not None:
@@ -3803,6 +3833,33 @@ class UGen(UGenMethodMixin):
             expanded_inputs.update(cached_unexpanded_inputs)
         return result
 
+    def _fuse(self, consumer_counts):
+        """
+        Fuses ugen with its inputs into a single, cheaper ugen.
+
+        ``consumer_counts`` maps each ugen in the graph to the number of
+        inputs it feeds. Returns a pair of the fused ugen and the input ugen
+        it absorbed, or ``None`` to keep the ugen.
+        """
+        return None
+
+    def _get_common_subexpression_key(self):
+        """
+        Gets key identifying ugen for common subexpression elimination.
+
+        Pure ugens with equal keys compute identical outputs, and so can be
+        merged. Returns ``None`` if the ugen must never be merged.
+        """
+        if not self._is_pure:
+            return None
+        return (
+            type(self),
+            self.calculation_rate,
+            self._special_index,
+            len(self),
+            tuple(self._inputs),
+        )
+
     def _get_done_action(self):
         if "done_action" not in self._ordered_input_names:
             return None
@@ -3821,6 +3878,22 @@ class UGen(UGenMethodMixin):
             return cls.kr
         return cls.new
 
+    @classmethod
+    def _get_input_metadata(cls):
+        """
+        Gets pairs of input name and whether the input is unexpanded.
+
+        Computed once per class.
+        """
+        metadata = cls.__dict__.get("_input_metadata")
+        if metadata is None:
+            metadata = tuple(
+                (name, name in cls._unexpanded_input_names)
+                for name in cls._ordered_input_names
+            )
+            cls._input_metadata = metadata
+        return metadata
+
     def _get_output_number(self):
         return 0
 
@@ -3845,10 +3918,25 @@ class UGen(UGenMethodMixin):
 
     @classmethod
     def _new_expanded(cls, **kwargs):
+        Parameter, _ = _get_synthdef_classes()
+        # Single-channel inputs need no multichannel expansion, but are still
+        # converted to output proxies exactly as expansion would.
+        dictionary = {}
+        for name, value in kwargs.items():
+            if name in cls._unexpanded_input_names or isinstance(value, str):
+                pass
+            elif isinstance(value, (UGen, Parameter)) and len(value) == 1:
+                value = value[0]
+            elif isinstance(value, (Sequence, UGen, Parameter)):
+                dictionaries = UGen._expand_dictionary(
+                    kwargs, unexpanded_input_names=cls._unexpanded_input_names
+                )
+                break
+            dictionary[name] = value
+        else:
+            dictionaries = [dictionary]
         output_proxies = []
-        for input_dict in UGen._expand_dictionary(
-            kwargs, unexpanded_input_names=cls._unexpanded_input_names
-        ):
+        for input_dict in dictionaries:
             ugen = cls._new_single(**input_dict)
             if len(ugen) <= 1:
                 output_proxies.append(ugen)
@@ -3875,9 +3963,19 @@ class UGen(UGenMethodMixin):
             antecedent_bundle = sort_bundles.get(antecedent, None)
             if not antecedent_bundle:
                 continue
-            antecedent_bundle.descendants.remove(self)
+            antecedent_bundle.descendants.pop(self, None)
             antecedent._optimize_graph(sort_bundles)
 
+    def _simplify(self):
+        """
+        Simplifies ugen, before topological sorting.
+
+        Returns a constant or output proxy to replace the ugen's first output
+        with, or ``None`` to keep the ugen. Ugens may also rewrite themselves
+        in place.
+        """
+        return None
+
     def _validate_inputs(self):
         pass
 
@@ -4014,6 +4112,138 @@ class MultiOutUGen(UGen):
         UGen.__init__(self, **kwargs)
 
 
+def _sc_clip(x, minimum, maximum):
+    return max(min(x, maximum), minimum)
+
+
+def _sc_scurve(x):
+    x = _sc_clip(x, 0.0, 1.0)
+    return x * x * (3 - 2 * x)
+
+
+def _sc_window(function):
+    return lambda x: 0.0 if x < 0 or x > 1 else function(x)
+
+
+# Python equivalents of scsynth's operators, used for constant folding. Random
+# operators are never folded, and operators whose scsynth semantics diverge
+# from Python's for some inputs (integer and bitwise ops, signed pow and sqrt)
+# are absent or return ``None`` outside the inputs where both agree.
+_UNARY_OPERATOR_FUNCTIONS = {
+    UnaryOperator.ABSOLUTE_VALUE: abs,
+    UnaryOperator.AMPLITUDE_TO_DB: lambda x: 20 * math.log10(x),
+    UnaryOperator.ARCCOS: math.acos,
+    UnaryOperator.ARCSIN: math.asin,
+    UnaryOperator.ARCTAN: math.atan,
+    UnaryOperator.CEILING: math.ceil,
+    UnaryOperator.COS: math.cos,
+    UnaryOperator.COSH: math.cosh,
+    UnaryOperator.CUBED: lambda x: x * x * x,
+    UnaryOperator.DB_TO_AMPLITUDE: lambda x: 10 ** (x * 0.05),
+    UnaryOperator.DISTORT: lambda x: x / (1 + abs(x)),
+    UnaryOperator.EXPONENTIAL: math.exp,
+    UnaryOperator.FLOOR: math.floor,
+    UnaryOperator.FRACTIONAL_PART: lambda x: x - math.floor(x),
+    UnaryOperator.HANNING_WINDOW: _sc_window(
+        lambda x: 0.5 - 0.5 * math.cos(x * 2 * math.pi)
+    ),
+    UnaryOperator.HZ_TO_MIDI: lambda x: math.log2(x / 440) * 12 + 69,
+    UnaryOperator.HZ_TO_OCTAVE: lambda x: math.log2(x / 440) + 4.75,
+    UnaryOperator.LOG: math.log,
+    UnaryOperator.LOG10: math.log10,
+    UnaryOperator.LOG2: math.log2,
+    UnaryOperator.MIDI_TO_HZ: lambda x: 440 * 2 ** ((x - 69) / 12),
+    UnaryOperator.NEGATIVE: lambda x: -x,
+    UnaryOperator.NOT: lambda x: 0.0 if x > 0 else 1.0,
+    UnaryOperator.OCTAVE_TO_HZ: lambda x: 440 * 2 ** (x - 4.75),
+    UnaryOperator.RAMP: lambda x: _sc_clip(x, 0.0, 1.0),
+    UnaryOperator.RATIO_TO_SEMITONES: lambda x: math.log2(x) * 12,
+    UnaryOperator.RECIPROCAL: lambda x: 1 / x,
+    UnaryOperator.RECTANGLE_WINDOW: _sc_window(lambda x: 1.0),
+    UnaryOperator.S_CURVE: _sc_scurve,
+    UnaryOperator.SEMITONES_TO_RATIO: lambda x: 2 ** (x / 12),
+    UnaryOperator.SIGN: lambda x: float((x > 0) - (x < 0)),
+    UnaryOperator.SILENCE: lambda x: 0.0,
+    UnaryOperator.SIN: math.sin,
+    UnaryOperator.SINH: math.sinh,
+    UnaryOperator.SOFTCLIP: lambda x: x if abs(x) <= 0.5 else (abs(x) - 0.25) / x,
+    UnaryOperator.SQUARE_ROOT: math.sqrt,
+    UnaryOperator.SQUARED: lambda x: x * x,
+    UnaryOperator.TAN: math.tan,
+    UnaryOperator.TANH: math.tanh,
+    UnaryOperator.THRU: lambda x: x,
+    UnaryOperator.TRIANGLE_WINDOW: _sc_window(
+        lambda x: 2 * x if x < 0.5 else 2 - 2 * x
+    ),
+    UnaryOperator.WELCH_WINDOW: _sc_window(lambda x: math.sin(x * math.pi)),
+}
+
+_BINARY_OPERATOR_FUNCTIONS = {
+    BinaryOperator.ABSOLUTE_DIFFERENCE: lambda a, b: abs(a - b),
+    BinaryOperator.ADDITION: lambda a, b: a + b,
+    BinaryOperator.AMCLIP: lambda a, b: 0.0 if b <= 0 else a * b,
+    BinaryOperator.ATAN2: math.atan2,
+    BinaryOperator.CLIP2: lambda a, b: _sc_clip(a, -b, b),
+    BinaryOperator.DIFFERENCE_OF_SQUARES: lambda a, b: a * a - b * b,
+    BinaryOperator.EQUAL: lambda a, b: float(a == b),
+    BinaryOperator.EXCESS: lambda a, b: a - _sc_clip(a, -b, b),
+    BinaryOperator.FIRST_ARG: lambda a, b: a,
+    BinaryOperator.FLOAT_DIVISION: lambda a, b: a / b,
+    BinaryOperator.GREATER_THAN: lambda a, b: float(a > b),
+    BinaryOperator.GREATER_THAN_OR_EQUAL: lambda a, b: float(a >= b),
+    BinaryOperator.HYPOT: math.hypot,
+    BinaryOperator.LESS_THAN: lambda a, b: float(a < b),
+    BinaryOperator.LESS_THAN_OR_EQUAL: lambda a, b: float(a <= b),
+    BinaryOperator.MAXIMUM: max,
+    BinaryOperator.MINIMUM: min,
+    BinaryOperator.MODULO: lambda a, b: a % b if b > 0 else None,
+    BinaryOperator.MULTIPLICATION: lambda a, b: a * b,
+    BinaryOperator.NOT_EQUAL: lambda a, b: float(a != b),
+    BinaryOperator.POWER: lambda a, b: math.pow(a, b) if a >= 0 else None,
+    BinaryOperator.RING1: lambda a, b: a * b + a,
+    BinaryOperator.RING2: lambda a, b: a * b + a + b,
+    BinaryOperator.RING3: lambda a, b: a * a * b,
+    BinaryOperator.RING4: lambda a, b: a * a * b - a * b * b,
+    BinaryOperator.ROUND: lambda a, b: math.floor(a / b + 0.5) * b if b else a,
+    BinaryOperator.ROUND_UP: lambda a, b: math.ceil(a / b) * b if b else a,
+    BinaryOperator.SCALE_NEG: lambda a, b: a * b if a < 0 else a,
+    BinaryOperator.SQUARE_OF_DIFFERENCE: lambda a, b: (a - b) ** 2,
+    BinaryOperator.SQUARE_OF_SUM: lambda a, b: (a + b) ** 2,
+    BinaryOperator.SUBTRACTION: lambda a, b: a - b,
+    BinaryOperator.SUM_OF_SQUARES: lambda a, b: a * a + b * b,
+    BinaryOperator.THRESHOLD: lambda a, b: 0.0 if a < b else a,
+    BinaryOperator.TRUNCATION: lambda a, b: math.floor(a / b) * b if b else a,
+}
+
+
+# Operators drawing from the synth's random number generator. UGens applying
+# these are pure, but never equivalent to one another.
+_RANDOM_UNARY_OPERATORS = frozenset(
+    [
+        UnaryOperator.BILINRAND,
+        UnaryOperator.COIN,
+        UnaryOperator.LINRAND,
+        UnaryOperator.RAND,
+        UnaryOperator.RAND2,
+        UnaryOperator.SUM3RAND,
+    ]
+)
+
+_RANDOM_BINARY_OPERATORS = frozenset(
+    [BinaryOperator.EXPRANDRANGE, BinaryOperator.RANDRANGE]
+)
+
+
+def _fold_constants(function, *values):
+    try:
+        result = function(*values)
+    except (ArithmeticError, ValueError):
+        return None
+    if result is None or not math.isfinite(result):
+        return None
+    return float(result)
+
+
 @ugen(is_pure=True)
 class UnaryOpUGen(UGen):
     """
@@ -4046,6 +4276,32 @@ class UnaryOpUGen(UGen):
             special_index=special_index,
         )
 
+    ### PRIVATE METHODS ###
+
+    def _get_common_subexpression_key(self):
+        if self.operator in _RANDOM_UNARY_OPERATORS:
+            return None
+        return UGen._get_common_subexpression_key(self)
+
+    def _simplify(self):
+        if self.calculation_rate == CalculationRate.DEMAND:
+            return None
+        (source,) = self._inputs
+        if isinstance(source, float):
+            function = _UNARY_OPERATOR_FUNCTIONS.get(self.operator)
+            if function is None:
+                return None
+            return _fold_constants(function, source)
+        if self.operator == UnaryOperator.THRU:
+            return source
+        if (
+            self.operator == UnaryOperator.NEGATIVE
+            and isinstance(source.source, UnaryOpUGen)
+            and source.source.operator == UnaryOperator.NEGATIVE
+        ):
+            return source.source._inputs[0]
+        return None
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -4104,6 +4360,76 @@ class BinaryOpUGen(UGen):
 
     ### PRIVATE METHODS ###
 
+    def _get_common_subexpression_key(self):
+        if self.operator in _RANDOM_BINARY_OPERATORS:
+            return None
+        return UGen._get_common_subexpression_key(self)
+
+    def _fuse(self, consumer_counts):
+        """
+        Fuses addition with a single-consumer input into a ``Sum3``, ``Sum4``
+        or ``MulAdd``, as sclang does.
+
+        Returns a pair of the fused ugen and the input ugen it absorbed, or
+        ``None``.
+        """
+        from .basic import MulAdd, Sum3, Sum4
+
+        def get_absorbable_source(input_, class_, operator=None):
+            if not isinstance(input_, OutputProxy):
+                return None
+            source = input_.source
+            if type(source) is not class_ or consumer_counts[source] != 1:
+                return None
+            if operator is not None and source.operator != operator:
+                return None
+            return source
+
+        if self.operator != BinaryOperator.ADDITION:
+            return None
+        if CalculationRate.DEMAND in (
+            self.calculation_rate,
+            *(CalculationRate.from_expr(x) for x in self._inputs),
+        ):
+            return None
+        a, b = self._inputs
+        for x, y in ((a, b), (b, a)):
+            addition = get_absorbable_source(x, BinaryOpUGen, BinaryOperator.ADDITION)
+            if addition is not None:
+                input_one, input_two = addition._inputs
+                return (
+                    Sum3(input_one=input_one, input_two=input_two, input_three=y),
+                    addition,
+                )
+        for x, y in ((a, b), (b, a)):
+            sum3 = get_absorbable_source(x, Sum3)
+            if sum3 is not None:
+                input_one, input_two, input_three = sum3._inputs
+                ugen = Sum4(
+                    input_one=input_one,
+                    input_two=input_two,
+                    input_three=input_three,
+                    input_four=y,
+                )
+                return ugen, sum3
+        for x, y in ((b, a), (a, b)):
+            multiplication = get_absorbable_source(
+                x, BinaryOpUGen, BinaryOperator.MULTIPLICATION
+            )
+            if multiplication is None:
+                continue
+            left, right = multiplication._inputs
+            for source, multiplier in ((left, right), (right, left)):
+                if MulAdd._inputs_are_valid(source, multiplier, y):
+                    ugen = MulAdd(
+                        addend=y,
+                        multiplier=multiplier,
+                        calculation_rate=self.calculation_rate,
+                        source=source,
+                    )
+                    return ugen, multiplication
+        return None
+
     @classmethod
     def _new_single(
         cls, calculation_rate=None, special_index=None, left=None, right=None
@@ -4117,7 +4443,7 @@ class BinaryOpUGen(UGen):
                 return 0
             if a == 1:
                 return b
-            if a == 1:
+            if a == -1:
                 return -b
             if b == 1:
                 return a
@@ -4146,6 +4472,51 @@ class BinaryOpUGen(UGen):
         )
         return ugen
 
+    def _simplify(self):
+        if self.calculation_rate == CalculationRate.DEMAND:
+            return None
+        a, b = self._inputs
+        operator = self.operator
+        if isinstance(a, float) and isinstance(b, float):
+            function = _BINARY_OPERATOR_FUNCTIONS.get(operator)
+            if function is None:
+                return None
+            return _fold_constants(function, a, b)
+        if operator == BinaryOperator.ADDITION:
+            if a == 0:
+                return b
+            if b == 0:
+                return a
+        elif operator == BinaryOperator.SUBTRACTION:
+            if b == 0:
+                return a
+            if a == b:
+                return 0.0
+        elif operator == BinaryOperator.MULTIPLICATION:
+            if a == 0 or b == 0:
+                return 0.0
+            if a == 1:
+                return b
+            if b == 1:
+                return a
+        elif operator == BinaryOperator.FLOAT_DIVISION:
+            if b == 1:
+                return a
+            # Division by a power of two has an exact reciprocal, so reduce it
+            # to the cheaper multiplication without changing the result.
+            if isinstance(b, float) and b and abs(math.frexp(b)[0]) == 0.5:
+                self._special_index = BinaryOperator.MULTIPLICATION.value
+                self._inputs = (a, 1 / b)
+        elif operator == BinaryOperator.POWER:
+            if b == 1:
+                return a
+        elif operator == BinaryOperator.FIRST_ARG:
+            return a
+        elif operator in (BinaryOperator.MAXIMUM, BinaryOperator.MINIMUM):
+            if a == b:
+                return a
+        return None
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -60,55 +60,27 @@ class Mix(PseudoUGen):
             synthdef:
                 name: mix2
                 ugens:
-                -   DC.ar/0:
-                        source: 1.0
-                -   DC.ar/1:
-                        source: 1.0
-                -   DC.ar/2:
-                        source: 1.0
-                -   DC.ar/3:
+                -   DC.ar:
                         source: 1.0
                 -   Sum4.ar/0:
-                        input_one: DC.ar/0[0]
-                        input_two: DC.ar/1[0]
-                        input_three: DC.ar/2[0]
-                        input_four: DC.ar/3[0]
-                -   DC.ar/4:
-                        source: 1.0
-                -   DC.ar/5:
-                        source: 1.0
-                -   DC.ar/6:
-                        source: 1.0
-                -   DC.ar/7:
-                        source: 1.0
+                        input_one: DC.ar[0]
+                        input_two: DC.ar[0]
+                        input_three: DC.ar[0]
+                        input_four: DC.ar[0]
                 -   Sum4.ar/1:
-                        input_one: DC.ar/4[0]
-                        input_two: DC.ar/5[0]
-                        input_three: DC.ar/6[0]
-                        input_four: DC.ar/7[0]
-                -   DC.ar/8:
-                        source: 1.0
-                -   DC.ar/9:
-                        source: 1.0
-                -   DC.ar/10:
-                        source: 1.0
-                -   DC.ar/11:
-                        source: 1.0
+                        input_one: DC.ar[0]
+                        input_two: DC.ar[0]
+                        input_three: DC.ar[0]
+                        input_four: DC.ar[0]
                 -   Sum4.ar/2:
-                        input_one: DC.ar/8[0]
-                        input_two: DC.ar/9[0]
-                        input_three: DC.ar/10[0]
-                        input_four: DC.ar/11[0]
-                -   DC.ar/12:
-                        source: 1.0
-                -   DC.ar/13:
-                        source: 1.0
-                -   DC.ar/14:
-                        source: 1.0
+                        input_one: DC.ar[0]
+                        input_two: DC.ar[0]
+                        input_three: DC.ar[0]
+                        input_four: DC.ar[0]
                 -   Sum3.ar:
-                        input_one: DC.ar/12[0]
-                        input_two: DC.ar/13[0]
-                        input_three: DC.ar/14[0]
+                        input_one: DC.ar[0]
+                        input_two: DC.ar[0]
+                        input_three: DC.ar[0]
                 -   Sum4.ar/3:
                         input_one: Sum4.ar/0[0]
                         input_two: Sum4.ar/1[0]
@@ -450,14 +422,14 @@ class Sum3(UGen):
     def __init__(self, input_one=None, input_two=None, input_three=None):
         inputs = [input_one, input_two, input_three]
         calculation_rate = CalculationRate.from_expr(inputs)
+        # scsynth expects inputs in descending order of rate
         inputs.sort(key=lambda x: CalculationRate.from_expr(x), reverse=True)
-        inputs = tuple(inputs)
         UGen.__init__(
             self,
             calculation_rate=calculation_rate,
-            input_one=input_one,
-            input_two=input_two,
-            input_three=input_three,
+            input_one=inputs[0],
+            input_two=inputs[1],
+            input_three=inputs[2],
         )
 
     ### PRIVATE METHODS ###
@@ -511,15 +483,15 @@ class Sum4(UGen):
     ):
         inputs = [input_one, input_two, input_three, input_four]
         calculation_rate = CalculationRate.from_expr(inputs)
+        # scsynth expects inputs in descending order of rate
         inputs.sort(key=lambda x: CalculationRate.from_expr(x), reverse=True)
-        inputs = tuple(inputs)
         UGen.__init__(
             self,
             calculation_rate=calculation_rate,
-            input_one=input_one,
-            input_two=input_two,
-            input_three=input_three,
-            input_four=input_four,
+            input_one=inputs[0],
+            input_two=inputs[1],
+            input_three=inputs[2],
+            input_four=inputs[3],
         )
 
     ### PRIVATE METHODS ###
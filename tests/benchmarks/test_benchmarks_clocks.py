@@ -0,0 +1,41 @@
+import time
+
+import pytest
+
+from supriya.clocks import OfflineClock
+
+
+def measure_tempo_ramp(pending_count, change_count=200):
+    """
+    Time a tempo ramp while ``pending_count`` events wait far in the future.
+    """
+    clock = OfflineClock()
+    times = []
+
+    def noop(context):
+        return None
+
+    def ramp(context):
+        times.append(time.perf_counter())
+        if len(times) > change_count:
+            return None
+        clock.change(beats_per_minute=60 + len(times))
+        return 0.25
+
+    for i in range(pending_count):
+        clock.schedule(noop, schedule_at=1000.0 + i)
+    clock.cue(ramp)
+    clock.start()
+    return times[-1] - times[0]
+
+
+@pytest.mark.benchmark
+@pytest.mark.flaky(reruns=5)
+def test_tempo_ramp_scaling(record_property):
+    # Tempo changes re-derive pending events' seconds lazily, so their cost
+    # shouldn't grow with the number of pending events.
+    small = min(measure_tempo_ramp(1000) for _ in range(3))
+    large = min(measure_tempo_ramp(10000) for _ in range(3))
+    record_property("small", small)
+    record_property("large", large)
+    assert large < small * 3
@@ -0,0 +1,40 @@
+import timeit
+
+import pytest
+
+import supriya.osc
+from supriya.osc import OscBundle, OscMessage
+
+MESSAGE = OscMessage("/n_set", 1000, "frequency", 440.0, "amplitude", 0.5)
+
+BUNDLE = OscBundle(
+    timestamp=1401557034.5,
+    contents=[OscMessage("/c_set", i, i * 0.5) for i in range(64)],
+)
+
+
+def measure(osc_object, number):
+    datagram = osc_object.to_datagram()
+    class_ = type(osc_object)
+    encode = min(timeit.repeat(osc_object.to_datagram, number=number, repeat=3))
+    decode = min(
+        timeit.repeat(lambda: class_.from_datagram(datagram), number=number, repeat=3)
+    )
+    return encode, decode
+
+
+@pytest.mark.benchmark
+@pytest.mark.flaky(reruns=5)
+@pytest.mark.parametrize("osc_object, number", [(MESSAGE, 5000), (BUNDLE, 200)])
+def test_osc_codec(monkeypatch, record_property, osc_object, number):
+    accelerated = pytest.importorskip("supriya._osc")
+    monkeypatch.setattr(supriya.osc, "_osc", None)
+    python_encode, python_decode = measure(osc_object, number)
+    monkeypatch.setattr(supriya.osc, "_osc", accelerated)
+    accelerated_encode, accelerated_decode = measure(osc_object, number)
+    record_property("python_encode", python_encode)
+    record_property("python_decode", python_decode)
+    record_property("accelerated_encode", accelerated_encode)
+    record_property("accelerated_decode", accelerated_decode)
+    assert accelerated_encode < python_encode
+    assert accelerated_decode < python_decode
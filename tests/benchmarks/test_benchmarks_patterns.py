@@ -0,0 +1,58 @@
+import itertools
+import time
+
+import pytest
+
+from supriya.contexts import Score
+from supriya.patterns import (
+    ChoicePattern,
+    EventPattern,
+    RandomPattern,
+    SeedPattern,
+    SequencePattern,
+    ShufflePattern,
+)
+
+pytest.importorskip("numpy")
+
+
+@pytest.mark.benchmark
+@pytest.mark.flaky(reruns=5)
+def test_render_block_throughput(record_property):
+    pattern = SeedPattern(
+        EventPattern(
+            amplitude=ChoicePattern([0.1, 0.2], iterations=None),
+            delta=ShufflePattern([0.25, 0.5, 0.75], iterations=None),
+            frequency=RandomPattern(100, 1000) * 2,
+            pan=SequencePattern([-1, 0, 1], None),
+        )
+    )
+    pattern.render_block(10)  # Import numpy outside of the measurement
+    count = 50000
+    start = time.perf_counter()
+    pattern.render_block(count)
+    blockwise = time.perf_counter() - start
+    start = time.perf_counter()
+    list(itertools.islice(pattern, count))
+    iterated = time.perf_counter() - start
+    record_property("iterated", iterated)
+    record_property("blockwise", blockwise)
+    assert blockwise * 5 < iterated
+
+
+@pytest.mark.benchmark
+@pytest.mark.flaky(reruns=5)
+def test_to_score_throughput(record_property):
+    count = 100000
+    pattern = EventPattern(
+        delta=0.25, frequency=SequencePattern([440, 550, 660, 770], count // 4)
+    )
+    start = time.perf_counter()
+    pattern.play(Score())
+    played = time.perf_counter() - start
+    start = time.perf_counter()
+    pattern.to_score(Score())
+    compiled = time.perf_counter() - start
+    record_property("played_per_second", count / played)
+    record_property("compiled_per_second", count / compiled)
+    assert compiled * 2 < played
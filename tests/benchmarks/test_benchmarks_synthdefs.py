@@ -0,0 +1,125 @@
+import itertools
+import time
+
+import pytest
+
+from supriya import SynthDefBuilder, ugens
+from supriya.synthdefs import (
+    Parameter,
+    SynthDef,
+    SynthDefCompiler,
+    SynthDefDecompiler,
+    SynthDefFactory,
+)
+
+
+def build_additive_synthdef(ugen_count):
+    # Three UGens per partial: a multiply, an oscillator and another multiply.
+    with SynthDefBuilder(frequency=440, amplitude=0.1) as builder:
+        partials = [
+            ugens.SinOsc.ar(frequency=builder["frequency"] * i)
+            * (builder["amplitude"] / i)
+            for i in range(1, ugen_count // 3 + 1)
+        ]
+        ugens.Out.ar(bus=0, source=ugens.Mix.new(partials))
+    return builder
+
+
+def measure(ugen_count):
+    builder = build_additive_synthdef(ugen_count)
+    start = time.perf_counter()
+    synthdef = builder.build()
+    synthdef.compile()
+    return len(synthdef.ugens), time.perf_counter() - start
+
+
+@pytest.mark.benchmark
+@pytest.mark.flaky(reruns=5)
+def test_synthdef_build_scaling(record_property):
+    measure(100)  # warm up
+    timings = {}
+    for ugen_count in (100, 1000, 10000):
+        actual_count, elapsed = measure(ugen_count)
+        timings[ugen_count] = elapsed / actual_count
+        record_property(f"elapsed_{actual_count}", elapsed)
+    # Per-UGen cost stays roughly flat as the graph grows.
+    assert timings[10000] < timings[1000] * 4
+
+
+@pytest.mark.benchmark
+@pytest.mark.flaky(reruns=5)
+def test_ugen_construction_throughput(record_property):
+    def measure(iterations):
+        with SynthDefBuilder(frequency=440, amplitude=0.1) as builder:
+            start = time.perf_counter()
+            signal = builder["frequency"]
+            for i in range(iterations):
+                signal = ugens.SinOsc.ar(frequency=signal) * builder["amplitude"] + i
+            elapsed = time.perf_counter() - start
+        return len(builder._ugens) / elapsed
+
+    measure(100)  # warm up
+    ugens_per_second = max(measure(3000) for _ in range(3))
+    record_property("ugens_per_second", ugens_per_second)
+    # Graph objects are slotted, so building allocates no instance dicts.
+    assert not hasattr(ugens.SinOsc.ar()[0], "__dict__")
+    assert not hasattr(Parameter(), "__dict__")
+    assert ugens_per_second > 10000
+
+
+def iterate_factories():
+    def signal_block(builder, source, state):
+        return ugens.SinOsc.ar() * builder["gain"] + source * 0.5
+
+    for channel_count, crossfaded, leveled, windowed in itertools.product(
+        (1, 2), (False, True), (False, True), (False, True)
+    ):
+        yield (
+            SynthDefFactory(channel_count=channel_count, gain=0.5)
+            .with_input(windowed=windowed)
+            .with_signal_block(signal_block)
+            .with_gate()
+            .with_output(
+                crossfaded=crossfaded,
+                leveled=leveled,
+                windowed=windowed and not crossfaded,
+            )
+        )
+
+
+@pytest.mark.benchmark
+def test_synthdef_fusion_ugen_count(monkeypatch, record_property):
+    monkeypatch.setattr(SynthDefBuilder, "cache", None)
+    fused_count = sum(
+        len(factory.build(name="test").ugens) for factory in iterate_factories()
+    )
+    monkeypatch.setattr(SynthDef, "_fuse_ugens", staticmethod(list))
+    unfused_count = sum(
+        len(factory.build(name="test").ugens) for factory in iterate_factories()
+    )
+    record_property("unfused_count", unfused_count)
+    record_property("fused_count", fused_count)
+    assert fused_count < unfused_count
+
+
+@pytest.mark.benchmark
+@pytest.mark.flaky(reruns=5)
+def test_synthdef_scan_vs_decompile(record_property):
+    compiled_synthdefs = SynthDefCompiler.compile_synthdefs(
+        [
+            factory.build(name=f"test-{i}")
+            for i, factory in enumerate(iterate_factories())
+        ]
+    )
+    timings = {}
+    for name, function in [
+        ("scan", SynthDefDecompiler.scan_synthdefs),
+        ("decompile", SynthDefDecompiler.decompile_synthdefs),
+    ]:
+        start = time.perf_counter()
+        for _ in range(10):
+            function(compiled_synthdefs)
+        timings[name] = time.perf_counter() - start
+        record_property(name, timings[name])
+    # Reading metadata skips building UGens entirely.
+    assert timings["scan"] * 5 < timings["decompile"]
@@ -0,0 +1,91 @@
+import queue
+
+import pytest
+
+from supriya.clocks.ephemera import CallbackEvent, EventType
+from supriya.clocks.eventqueue import EventQueue
+
+
+def make_event(event_id, seconds, offset=None):
+    return CallbackEvent(
+        seconds=seconds,
+        event_type=EventType.SCHEDULE,
+        event_id=event_id,
+        measure=None,
+        offset=offset,
+        procedure=None,
+        args=None,
+        kwargs=None,
+        invocations=0,
+    )
+
+
+class Tempo:
+    def __init__(self, seconds_per_beat=0.5):
+        self.seconds_per_beat = seconds_per_beat
+
+    def __call__(self, offset):
+        return offset * self.seconds_per_beat
+
+
+def test_ordering():
+    event_queue = EventQueue(Tempo())
+    event_queue.put(make_event(0, 1.5))
+    event_queue.put(make_event(1, 0.0, offset=2.0))  # 1.0 seconds
+    event_queue.put(make_event(2, 0.5))
+    event_queue.put(make_event(3, 0.0, offset=3.0))  # 1.5 seconds
+    assert event_queue.qsize() == 4
+    assert [event_queue.get().event_id for _ in range(4)] == [2, 1, 0, 3]
+    assert event_queue.qsize() == 0
+    with pytest.raises(queue.Empty):
+        event_queue.get()
+
+
+def test_peek():
+    event_queue = EventQueue()
+    with pytest.raises(queue.Empty):
+        event_queue.peek()
+    event_queue.put(make_event(0, 1.0))
+    event_queue.put(make_event(1, 0.5))
+    assert event_queue.peek().event_id == 1
+    assert event_queue.peek().event_id == 1
+    assert event_queue.qsize() == 2
+
+
+def test_remove_and_replace():
+    event_queue = EventQueue()
+    for i in range(3):
+        event_queue.put(make_event(i, float(i)))
+    event_queue.remove(make_event(0, 0.0))
+    event_queue.remove(make_event(0, 0.0))
+    assert event_queue.qsize() == 2
+    event_queue.put(make_event(2, 0.5))
+    assert event_queue.qsize() == 2
+    assert [event_queue.get() for _ in range(2)] == [
+        make_event(2, 0.5),
+        make_event(1, 1.0),
+    ]
+
+
+def test_compaction():
+    event_queue = EventQueue()
+    events = [make_event(i, float(i)) for i in range(1000)]
+    for event in events:
+        event_queue.put(event)
+    for event in events[:900]:
+        event_queue.remove(event)
+    assert event_queue.qsize() == 100
+    assert len(event_queue._seconds_heap) < 300
+    assert event_queue.get().event_id == 900
+
+
+def test_tempo_change():
+    tempo = Tempo(seconds_per_beat=0.5)
+    event_queue = EventQueue(tempo)
+    event_queue.put(make_event(0, 1.0))
+    event_queue.put(make_event(1, 0.0, offset=4.0))
+    assert event_queue.peek().event_id == 0
+    tempo.seconds_per_beat = 0.125
+    event = event_queue.peek()
+    assert (event.event_id, event.seconds) == (1, 0.5)
+    assert event_queue.get() == event
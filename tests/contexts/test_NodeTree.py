@@ -0,0 +1,133 @@
+import random
+
+from supriya.contexts.realtime import NodeTree, Server
+from supriya.osc import OscMessage
+
+
+def get_children(node_tree, id_):
+    return list(node_tree.children(id_))
+
+
+def test_link_and_unlink():
+    node_tree = NodeTree()
+    node_tree.add_group(0)
+    node_tree.link(1, 0, -1, -1)  # only child
+    node_tree.link(2, 0, 1, -1)  # after 1
+    node_tree.link(3, 0, -1, 1)  # head
+    node_tree.link(4, 0, 1, 2)  # between 1 and 2
+    node_tree.link(5, 0, 99, -1)  # unknown sibling, tail
+    assert get_children(node_tree, 0) == [3, 1, 4, 2, 5]
+    node_tree.unlink(3)
+    node_tree.unlink(5)
+    node_tree.unlink(4)
+    assert get_children(node_tree, 0) == [1, 2]
+    node_tree.unlink(4)  # idempotent
+    node_tree.link(4, 0, 2, -1)
+    assert get_children(node_tree, 0) == [1, 2, 4]
+    assert [node_tree.previous[x] for x in (1, 2, 4)] == [-1, 1, 2]
+    assert [node_tree.next[x] for x in (1, 2, 4)] == [2, 4, -1]
+    assert (node_tree.heads[0], node_tree.tails[0]) == (1, 4)
+
+
+def test_remove_group_before_children():
+    node_tree = NodeTree()
+    node_tree.add_group(0)
+    node_tree.add_group(1)
+    node_tree.link(1, 0, -1, -1)
+    node_tree.link(2, 1, -1, -1)
+    node_tree.link(3, 1, 2, -1)
+    node_tree.remove(1)
+    assert not node_tree.is_group(1)
+    assert get_children(node_tree, 0) == []
+    node_tree.remove(2)
+    node_tree.remove(3)
+    assert 2 not in node_tree and 3 not in node_tree
+    assert not node_tree.previous and not node_tree.next
+
+
+def test_notifications_match_list_model():
+    """
+    Replay random /n_go, /n_move and /n_end notifications against both the
+    server's node tree and a naive list-based model.
+    """
+    server = Server()
+    server._node_tree.add_group(0)
+    expected = {0: []}
+    rng = random.Random(0)
+    messages = []
+    next_id = 1000
+    for _ in range(2000):
+        ids = [id_ for children in expected.values() for id_ in children]
+        action = rng.random()
+        if action < 0.5 or not ids:
+            parent_id = rng.choice(list(expected))
+            children = expected[parent_id]
+            index = rng.randint(0, len(children))
+            is_group = int(rng.random() < 0.2)
+            children.insert(index, next_id)
+            if is_group:
+                expected[next_id] = []
+            previous_id = children[index - 1] if index else -1
+            following_id = children[index + 1] if index + 1 < len(children) else -1
+            messages.append(
+                OscMessage(
+                    "/n_go", next_id, parent_id, previous_id, following_id, is_group
+                )
+            )
+            next_id += 1
+        elif action < 0.75:
+            id_ = rng.choice(ids)
+            for children in expected.values():
+                if id_ in children:
+                    children.remove(id_)
+            parents = [
+                x for x in expected if x != id_ and not is_within(expected, x, id_)
+            ]
+            parent_id = rng.choice(parents)
+            children = expected[parent_id]
+            index = rng.randint(0, len(children))
+            children.insert(index, id_)
+            previous_id = children[index - 1] if index else -1
+            following_id = children[index + 1] if index + 1 < len(children) else -1
+            messages.append(
+                OscMessage("/n_move", id_, parent_id, previous_id, following_id, 0)
+            )
+        else:
+            id_ = rng.choice([x for x in ids if not expected.get(x)])
+            for parent_id, children in expected.items():
+                if id_ in children:
+                    children.remove(id_)
+                    break
+            expected.pop(id_, None)
+            messages.append(OscMessage("/n_end", id_, parent_id, -1, -1, 0))
+    server._handle_osc_callbacks(messages)
+    for group_id, children in expected.items():
+        assert get_children(server._node_tree, group_id) == children
+    assert set(server._node_tree.parents) == {
+        id_ for children in expected.values() for id_ in children
+    }
+
+
+def is_within(expected, id_, ancestor_id):
+    pending = list(expected.get(ancestor_id, []))
+    while pending:
+        child_id = pending.pop()
+        if child_id == id_:
+            return True
+        pending.extend(expected.get(child_id, []))
+    return False
+
+
+def test_notifications_received_together():
+    server = Server()
+    server._node_tree.add_group(1)
+    server.osc_protocol._process_command_queue()
+    datagrams = [
+        OscMessage("/n_go", id_, 1, id_ - 1 if id_ > 1000 else -1, -1, 0).to_datagram()
+        for id_ in range(1000, 1004)
+    ]
+    calls = server.osc_protocol._receive(datagrams)
+    assert [procedure for procedure, _ in calls] == [server._handle_osc_callbacks]
+    for procedure, messages in calls:
+        procedure(messages)
+    assert get_children(server._node_tree, 1) == [1000, 1001, 1002, 1003]
@@ -6,6 +6,7 @@ import pytest
 from supriya import assets
 from supriya.contexts.errors import MomentClosed
 from supriya.contexts.nonrealtime import Score
+from supriya.contexts.requests import SetBufferRange
 from supriya.osc import OscBundle, OscMessage
 
 
@@ -399,6 +400,36 @@ def test_set_buffer_range(context):
     ]
 
 
+def test_set_buffer_range_array(context):
+    numpy = pytest.importorskip("numpy")
+    values = numpy.linspace(0.0, 1.0, 300, dtype=numpy.float32)
+    with context.at(0):
+        buffer = context.add_buffer(channel_count=1, frame_count=1024)
+        buffer.set_range(0, (0.5, 0.75))
+        buffer.set_range(2, (0.25,))
+        buffer.set_range(4, values)
+    bundle = list(context.iterate_osc_bundles())[0]
+    assert bundle.contents == (
+        OscMessage("/b_alloc", 0, 1024, 1),
+        # small ranges merge, but large ones stay apart
+        OscMessage("/b_setn", 0, 0, 2, 0.5, 0.75, 2, 1, 0.25),
+        OscMessage("/b_setn", 0, 4, 300, *values.tolist()),
+    )
+    # arrays encode without passing through per-value contents
+    message = SetBufferRange(buffer_id=0, items=[(4, values)]).to_osc()
+    assert (
+        message.to_datagram()
+        == OscMessage("/b_setn", 0, 4, 300, *values.tolist()).to_datagram()
+    )
+    assert message._contents is None
+    # arrays encode exactly as their equivalent values do
+    message = bundle.contents[-1]
+    assert (
+        message.to_datagram()
+        == OscMessage(message.address, *message.contents).to_datagram()
+    )
+
+
 def test_write_buffer(context, tmp_path):
     with context.at(0):
         buffer_a = context.add_buffer(channel_count=1, frame_count=23)
@@ -3,7 +3,8 @@ import pytest
 from supriya import default
 from supriya.contexts.nonrealtime import Score
 from supriya.osc import OscBundle, OscMessage
-from supriya.synthdefs import SynthDefCompiler
+from supriya.synthdefs import SynthDefBuilder, SynthDefCompiler
+from supriya.ugens import Out, SinOsc
 
 
 @pytest.fixture
@@ -286,3 +287,31 @@ def test_unpause_node(context):
         ),
         OscBundle(contents=(OscMessage("/n_run", 1001, 1, 1002, 1),), timestamp=1.23),
     ]
+
+
+def test_add_synth_variant(context):
+    with SynthDefBuilder(
+        frequency=440, amplitude=0.1, variants={"low": {"frequency": 220}}
+    ) as builder:
+        Out.ar(bus=0, source=SinOsc.ar(frequency=builder["frequency"]))
+    synthdef = builder.build(name="test")
+    with context.at(0):
+        context.add_synthdefs(synthdef)
+        context.add_synth(synthdef, variant="low")
+        # settings matching the variant are elided, those matching the
+        # defaults aren't
+        context.add_synth(synthdef, variant="low", frequency=220, amplitude=0.1)
+        context.add_synth(synthdef, variant="low", frequency=440)
+        with pytest.raises(ValueError):
+            context.add_synth(synthdef, variant="high")
+    assert list(context.iterate_osc_bundles()) == [
+        OscBundle(
+            contents=(
+                OscMessage("/d_recv", synthdef.compile()),
+                OscMessage("/s_new", "test.low", 1000, 0, 0),
+                OscMessage("/s_new", "test.low", 1001, 0, 0),
+                OscMessage("/s_new", "test.low", 1002, 0, 0, "frequency", 440.0),
+            ),
+            timestamp=0.0,
+        ),
+    ]
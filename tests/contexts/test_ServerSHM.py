@@ -2,6 +2,14 @@ import platform
 
 import pytest
 
+from supriya.contexts import Server
+from supriya.contexts.requests import (
+    AllocateBuffer,
+    FillControlBusRange,
+    SetControlBus,
+    SetControlBusRange,
+)
+
 
 @pytest.mark.skipif(
     platform.system() == "Windows", reason="SHM not built under Windows"
@@ -18,3 +26,57 @@ def test_shared_memory(server):
         bus.set(value)
         assert bus.get() == shared_memory[int(bus)] == value
     assert shared_memory[:2] == [0.5, 0]
+
+
+@pytest.mark.skipif(
+    platform.system() == "Windows", reason="SHM not built under Windows"
+)
+def test_shared_memory_bulk(server):
+    numpy = pytest.importorskip("numpy")
+    shared_memory = server.shared_memory
+    assert shared_memory is not None
+    assert len(shared_memory) == server.options.control_bus_channel_count
+    bus_group = server.add_bus_group(count=4)
+    shared_memory[0:4] = [0.25, 0.5, 0.75, 1.0]
+    assert bus_group[0].get_range(count=4) == (0.25, 0.5, 0.75, 1.0)
+    array = shared_memory.as_array()
+    assert array.dtype == numpy.float32
+    assert not array.flags["OWNDATA"]
+    array[1] = 2.0
+    assert bus_group[1].get() == 2.0
+    shared_memory[2:4] = numpy.array([3.0, 4.0], dtype=numpy.float32)
+    view = shared_memory.as_memoryview()
+    assert view.format == "f"
+    assert view[0:4].tolist() == [0.25, 2.0, 3.0, 4.0]
+    with pytest.raises(ValueError):
+        shared_memory[0:4] = [1.0]
+    with pytest.raises(ValueError):
+        shared_memory[len(shared_memory)] = 1.0
+
+
+def test_shared_memory_pending_writes():
+    server = Server()
+    server._shm = [0.0] * 16
+    server._apply_completions(
+        [
+            (SetControlBus(items=[(2, 0.5)]), None),
+            (
+                AllocateBuffer(
+                    buffer_id=0,
+                    frame_count=8,
+                    on_completion=SetControlBusRange(items=[(8, [1.0, 2.0])]),
+                ),
+                None,
+            ),
+        ]
+    )
+    # Buses with unconfirmed writes aren't read from shared memory.
+    assert server._read_shm(0, 2) == (0.0, 0.0)
+    assert server._read_shm(2) is None
+    assert server._read_shm(0, 4) is None
+    assert server._read_shm(9) is None
+    write_count = server._shm_write_count
+    server._apply_completions([(FillControlBusRange(items=[(12, 2, 0.25)]), None)])
+    server._confirm_bus_writes(write_count)
+    assert server._read_shm(0, 12) == (0.0,) * 12
+    assert server._read_shm(13) is None
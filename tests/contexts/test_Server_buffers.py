@@ -313,6 +313,31 @@ async def test_get_buffer(context):
     ]
 
 
+@pytest.mark.asyncio
+async def test_get_buffer_array(context, monkeypatch):
+    numpy = pytest.importorskip("numpy")
+    buffer = context.add_buffer(channel_count=2, frame_count=40000)
+    values = numpy.linspace(-1.0, 1.0, 80000, dtype=numpy.float32)
+    await get(buffer.set_array(0, values))
+    # local servers round-trip through a memory-mapped file
+    array = await get(buffer.get_array())
+    assert array.dtype == numpy.float32
+    assert (array == values).all()
+    assert (await get(buffer.get_array(3, 5)) == values[3:8]).all()
+    # remote servers transfer in chunks
+    monkeypatch.setattr(context, "_is_local", lambda: False)
+    with context.osc_protocol.capture() as transcript:
+        array = await get(buffer.get_array(1, 30000, window_size=4))
+    assert (array == values[1:30001]).all()
+    requests = [
+        message
+        for bundle in transcript.filtered(received=False, status=False)
+        for message in getattr(bundle, "contents", [bundle])
+    ]
+    assert [message.address for message in requests].count("/b_getn") > 1
+    assert await get(buffer.get_range(0, 30000)) == tuple(values[:30000].tolist())
+
+
 @pytest.mark.asyncio
 async def test_get_buffer_range(context):
     buffer = context.add_buffer(channel_count=1, frame_count=512)
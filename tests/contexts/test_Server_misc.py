@@ -10,9 +10,10 @@ from uqbar.strings import normalize
 from supriya import default, scsynth
 from supriya.contexts.entities import Group
 from supriya.contexts.realtime import AsyncServer, Server
-from supriya.contexts.responses import StatusInfo, VersionInfo
+from supriya.contexts.requests import GetControlBus, QueryNode
+from supriya.contexts.responses import NodeInfo, StatusInfo, VersionInfo
 from supriya.exceptions import ServerOffline
-from supriya.osc import OscMessage
+from supriya.osc import OscBundle, OscMessage
 
 
 async def get(x):
@@ -51,6 +52,51 @@ async def test_default_group(context):
     assert context.default_group.id_ == context.client_id + 1
 
 
+@pytest.mark.asyncio
+async def test_gather(context):
+    bus_group = context.add_bus_group(count=300)
+    for i, bus in enumerate(bus_group):
+        bus.set(i / 4)
+    requests = [GetControlBus(bus_ids=[bus.id_]) for bus in bus_group]
+    requests.append(QueryNode(node_ids=[context.default_group.id_]))
+    requests.append(QueryNode(node_ids=[666]))  # fails, without a response
+    with context.osc_protocol.capture() as transcript:
+        responses = await get(context.gather(requests))
+    assert [response.items[0] for response in responses[:300]] == [
+        (bus.id_, i / 4) for i, bus in enumerate(bus_group)
+    ]
+    assert isinstance(responses[300], NodeInfo)
+    assert responses[300].node_id == context.default_group.id_
+    assert responses[301] is None
+    sent = transcript.filtered(received=False, status=False)
+    assert all(isinstance(bundle, OscBundle) for bundle in sent)
+    assert [message.address for bundle in sent for message in bundle.contents].count(
+        "/sync"
+    ) == 3  # one per window of requests
+
+
+@pytest.mark.asyncio
+async def test_moment_bundle_splitting(context):
+    context.set_maximum_bundle_size(512)
+    with context.osc_protocol.capture() as transcript:
+        with context.at(1.0) as moment:
+            for i in range(50):
+                context.add_synth(default, amplitude=i / 100)
+    bundles = transcript.filtered(received=False, status=False)
+    assert moment.bundle_count == len(bundles) > 1
+    assert all(isinstance(bundle, OscBundle) for bundle in bundles)
+    assert len({bundle.timestamp for bundle in bundles}) == 1
+    assert all(len(bundle.to_datagram()) <= 512 for bundle in bundles)
+    assert [message.address for bundle in bundles for message in bundle.contents] == [
+        "/s_new"
+    ] * 50
+    context.set_maximum_bundle_size(None)
+    with context.at(1.0) as moment:
+        for i in range(50):
+            context.add_synth(default, amplitude=i / 100)
+    assert moment.bundle_count == 1
+
+
 @pytest.mark.asyncio
 async def test_query_status(context):
     assert isinstance(await get(context.query_status()), StatusInfo)
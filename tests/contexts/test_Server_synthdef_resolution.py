@@ -0,0 +1,74 @@
+from supriya.contexts.realtime import Server
+from supriya.contexts.requests import (
+    FreeNode,
+    NewGroup,
+    NewSynth,
+    ReceiveSynthDefs,
+    SetNodeControl,
+)
+from supriya.osc import OscBundle, OscMessage
+from supriya.synthdefs import SynthDefBuilder, SynthDefCompiler
+from supriya.ugens import Out, SinOsc
+
+
+def build_synthdefs():
+    with SynthDefBuilder(frequency=440) as builder:
+        Out.ar(bus=0, source=SinOsc.ar(frequency=builder["frequency"]))
+    return [builder.build(name=name) for name in ("synthdef-a", "synthdef-b")]
+
+
+def test_deferred_requests_keep_order():
+    synthdef_a, synthdef_b = build_synthdefs()
+    server = Server()
+    requests = server._resolve_synthdefs(
+        [
+            FreeNode(node_ids=[999]),
+            NewSynth(
+                synthdef=synthdef_a,
+                synth_id=1000,
+                add_action=0,
+                target_node_id=1,
+            ),
+            SetNodeControl(node_id=1000, items=[("frequency", 220.0)]),
+            NewGroup(items=[(1001, 2, 1000)]),
+            NewSynth(
+                synthdef=synthdef_b,
+                synth_id=1002,
+                add_action=0,
+                target_node_id=1001,
+            ),
+            ReceiveSynthDefs(synthdefs=[synthdef_a]),
+        ]
+    )
+    # Everything from the first deferred synth onwards waits on one upload.
+    assert [request.to_osc() for request in requests] == [
+        OscMessage("/n_free", 999),
+        OscMessage(
+            "/d_recv",
+            SynthDefCompiler.compile_synthdefs([synthdef_a, synthdef_b]),
+            OscBundle(
+                contents=(
+                    OscMessage("/s_new", "synthdef-a", 1000, 0, 1),
+                    OscMessage("/n_set", 1000, "frequency", 220.0),
+                    OscMessage("/g_new", 1001, 2, 1000),
+                    OscMessage("/s_new", "synthdef-b", 1002, 0, 1001),
+                )
+            ),
+        ),
+    ]
+    # Once in flight, neither SynthDef is uploaded again.
+    requests = server._resolve_synthdefs(
+        [
+            NewSynth(
+                synthdef=synthdef_a,
+                synth_id=1003,
+                add_action=0,
+                target_node_id=1,
+            ),
+            SetNodeControl(node_id=1003, items=[("frequency", 330.0)]),
+        ]
+    )
+    assert [request.to_osc() for request in requests] == [
+        OscMessage("/s_new", "synthdef-a", 1003, 0, 1),
+        OscMessage("/n_set", 1003, "frequency", 330.0),
+    ]
@@ -50,11 +50,11 @@ async def test_add_synthdefs(context, synthdefs):
             context.add_synthdefs()
         # /d_recv
         context.add_synthdefs(synthdefs[0])
-        # multiples
+        # multiples, skipping those already uploaded
         context.add_synthdefs(*synthdefs)
         # completion without moment via on_completion lambda succeeds
         context.add_synthdefs(synthdefs[1], on_completion=lambda ctx: ctx.add_group())
-        # completion without moment errors
+        # completion without moment errors, and nothing is left to upload
         with pytest.raises(MomentClosed):
             with context.add_synthdefs(synthdefs[2]):
                 context.add_group()
@@ -64,11 +64,10 @@ async def test_add_synthdefs(context, synthdefs):
                 context.add_group()
     assert transcript.filtered(received=False, status=False) == [
         OscMessage("/d_recv", compiled([synthdefs[0]])),
-        OscMessage("/d_recv", compiled(synthdefs)),
+        OscMessage("/d_recv", compiled(synthdefs[1:])),
         OscMessage(
             "/d_recv", compiled([synthdefs[1]]), OscMessage("/g_new", 1000, 0, 1)
         ),
-        OscMessage("/d_recv", compiled([synthdefs[2]])),
         OscBundle(
             contents=[
                 OscMessage(
@@ -82,6 +81,36 @@ async def test_add_synthdefs(context, synthdefs):
     ]
 
 
+@pytest.mark.asyncio
+async def test_add_synthdefs_registry(context, synthdefs):
+    def compiled(x):
+        return SynthDefCompiler.compile_synthdefs(x)
+
+    assert synthdefs[0] not in context
+    context.add_synthdefs(*synthdefs[:2])
+    await get(context.sync())
+    assert synthdefs[0] in context
+    assert synthdefs[1] in context
+    with context.osc_protocol.capture() as transcript:
+        # uploaded synthdefs are skipped
+        context.add_synthdefs(*synthdefs[:2])
+        # unknown synthdefs are uploaded ahead of their first synth
+        context.add_synth(synthdefs[2], frequency=220)
+    assert transcript.filtered(received=False, status=False) == [
+        OscMessage(
+            "/d_recv",
+            compiled([synthdefs[2]]),
+            OscMessage("/s_new", "synthdef-c", 1000, 0, 1, "frequency", 220.0),
+        ),
+    ]
+    await get(context.sync())
+    assert synthdefs[2] in context
+    context.free_synthdefs(synthdefs[0])
+    assert synthdefs[0] not in context
+    context.free_all_synthdefs()
+    assert synthdefs[1] not in context
+
+
 @pytest.mark.asyncio
 async def test_free_synthdefs(context, synthdefs):
     with context.osc_protocol.capture() as transcript:
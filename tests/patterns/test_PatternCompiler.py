@@ -0,0 +1,83 @@
+import functools
+
+import pytest
+
+from supriya.assets.synthdefs import default
+from supriya.clocks import OfflineClock
+from supriya.contexts import Score
+from supriya.patterns import (
+    BusPattern,
+    EventPattern,
+    FxPattern,
+    GroupPattern,
+    MonoEventPattern,
+    ParallelPattern,
+    PatternCompiler,
+    PatternPlayer,
+    SequencePattern,
+)
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        EventPattern(frequency=SequencePattern([440, 550, 660])),
+        MonoEventPattern(frequency=SequencePattern([440, 550, 660])),
+        EventPattern(
+            delta=SequencePattern([0.25, 0.5, 0.125], None),
+            duration=SequencePattern([1.5, 0.25], None),
+            frequency=SequencePattern([440, 550, 660, 770], 4),
+        ),
+        ParallelPattern(
+            [
+                EventPattern(frequency=SequencePattern([440, 550, 660])),
+                MonoEventPattern(delta=0.5, frequency=SequencePattern([777, 888, 999])),
+            ]
+        ),
+        GroupPattern(
+            BusPattern(MonoEventPattern(frequency=SequencePattern([440, 550, 660])))
+        ),
+        FxPattern(
+            EventPattern(frequency=SequencePattern([440, 550, 660])),
+            default,
+            amplitude=0.5,
+        ),
+    ],
+)
+@pytest.mark.parametrize("at", [0.0, 1.0])
+@pytest.mark.parametrize("until", [None, 0.0, 0.5, 1.5, 2.0, 10.0])
+@pytest.mark.parametrize("beats_per_minute", [60.0, 120.0])
+def test_to_score(pattern, at, until, beats_per_minute):
+    expected_score = Score()
+    clock = OfflineClock()
+    clock.start = functools.partial(clock.start, beats_per_minute=beats_per_minute)
+    PatternPlayer(pattern=pattern, context=expected_score, clock=clock).play(
+        at=at, until=until
+    )
+    actual_score = pattern.to_score(
+        Score(), at=at, beats_per_minute=beats_per_minute, until=until
+    )
+    assert list(actual_score.iterate_osc_bundles()) == list(
+        expected_score.iterate_osc_bundles()
+    )
+
+
+def test_target_node():
+    pattern = EventPattern(frequency=SequencePattern([440, 550]))
+    expected_score, actual_score = Score(), Score()
+    with expected_score.at(0):
+        expected_group = expected_score.add_group()
+    with actual_score.at(0):
+        actual_group = actual_score.add_group()
+    pattern.play(
+        context=expected_score, clock=OfflineClock(), target_node=expected_group
+    )
+    PatternCompiler(pattern, actual_score, target_node=actual_group).compile()
+    assert list(actual_score.iterate_osc_bundles()) == list(
+        expected_score.iterate_osc_bundles()
+    )
+
+
+def test_beats_per_minute():
+    with pytest.raises(ValueError):
+        PatternCompiler(EventPattern(), Score(), beats_per_minute=0)
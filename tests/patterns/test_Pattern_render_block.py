@@ -0,0 +1,163 @@
+import itertools
+import random
+
+import pytest
+
+from supriya.patterns import (
+    ChoicePattern,
+    EventPattern,
+    MonoEventPattern,
+    RandomPattern,
+    SeedPattern,
+    SequencePattern,
+    ShufflePattern,
+)
+
+pytest.importorskip("numpy")
+
+
+def iterate(pattern, count):
+    return list(itertools.islice(pattern, count))
+
+
+@pytest.mark.parametrize(
+    "pattern, is_blockwise",
+    [
+        (SeedPattern(ChoicePattern([1, 2, 3], iterations=None) * 10), True),
+        (
+            SeedPattern(
+                ChoicePattern([1, 2, 3], iterations=5, weights=[1, 0, 2])
+                + RandomPattern(-1, 1)
+            ),
+            True,
+        ),
+        (
+            SeedPattern(
+                ShufflePattern([1, 2, 3, 4, 5], iterations=None) - RandomPattern(3, 2),
+                seed=7,
+            ),
+            True,
+        ),
+        (SeedPattern(ShufflePattern(["a", "b", "c"], iterations=3)), True),
+        (
+            SeedPattern(-abs(RandomPattern(-3, 3)) ** 2 // 0.5 % 3, seed=123456789),
+            True,
+        ),
+        (RandomPattern() * ChoicePattern([0.5, 1.5], iterations=None), True),
+        (SequencePattern([1, 2, 3], 4) ** SequencePattern([-1, 2], None), True),
+        (
+            SeedPattern(
+                SequencePattern([1, 2])
+                + SeedPattern(RandomPattern(), seed=3)
+                + RandomPattern(),
+                seed=5,
+            ),
+            True,
+        ),
+        (
+            SeedPattern(
+                ChoicePattern([1, 2, 3], iterations=None, forbid_repetitions=True)
+                + RandomPattern()
+            ),
+            False,
+        ),
+        (SequencePattern([(1, 2), 3], None), False),
+        (SequencePattern([SequencePattern([1, 2]), 3], 2), False),
+    ],
+)
+@pytest.mark.parametrize("count", [0, 1, 7, 500])
+def test_render_block(pattern, is_blockwise, count):
+    assert (pattern._get_block_draw_counts(count) is not None) == is_blockwise
+    random.seed(0)
+    actual = pattern.render_block(count)
+    random.seed(0)
+    expected = iterate(pattern, count)
+    assert len(actual) == len(expected)
+    assert all(x == y for x, y in zip(actual, expected))
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        SequencePattern([1, 2]) * 2**62,
+        SequencePattern([2, 3]) ** 70,
+        -SequencePattern([-(2**63), 1]),
+        SequencePattern([True, False]) + True,
+        ~SequencePattern([True, False]),
+        SequencePattern([1e308, 1.0]) * 10,
+        SeedPattern(RandomPattern() * SequencePattern([10, 20], None) ** 20),
+    ],
+)
+def test_render_block_overflow(pattern):
+    assert pattern._get_block_draw_counts(2) is not None
+    random.seed(0)
+    actual = pattern.render_block(2)
+    random.seed(0)
+    expected = iterate(pattern, 2)
+    assert list(actual) == expected
+    assert [type(x) for x in actual.tolist()] == [type(x) for x in expected]
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        SequencePattern([1, 2, 3]) / 0,
+        SequencePattern([1, 2, 3]) // SequencePattern([1, 0]),
+        SequencePattern([1.5, 2.5]) % 0,
+    ],
+)
+def test_render_block_zero_division(pattern):
+    with pytest.raises(ZeroDivisionError):
+        iterate(pattern, 3)
+    with pytest.raises(ZeroDivisionError):
+        pattern.render_block(3)
+
+
+@pytest.mark.parametrize("pattern_class", [EventPattern, MonoEventPattern])
+def test_render_block_events(pattern_class):
+    pattern = SeedPattern(
+        pattern_class(
+            amplitude=ChoicePattern([0.1, 0.2], iterations=None, weights=[3, 1]),
+            delta=ShufflePattern([0.25, 0.5, 0.75], iterations=None),
+            frequency=RandomPattern(100, 1000),
+            pan=SequencePattern([-1, 0, 1], 40),
+            synthdef="test",
+        )
+    )
+    columns = pattern.render_block(200)
+    events = iterate(pattern, 200)
+    assert sorted(columns) == ["amplitude", "delta", "frequency", "pan", "synthdef"]
+    assert len(events) == 120
+    for key, column in columns.items():
+        assert list(column) == [
+            vars(event)[key] if key in vars(event) else event.kwargs[key]
+            for event in events
+        ]
+
+
+def test_seeded_block():
+    pattern = SequencePattern([0])
+    rng = pattern._get_seeded_rng(seed=99)
+    assert list(pattern._get_seeded_block(99, 5000)) == [next(rng) for _ in range(5000)]
+
+
+def test_to_arrays():
+    pattern = EventPattern(
+        delta=SequencePattern([0.25, 0.5], None), frequency=RandomPattern(100, 1000)
+    )
+    with pytest.raises(ValueError):
+        pattern.to_arrays()
+    with pytest.raises(ValueError):
+        RandomPattern().to_arrays(count=1)
+    random.seed(0)
+    arrays = pattern.to_arrays(until=3000)
+    random.seed(0)
+    events = iterate(pattern, 8000)
+    assert len(arrays["offset"]) == 8000
+    assert list(arrays["frequency"]) == [event.kwargs["frequency"] for event in events]
+    assert arrays["offset"][-1] == 2999.5
+    arrays = pattern.to_arrays(count=5, until=1.0)
+    assert list(arrays["offset"]) == [0.0, 0.25, 0.75]
+    arrays = EventPattern(frequency=SequencePattern([440, 550])).to_arrays()
+    assert list(arrays["delta"]) == [1.0, 1.0]
+    assert list(arrays["offset"]) == [0.0, 1.0]
@@ -0,0 +1,85 @@
+from supriya import ugens
+from supriya.synthdefs import Parameter, SynthDefBuilder, SynthDefCache
+
+
+def build(frequency=440, name=None):
+    with SynthDefBuilder(
+        frequency=Parameter(value=frequency, range_=(20, 20000), unit="Hz"),
+        name=name,
+    ) as builder:
+        ugens.Out.ar(bus=0, source=ugens.SinOsc.ar(frequency=builder["frequency"]))
+    return builder
+
+
+def test_hits_and_misses():
+    cache = SynthDefCache()
+    synthdef = cache.build(build())
+    assert cache.build(build()) is synthdef
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.build(build(frequency=220)) is not synthdef
+    assert cache.build(build(name="foo")) is not synthdef
+    assert cache.build(build(), optimize=False) is not synthdef
+    assert (cache.hits, cache.misses) == (1, 4)
+    assert len(cache) == 4
+
+
+def test_equivalence():
+    cache = SynthDefCache()
+    assert cache.build(build()).compile() == build()._build().compile()
+    assert cache.get_key(build()) == cache.get_key(build())
+    assert cache.get_key(build()) != cache.get_key(build(frequency=220))
+
+
+def test_maximum_size():
+    cache = SynthDefCache(maximum_size=2)
+    keys = [cache.get_key(build(frequency=frequency)) for frequency in (1, 2, 3)]
+    for frequency in (1, 2, 3):
+        cache.build(build(frequency=frequency))
+    assert len(cache) == 2
+    assert keys[0] not in cache
+    assert keys[1] in cache and keys[2] in cache
+
+
+def test_invalidate():
+    cache = SynthDefCache()
+    key = cache.get_key(build())
+    cache.build(build())
+    cache.build(build(frequency=220))
+    cache.invalidate(key)
+    assert key not in cache
+    assert len(cache) == 1
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_persistent(tmp_path):
+    cache = SynthDefCache(persistent=True, directory_path=tmp_path)
+    key = cache.get_key(build())
+    synthdef = cache.build(build())
+    assert (tmp_path / f"{key}.scsyndef").exists()
+    # Drop the in-memory entry only, as a fresh process would see it.
+    cache._entries.clear()
+    restored = cache.build(build())
+    assert restored is not synthdef
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert restored.compile() == synthdef.compile()
+    assert restored.anonymous_name == synthdef.anonymous_name
+    assert restored.parameters["frequency"].range_ == (
+        synthdef.parameters["frequency"].range_
+    )
+    assert restored.parameters["frequency"].unit == "Hz"
+    cache.invalidate()
+    assert not list(tmp_path.glob("*.scsyndef"))
+
+
+def test_persistent_name(tmp_path):
+    builder = build()
+    assert builder.name is None
+    synthdef = SynthDefCache(persistent=True, directory_path=tmp_path).build(
+        builder, name="foo"
+    )
+    cache = SynthDefCache(persistent=True, directory_path=tmp_path)
+    restored = cache.build(build(), name="foo")
+    assert (cache.hits, cache.misses) == (1, 0)
+    assert restored.name == synthdef.name == "foo"
+    assert restored.compile() == synthdef.compile()
@@ -3,9 +3,12 @@ import os
 import platform
 
 import pytest
+from uqbar.strings import normalize
 
 import supriya.synthdefs
 import supriya.ugens
+from supriya.enums import BinaryOperator, UnaryOperator
+from supriya.ugens import UGen
 
 
 @pytest.fixture
@@ -79,3 +82,309 @@ def test_SynthDefCompiler_optimization_01_supriya_vs_sclang(py_synthdef):
     sc_compiled_synthdef = bytes(sc_synthdef.compile())
     py_compiled_synthdef = py_synthdef.compile()
     assert py_compiled_synthdef == sc_compiled_synthdef
+
+
+@pytest.fixture
+def folded_synthdef_builder():
+    with supriya.synthdefs.SynthDefBuilder(frequency=440) as builder:
+        ratio = UGen._compute_unary_op(12.0, UnaryOperator.SEMITONES_TO_RATIO)
+        offset = UGen._compute_binary_op(ratio, 3.0, BinaryOperator.SUBTRACTION)
+        source = builder["frequency"] * ratio / 4 + offset
+        supriya.ugens.Out.kr(bus=0, source=source)
+    return builder
+
+
+def test_SynthDefCompiler_optimization_02_constant_folding(folded_synthdef_builder):
+    py_synthdef = folded_synthdef_builder.build("folded")
+    assert str(py_synthdef) == normalize(
+        """
+        synthdef:
+            name: folded
+            ugens:
+            -   Control.kr: null
+            -   BinaryOpUGen(MULTIPLICATION).kr:
+                    left: Control.kr[0:frequency]
+                    right: 2.0
+            -   MulAdd.kr:
+                    source: BinaryOpUGen(MULTIPLICATION).kr[0]
+                    multiplier: 0.25
+                    addend: -1.0
+            -   Out.kr:
+                    bus: 0.0
+                    source[0]: MulAdd.kr[0]
+        """
+    )
+    # fmt: off
+    test_compiled_synthdef = bytes(
+        b'SCgf'
+        b'\x00\x00\x00\x02'
+        b'\x00\x01'
+            b'\x06folded'
+                b'\x00\x00\x00\x04'
+                    b'@\x00\x00\x00'
+                    b'>\x80\x00\x00'
+                    b'\xbf\x80\x00\x00'
+                    b'\x00\x00\x00\x00'
+                b'\x00\x00\x00\x01'
+                    b'C\xdc\x00\x00'
+                b'\x00\x00\x00\x01'
+                    b'\tfrequency'
+                        b'\x00\x00\x00\x00'
+                b'\x00\x00\x00\x04'
+                    b'\x07Control'
+                        b'\x01'
+                        b'\x00\x00\x00\x00'
+                        b'\x00\x00\x00\x01'
+                        b'\x00\x00'
+                            b'\x01'
+                    b'\x0cBinaryOpUGen'
+                        b'\x01'
+                        b'\x00\x00\x00\x02'
+                        b'\x00\x00\x00\x01'
+                        b'\x00\x02'
+                            b'\x00\x00\x00\x00'
+                                b'\x00\x00\x00\x00'
+                            b'\xff\xff\xff\xff'
+                                b'\x00\x00\x00\x00'
+                            b'\x01'
+                    b'\x06MulAdd'
+                        b'\x01'
+                        b'\x00\x00\x00\x03'
+                        b'\x00\x00\x00\x01'
+                        b'\x00\x00'
+                            b'\x00\x00\x00\x01'
+                                b'\x00\x00\x00\x00'
+                            b'\xff\xff\xff\xff'
+                                b'\x00\x00\x00\x01'
+                            b'\xff\xff\xff\xff'
+                                b'\x00\x00\x00\x02'
+                            b'\x01'
+                    b'\x03Out'
+                        b'\x01'
+                        b'\x00\x00\x00\x02'
+                        b'\x00\x00\x00\x00'
+                        b'\x00\x00'
+                            b'\xff\xff\xff\xff'
+                                b'\x00\x00\x00\x03'
+                            b'\x00\x00\x00\x02'
+                                b'\x00\x00\x00\x00'
+                b'\x00\x00'
+    )
+    # fmt: on
+    assert py_synthdef.compile() == test_compiled_synthdef
+
+
+def test_SynthDefCompiler_optimization_03_unoptimized(folded_synthdef_builder):
+    py_synthdef = folded_synthdef_builder.build("unfolded", optimize=False)
+    assert str(py_synthdef) == normalize(
+        """
+        synthdef:
+            name: unfolded
+            ugens:
+            -   Control.kr: null
+            -   UnaryOpUGen(SEMITONES_TO_RATIO).ir:
+                    source: 12.0
+            -   BinaryOpUGen(SUBTRACTION).ir:
+                    left: UnaryOpUGen(SEMITONES_TO_RATIO).ir[0]
+                    right: 3.0
+            -   BinaryOpUGen(MULTIPLICATION).kr:
+                    left: Control.kr[0:frequency]
+                    right: UnaryOpUGen(SEMITONES_TO_RATIO).ir[0]
+            -   BinaryOpUGen(FLOAT_DIVISION).kr:
+                    left: BinaryOpUGen(MULTIPLICATION).kr[0]
+                    right: 4.0
+            -   BinaryOpUGen(ADDITION).kr:
+                    left: BinaryOpUGen(FLOAT_DIVISION).kr[0]
+                    right: BinaryOpUGen(SUBTRACTION).ir[0]
+            -   Out.kr:
+                    bus: 0.0
+                    source[0]: BinaryOpUGen(ADDITION).kr[0]
+        """
+    )
+
+
+def test_SynthDefCompiler_optimization_04_identities():
+    with supriya.synthdefs.SynthDefBuilder(amplitude=0.1) as builder:
+        silence = UGen._compute_unary_op(0.0, UnaryOperator.SIN)
+        # Audio-rate ugens are never replaced by constants
+        source = supriya.ugens.SinOsc.ar(frequency=440 / 3) * silence
+        supriya.ugens.Out.ar(bus=0, source=source)
+        amplitude = builder["amplitude"] * silence + builder["amplitude"]
+        # Random operators are never folded
+        noise = UGen._compute_unary_op(1.0, UnaryOperator.RAND)
+        supriya.ugens.Out.kr(bus=0, source=[amplitude, -(-noise)])
+    py_synthdef = builder.build("identities")
+    assert str(py_synthdef) == normalize(
+        """
+        synthdef:
+            name: identities
+            ugens:
+            -   Control.kr: null
+            -   SinOsc.ar:
+                    frequency: 146.66666666666666
+                    phase: 0.0
+            -   BinaryOpUGen(MULTIPLICATION).ar:
+                    left: SinOsc.ar[0]
+                    right: 0.0
+            -   Out.ar:
+                    bus: 0.0
+                    source[0]: BinaryOpUGen(MULTIPLICATION).ar[0]
+            -   UnaryOpUGen(RAND).ir:
+                    source: 1.0
+            -   Out.kr:
+                    bus: 0.0
+                    source[0]: Control.kr[0:amplitude]
+                    source[1]: UnaryOpUGen(RAND).ir[0]
+        """
+    )
+
+
+def test_SynthDefCompiler_optimization_05_negative_one():
+    source = supriya.ugens.SinOsc.ar()
+    for ugen in (-1 * source, source * -1):
+        assert isinstance(ugen, supriya.ugens.UnaryOpUGen)
+        assert ugen.operator == UnaryOperator.NEGATIVE
+
+
+def test_SynthDefCompiler_optimization_06_common_subexpressions():
+    with supriya.synthdefs.SynthDefBuilder(amplitude=0.1, frequency=440) as builder:
+        sines = supriya.ugens.SinOsc.ar(frequency=[builder["frequency"]] * 2)
+        gains = [builder["amplitude"] * 0.5, builder["amplitude"] * 0.5]
+        # Noise and random operators are never merged
+        noises = [supriya.ugens.LFNoise1.kr(), supriya.ugens.LFNoise1.kr()]
+        rands = [UGen._compute_unary_op(1.0, UnaryOperator.RAND) for _ in range(2)]
+        supriya.ugens.Out.ar(
+            bus=0,
+            source=[
+                sine * gain * noise * rand
+                for sine, gain, noise, rand in zip(sines, gains, noises, rands)
+            ],
+        )
+    assert len(builder.build("cse", optimize=False).ugens) == 16
+    py_synthdef = builder.build("cse")
+    assert str(py_synthdef) == normalize(
+        """
+        synthdef:
+            name: cse
+            ugens:
+            -   Control.kr: null
+            -   SinOsc.ar:
+                    frequency: Control.kr[1:frequency]
+                    phase: 0.0
+            -   BinaryOpUGen(MULTIPLICATION).kr:
+                    left: Control.kr[0:amplitude]
+                    right: 0.5
+            -   BinaryOpUGen(MULTIPLICATION).ar/0:
+                    left: SinOsc.ar[0]
+                    right: BinaryOpUGen(MULTIPLICATION).kr[0]
+            -   LFNoise1.kr/0:
+                    frequency: 500.0
+            -   BinaryOpUGen(MULTIPLICATION).ar/1:
+                    left: BinaryOpUGen(MULTIPLICATION).ar/0[0]
+                    right: LFNoise1.kr/0[0]
+            -   LFNoise1.kr/1:
+                    frequency: 500.0
+            -   BinaryOpUGen(MULTIPLICATION).ar/2:
+                    left: BinaryOpUGen(MULTIPLICATION).ar/0[0]
+                    right: LFNoise1.kr/1[0]
+            -   UnaryOpUGen(RAND).ir/0:
+                    source: 1.0
+            -   BinaryOpUGen(MULTIPLICATION).ar/3:
+                    left: BinaryOpUGen(MULTIPLICATION).ar/1[0]
+                    right: UnaryOpUGen(RAND).ir/0[0]
+            -   UnaryOpUGen(RAND).ir/1:
+                    source: 1.0
+            -   BinaryOpUGen(MULTIPLICATION).ar/4:
+                    left: BinaryOpUGen(MULTIPLICATION).ar/2[0]
+                    right: UnaryOpUGen(RAND).ir/1[0]
+            -   Out.ar:
+                    bus: 0.0
+                    source[0]: BinaryOpUGen(MULTIPLICATION).ar/3[0]
+                    source[1]: BinaryOpUGen(MULTIPLICATION).ar/4[0]
+        """
+    )
+
+
+def test_SynthDefCompiler_optimization_07_fusion():
+    with supriya.synthdefs.SynthDefBuilder(amplitude=0.1, offset=0.0) as builder:
+        sines = [
+            supriya.ugens.SinOsc.ar(frequency=f) for f in (220, 330, 440, 550, 660)
+        ]
+        lfo = supriya.ugens.LFTri.kr()
+        # ((a + b) + c) + d -> Sum4, e * amplitude + offset -> MulAdd
+        mix = sines[0] + sines[1] + sines[2] + sines[3]
+        shaped = sines[4] * builder["amplitude"] + builder["offset"]
+        # Not a MulAdd: a control-rate source can't take an audio-rate addend
+        modulated = lfo * builder["amplitude"] + sines[0]
+        # The shared addition feeds two consumers, so stays put
+        shared = lfo + builder["offset"]
+        # Sum3 inputs are ordered by descending rate
+        ranked = lfo + sines[1] + sines[2]
+        supriya.ugens.Out.ar(bus=0, source=[mix, shaped, modulated, ranked])
+        supriya.ugens.Out.kr(bus=0, source=[shared + 1, shared * 2])
+    assert len(builder.build("fused", optimize=False).ugens) == 21
+    py_synthdef = builder.build("fused")
+    assert str(py_synthdef) == normalize(
+        """
+        synthdef:
+            name: fused
+            ugens:
+            -   Control.kr: null
+            -   SinOsc.ar/0:
+                    frequency: 220.0
+                    phase: 0.0
+            -   SinOsc.ar/1:
+                    frequency: 330.0
+                    phase: 0.0
+            -   SinOsc.ar/2:
+                    frequency: 440.0
+                    phase: 0.0
+            -   SinOsc.ar/3:
+                    frequency: 550.0
+                    phase: 0.0
+            -   Sum4.ar:
+                    input_one: SinOsc.ar/0[0]
+                    input_two: SinOsc.ar/1[0]
+                    input_three: SinOsc.ar/2[0]
+                    input_four: SinOsc.ar/3[0]
+            -   SinOsc.ar/4:
+                    frequency: 660.0
+                    phase: 0.0
+            -   MulAdd.ar:
+                    source: SinOsc.ar/4[0]
+                    multiplier: Control.kr[0:amplitude]
+                    addend: Control.kr[1:offset]
+            -   LFTri.kr:
+                    frequency: 440.0
+                    initial_phase: 0.0
+            -   BinaryOpUGen(MULTIPLICATION).kr/0:
+                    left: LFTri.kr[0]
+                    right: Control.kr[0:amplitude]
+            -   BinaryOpUGen(ADDITION).ar:
+                    left: BinaryOpUGen(MULTIPLICATION).kr/0[0]
+                    right: SinOsc.ar/0[0]
+            -   BinaryOpUGen(ADDITION).kr/0:
+                    left: LFTri.kr[0]
+                    right: Control.kr[1:offset]
+            -   BinaryOpUGen(ADDITION).kr/1:
+                    left: BinaryOpUGen(ADDITION).kr/0[0]
+                    right: 1.0
+            -   BinaryOpUGen(MULTIPLICATION).kr/1:
+                    left: BinaryOpUGen(ADDITION).kr/0[0]
+                    right: 2.0
+            -   Out.kr:
+                    bus: 0.0
+                    source[0]: BinaryOpUGen(ADDITION).kr/1[0]
+                    source[1]: BinaryOpUGen(MULTIPLICATION).kr/1[0]
+            -   Sum3.ar:
+                    input_one: SinOsc.ar/1[0]
+                    input_two: SinOsc.ar/2[0]
+                    input_three: LFTri.kr[0]
+            -   Out.ar:
+                    bus: 0.0
+                    source[0]: Sum4.ar[0]
+                    source[1]: MulAdd.ar[0]
+                    source[2]: BinaryOpUGen(ADDITION).ar[0]
+                    source[3]: Sum3.ar[0]
+        """
+    )
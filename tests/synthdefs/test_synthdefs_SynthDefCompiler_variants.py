@@ -0,0 +1,132 @@
+# flake8: noqa
+import pytest
+from uqbar.strings import normalize
+
+import supriya.synthdefs
+import supriya.ugens
+
+
+@pytest.fixture
+def py_synthdef():
+    with supriya.synthdefs.SynthDefBuilder(
+        frequency=440,
+        amplitude=0.1,
+        variants={
+            "low": {"frequency": 220},
+            "loud": {"frequency": 330, "amplitude": 0.5},
+        },
+    ) as builder:
+        sine = supriya.ugens.SinOsc.ar(frequency=builder["frequency"])
+        supriya.ugens.Out.ar(bus=0, source=sine * builder["amplitude"])
+    py_synthdef = builder.build("test")
+    return py_synthdef
+
+
+def test_SynthDefCompiler_variants_01_supriya_vs_str(py_synthdef):
+    assert normalize(str(py_synthdef)) == normalize(
+        """
+        synthdef:
+            name: test
+            ugens:
+            -   Control.kr: null
+            -   SinOsc.ar:
+                    frequency: Control.kr[1:frequency]
+                    phase: 0.0
+            -   BinaryOpUGen(MULTIPLICATION).ar:
+                    left: SinOsc.ar[0]
+                    right: Control.kr[0:amplitude]
+            -   Out.ar:
+                    bus: 0.0
+                    source[0]: BinaryOpUGen(MULTIPLICATION).ar[0]
+            variants:
+                low:
+                    frequency: 220.0
+                loud:
+                    amplitude: 0.5
+                    frequency: 330.0
+        """
+    )
+
+
+def test_SynthDefCompiler_variants_02_supriya_vs_bytes(py_synthdef):
+    # fmt: off
+    test_compiled_synthdef = bytes(
+        b'SCgf'
+        b'\x00\x00\x00\x02'
+        b'\x00\x01'
+            b'\x04test'
+                b'\x00\x00\x00\x01'
+                    b'\x00\x00\x00\x00'
+                b'\x00\x00\x00\x02'
+                    b'=\xcc\xcc\xcd'
+                    b'C\xdc\x00\x00'
+                b'\x00\x00\x00\x02'
+                    b'\tamplitude'
+                        b'\x00\x00\x00\x00'
+                    b'\tfrequency'
+                        b'\x00\x00\x00\x01'
+                b'\x00\x00\x00\x04'
+                    b'\x07Control'
+                        b'\x01'
+                        b'\x00\x00\x00\x00'
+                        b'\x00\x00\x00\x02'
+                        b'\x00\x00'
+                            b'\x01'
+                            b'\x01'
+                    b'\x06SinOsc'
+                        b'\x02'
+                        b'\x00\x00\x00\x02'
+                        b'\x00\x00\x00\x01'
+                        b'\x00\x00'
+                            b'\x00\x00\x00\x00'
+                                b'\x00\x00\x00\x01'
+                            b'\xff\xff\xff\xff'
+                                b'\x00\x00\x00\x00'
+                            b'\x02'
+                    b'\x0cBinaryOpUGen'
+                        b'\x02'
+                        b'\x00\x00\x00\x02'
+                        b'\x00\x00\x00\x01'
+                        b'\x00\x02'
+                            b'\x00\x00\x00\x01'
+                                b'\x00\x00\x00\x00'
+                            b'\x00\x00\x00\x00'
+                                b'\x00\x00\x00\x00'
+                            b'\x02'
+                    b'\x03Out'
+                        b'\x02'
+                        b'\x00\x00\x00\x02'
+                        b'\x00\x00\x00\x00'
+                        b'\x00\x00'
+                            b'\xff\xff\xff\xff'
+                                b'\x00\x00\x00\x00'
+                            b'\x00\x00\x00\x02'
+                                b'\x00\x00\x00\x00'
+                b'\x00\x02'
+                    b'\x03low'
+                        b'=\xcc\xcc\xcd'
+                        b'C\\\x00\x00'
+                    b'\x04loud'
+                        b'?\x00\x00\x00'
+                        b'C\xa5\x00\x00'
+    )
+    # fmt: on
+    py_compiled_synthdef = py_synthdef.compile()
+    assert py_compiled_synthdef == test_compiled_synthdef
+
+
+def test_SynthDefCompiler_variants_03_invalid():
+    for variants in [
+        {"low": {"missing": 1.0}},
+        {"low.er": {"frequency": 220}},
+        {"low": {"frequency": [220, 330]}},
+        {"wide": {"pans": [-1.0]}},
+        {"wide": {"pans": 1.0}},
+    ]:
+        with supriya.synthdefs.SynthDefBuilder(
+            frequency=440, pans=[0.0, 0.5], variants=variants
+        ) as builder:
+            sine = supriya.ugens.SinOsc.ar(frequency=builder["frequency"])
+            supriya.ugens.Out.ar(bus=0, source=sine * builder["pans"][0])
+        with pytest.raises(ValueError):
+            builder.build()
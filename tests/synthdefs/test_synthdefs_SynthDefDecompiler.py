@@ -147,3 +147,25 @@ def test_SynthDefDecompiler_08():
     assert compiled_synthdef == new_synthdef.compile()
     assert old_synthdef.anonymous_name == new_synthdef.anonymous_name
     assert old_synthdef.name == new_synthdef.name
+
+
+def test_SynthDefDecompiler_09():
+    r"""Variants."""
+    builder = supriya.synthdefs.SynthDefBuilder(
+        amp=0.5,
+        freqs=[300, 400],
+        variants={"low": {"freqs": [150, 200]}, "quiet": {"amp": 0.25}},
+    )
+    with builder:
+        sines = supriya.ugens.SinOsc.ar(frequency=builder["freqs"])
+        sines = supriya.ugens.Mix.new(sines)
+        sines = sines * builder["amp"]
+        supriya.ugens.Out.ar(bus=0, source=sines)
+    old_synthdef = builder.build("variants")
+    compiled_synthdef = old_synthdef.compile()
+    new_synthdef = decompiler.decompile_synthdef(compiled_synthdef)
+    assert str(old_synthdef) == str(new_synthdef)
+    assert old_synthdef.variants == new_synthdef.variants
+    assert compiled_synthdef == new_synthdef.compile()
+    assert old_synthdef.anonymous_name == new_synthdef.anonymous_name
+    assert old_synthdef.name == new_synthdef.name
@@ -0,0 +1,89 @@
+import pickle
+
+import pytest
+
+import supriya.assets.synthdefs
+import supriya.synthdefs
+import supriya.ugens
+
+decompiler = supriya.synthdefs.SynthDefDecompiler
+
+
+def build_variants_synthdef():
+    with supriya.synthdefs.SynthDefBuilder(
+        amp=0.5,
+        freqs=[300, 400],
+        variants={"low": {"freqs": [150, 200]}, "quiet": {"amp": 0.25}},
+    ) as builder:
+        audio_in = supriya.ugens.In.ar(bus=8, channel_count=2)
+        sines = supriya.ugens.SinOsc.ar(frequency=builder["freqs"]) * audio_in
+        supriya.ugens.XOut.ar(bus=0, crossfade=0.5, source=sines * builder["amp"])
+    return builder.build("variants")
+
+
+synthdefs = [
+    supriya.assets.synthdefs.default,
+    supriya.assets.synthdefs.multiband_compressor,
+    supriya.assets.synthdefs.system_link_audio_2,
+    build_variants_synthdef(),
+]
+
+
+@pytest.mark.parametrize("synthdef", synthdefs)
+def test_scan_synthdefs(synthdef):
+    compiled_synthdef = synthdef.compile()
+    (decompiled,) = decompiler.scan_synthdefs(compiled_synthdef)
+    assert decompiled.name == synthdef.name
+    assert decompiled.anonymous_name == synthdef.anonymous_name
+    # Values round-trip through float32, so compare against a full decompile.
+    expected = decompiler.decompile_synthdef(compiled_synthdef)
+    assert decompiled.constants == expected.constants
+    assert decompiled.variants == expected.variants
+    assert decompiled.parameters == {
+        name: parameter.value for name, parameter in expected.parameters.items()
+    }
+    assert [ugen.name for ugen in decompiled.ugens] == [
+        type(ugen).__name__ for ugen in synthdef.ugens
+    ]
+    for attribute in (
+        "audio_input_channel_count",
+        "audio_output_channel_count",
+        "control_input_channel_count",
+        "control_output_channel_count",
+    ):
+        assert getattr(decompiled, attribute) == getattr(synthdef, attribute)
+    assert decompiled.synthdef.compile() == compiled_synthdef
+    assert decompiled.synthdef is decompiled.synthdef
+
+
+def test_scan_synthdefs_multiple():
+    compiled_synthdefs = supriya.synthdefs.SynthDefCompiler.compile_synthdefs(synthdefs)
+    decompiled_synthdefs = decompiler.scan_synthdefs(compiled_synthdefs)
+    assert [x.actual_name for x in decompiled_synthdefs] == [
+        x.actual_name for x in synthdefs
+    ]
+    with pytest.raises(ValueError):
+        decompiler.scan_synthdefs(b"XXXX" + compiled_synthdefs[4:])
+
+
+def test_scan_synthdefs_pickle():
+    compiled_synthdefs = supriya.synthdefs.SynthDefCompiler.compile_synthdefs(synthdefs)
+    decompiled = decompiler.scan_synthdefs(compiled_synthdefs)[-1]
+    unpickled = pickle.loads(pickle.dumps(decompiled))
+    assert len(unpickled._data) < len(compiled_synthdefs)
+    assert unpickled.anonymous_name == decompiled.anonymous_name
+    assert unpickled.variants == decompiled.variants
+    assert unpickled.synthdef.compile() == synthdefs[-1].compile()
+
+
+@pytest.mark.parametrize("process_count", [None, 2])
+def test_scan_directory(tmp_path, process_count):
+    for synthdef in synthdefs:
+        (tmp_path / f"{synthdef.actual_name}.scsyndef").write_bytes(synthdef.compile())
+    (tmp_path / "readme.txt").write_text("not a synthdef")
+    scanned = decompiler.scan_directory(tmp_path, process_count=process_count)
+    assert list(scanned) == sorted(tmp_path.glob("*.scsyndef"))
+    assert {
+        path.stem: [x.actual_name for x in decompiled_synthdefs]
+        for path, decompiled_synthdefs in scanned.items()
+    } == {synthdef.actual_name: [synthdef.actual_name] for synthdef in synthdefs}
@@ -0,0 +1,63 @@
+import pytest
+
+from supriya import ugens
+from supriya.synthdefs import SynthDef, SynthDefBuilder, SynthDefFactory, build_many
+
+
+def build_sine(frequency=440, name=None):
+    with SynthDefBuilder(frequency=frequency, name=name) as builder:
+        ugens.Out.ar(bus=0, source=ugens.SinOsc.ar(frequency=builder["frequency"]))
+    return builder
+
+
+def build_noise():
+    with SynthDefBuilder(amplitude=0.1) as builder:
+        ugens.Out.ar(bus=0, source=ugens.WhiteNoise.ar() * builder["amplitude"])
+    return builder.build("noise")
+
+
+def signal_block(builder, source, state):
+    return ugens.LPF.ar(source=source, frequency=builder["frequency"])
+
+
+def iterate_jobs():
+    factory = (
+        SynthDefFactory(channel_count=2, frequency=1000)
+        .with_input()
+        .with_signal_block(signal_block)
+    )
+    for i in range(4):
+        yield (build_sine, dict(frequency=110 * (i + 1)))
+        yield (build_sine, dict(name=f"sine-{i}"))
+        yield (factory.with_output(crossfaded=bool(i % 2)), dict(name=f"filter-{i}"))
+    yield build_noise
+
+
+def build_serially(jobs):
+    compiled_synthdefs = []
+    for job in jobs:
+        target, kwargs = job if isinstance(job, tuple) else (job, {})
+        result = (
+            target.build(**kwargs) if hasattr(target, "build") else target(**kwargs)
+        )
+        if isinstance(result, SynthDefBuilder):
+            result = result.build()
+        compiled_synthdefs.append(result.compile())
+    return compiled_synthdefs
+
+
+@pytest.mark.parametrize("process_count", [1, 2])
+def test_build_many_compiled(process_count):
+    jobs = list(iterate_jobs())
+    compiled_synthdefs = build_many(jobs, compiled=True, process_count=process_count)
+    assert compiled_synthdefs == build_serially(jobs)
+
+
+def test_build_many_synthdefs():
+    jobs = list(iterate_jobs())
+    synthdefs = build_many(jobs, process_count=2)
+    assert all(isinstance(synthdef, SynthDef) for synthdef in synthdefs)
+    assert [synthdef.compile() for synthdef in synthdefs] == build_serially(jobs)
+    assert synthdefs[0].name is None
+    assert [synthdef.name for synthdef in synthdefs[1:3]] == ["sine-0", "filter-0"]
+    assert synthdefs[-1].name == "noise"
@@ -1,17 +1,29 @@
 import asyncio
+import enum
 import logging
+import socketserver
+import threading
 import time
 
 import pytest
 from uqbar.strings import normalize
 
+import supriya
+import supriya.osc
 from supriya.osc import (
     NTP_DELTA,
     AsyncOscProtocol,
+    AsyncTcpOscProtocol,
     HealthCheck,
+    LazyOscMessage,
     OscBundle,
+    OscCallback,
+    OscCallbackTrie,
     OscMessage,
+    OscStreamBuffer,
+    OscTemplate,
     ThreadedOscProtocol,
+    ThreadedTcpOscProtocol,
     find_free_port,
 )
 from supriya.scsynth import AsyncProcessProtocol, Options, SyncProcessProtocol
@@ -76,6 +88,177 @@ def test_new_ntp_era():
     assert datagram.hex() == "0000000100000000"
 
 
+class OscEnum(enum.Enum):
+    FOO = "foo"
+
+
+@pytest.mark.parametrize(
+    "osc_object",
+    [
+        OscMessage("/g_new", 0, 0),
+        OscMessage(42, -1, 2.5, "", "abcd", True, False, None),
+        OscMessage("/foo", True, [None, [3.25]], OscMessage("/bar")),
+        OscMessage("/blob", b"", b"\x01\x02\x03", bytearray(b"abcdefg"), OscEnum.FOO),
+        OscMessage("/n_set", 1000, "frequency", 440.0, "amplitude", 0.5),
+        OscBundle(),
+        OscBundle(
+            timestamp=1401557034.5,
+            contents=(
+                OscMessage("/one", 1),
+                OscBundle(contents=(OscMessage("/two", 2.0),), timestamp=12.25),
+                OscMessage("/three", ["a", ["b"]]),
+            ),
+        ),
+    ],
+)
+def test_accelerated_codec(monkeypatch, osc_object):
+    """
+    The compiled codec must be byte-for-byte equivalent to the pure-Python one.
+    """
+    accelerated = pytest.importorskip("supriya._osc")
+    monkeypatch.setattr(supriya.osc, "_osc", accelerated)
+    accelerated_datagram = osc_object.to_datagram()
+    accelerated_object = type(osc_object).from_datagram(accelerated_datagram)
+    monkeypatch.setattr(supriya.osc, "_osc", None)
+    python_datagram = osc_object.to_datagram()
+    python_object = type(osc_object).from_datagram(python_datagram)
+    assert accelerated_datagram == python_datagram
+    assert accelerated_object == python_object
+    assert repr(accelerated_object) == repr(python_object)
+
+
+@pytest.mark.parametrize(
+    "arguments, values, expected",
+    [
+        (("/n_set", int, "frequency", float), (1000, 443), (1000, "frequency", 443.0)),
+        ((42, float, None, True, b"\x01"), (0.5,), (0.5, None, True, b"\x01")),
+        (
+            ("/s_new", "default", int, int, int, 3, [float, 0.25, [int]]),
+            (1001, 1, 1000, 2, 7),
+            ("default", 1001, 1, 1000, 3, [2.0, 0.25, [7]]),
+        ),
+    ],
+)
+def test_OscTemplate(arguments, values, expected):
+    template = OscTemplate(*arguments)
+    osc_message = template.render(*values)
+    assert osc_message == OscMessage(arguments[0], *expected)
+    assert (
+        osc_message.to_datagram() == OscMessage(arguments[0], *expected).to_datagram()
+    )
+    with pytest.raises(ValueError):
+        template.render(*values, 1)
+
+
+@pytest.mark.parametrize("maximum_size", [32, 64, 100, 1472])
+def test_OscBundle_partition(maximum_size):
+    messages = [OscMessage("/s_new", "default", i, 0, 1) for i in range(20)]
+    messages.insert(5, OscMessage("/b_setn", 0, 0, 64, *([0.5] * 64)))
+    bundles = OscBundle.partition(messages, timestamp=1.5, maximum_size=maximum_size)
+    assert [message for bundle in bundles for message in bundle.contents] == messages
+    for bundle in bundles:
+        assert bundle.timestamp == 1.5
+        datagram = bundle.to_datagram()
+        assert len(datagram) <= maximum_size or len(bundle.contents) == 1
+        assert OscBundle.from_datagram(datagram) == bundle
+
+
+def test_OscBundle_partition_copies():
+    message = OscMessage("/n_free", 1)
+    (bundle,) = OscBundle.partition([message])
+    message.contents = (2,)
+    assert message.to_datagram() == OscMessage("/n_free", 2).to_datagram()
+    assert (
+        bundle.to_datagram()
+        == OscBundle(contents=[OscMessage("/n_free", 1)]).to_datagram()
+    )
+    assert message._datagram is None
+
+
+def test_OscCallbackTrie():
+    trie = OscCallbackTrie()
+    callback_a = OscCallback(pattern=("/done",), procedure=print)
+    callback_b = OscCallback(
+        pattern=("/done", "/b_alloc", 1),
+        procedure=print,
+        failure_pattern=("/fail", "/b_alloc"),
+    )
+    callback_c = OscCallback(pattern=("/done", "/b_alloc", 1), procedure=print)
+    for callback in (callback_a, callback_b, callback_c):
+        trie.add(callback)
+    assert trie.addresses == {b"/done", b"/fail"}
+    assert trie.match(OscMessage("/done", "/b_alloc", 1)) == [
+        callback_a,
+        callback_b,
+        callback_c,
+    ]
+    assert trie.match(OscMessage("/done", "/b_alloc", 2)) == [callback_a]
+    assert trie.match(OscMessage("/fail", "/b_alloc", "oops")) == [callback_b]
+    assert trie.match(OscMessage("/done", [1, 2], 3)) == [callback_a]
+    assert trie.accepts(OscMessage("/fail").to_datagram())
+    assert not trie.accepts(OscMessage("/n_go", 1000).to_datagram())
+    assert trie.accepts(OscBundle(contents=[OscMessage("/n_go")]).to_datagram())
+    trie.remove(callback_b)
+    trie.remove(callback_b)  # idempotent
+    assert trie.addresses == {b"/done"}
+    assert trie.match(OscMessage("/done", "/b_alloc", 1)) == [callback_a, callback_c]
+    trie.remove(callback_a)
+    trie.remove(callback_c)
+    assert trie.addresses == set()
+    assert not trie.root.children
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        OscMessage("/n_go", 1000, 1, -1, -1, 0),
+        OscMessage("/done", "/b_alloc", 23),
+        OscMessage("/fail", "/b_alloc", "oops", 1.5, True, False, None),
+        OscMessage("/foo", 1, [2, [3.5]], 4),
+        OscMessage("/foo", b"blob", 1),
+        OscMessage("/foo"),
+    ],
+)
+def test_LazyOscMessage(message):
+    datagram = message.to_datagram()
+    lazy_message = LazyOscMessage(datagram)
+    assert lazy_message.address == message.address
+    assert lazy_message.to_datagram() is datagram
+    for count in range(len(message.contents) + 2):
+        assert lazy_message.unpack(count) == message.unpack(count)
+    assert lazy_message._contents is None or not all(
+        isinstance(x, (int, float, str, bool, type(None))) for x in message.contents
+    )
+    assert lazy_message == message and message == lazy_message
+    assert lazy_message.contents == message.contents
+    assert repr(lazy_message) == repr(message)
+
+
+def test_OscProtocol_receive_batched():
+    calls = []
+    osc_protocol = ThreadedOscProtocol()
+    osc_protocol.register(["/n_go"], calls.append, batched=True)
+    osc_protocol.register(["/n_go", 1001], calls.append)
+    osc_protocol._process_command_queue()
+    messages = [OscMessage("/n_go", id_) for id_ in range(1000, 1004)]
+    datagrams = [
+        messages[0].to_datagram(),
+        OscBundle(
+            contents=[messages[1], OscBundle(contents=[messages[2]])]
+        ).to_datagram(),
+        OscMessage("/n_end", 1000).to_datagram(),
+        messages[3].to_datagram(),
+    ]
+    for procedure, message in osc_protocol._receive(datagrams):
+        procedure(message)
+    # Merged runs stop at the unbatched match, preserving dispatch order.
+    assert calls == [
+        messages[:2],
+        messages[1],
+        messages[2:],
+    ]
+
+
 @pytest.fixture(autouse=True)
 def log_everything(caplog):
     caplog.set_level(logging.DEBUG, logger="supriya.osc")
@@ -147,3 +330,129 @@ def test_ThreadedOscProtocol():
             break
     assert healthcheck_failed
     assert not osc_protocol.is_running
+
+
+class FakeTcpHandler(socketserver.BaseRequestHandler):
+    """
+    Answers each framed /status with two framed /status.reply in one write,
+    then hangs up after the second /status.
+    """
+
+    def handle(self):
+        stream_buffer, count = OscStreamBuffer(), 0
+        while count < 2:
+            data = self.request.recv(3)  # deliberately tiny reads
+            if not data:
+                return
+            for datagram in stream_buffer.feed(data):
+                if OscMessage.from_datagram(datagram).address != "/status":
+                    continue
+                count += 1
+                reply = OscStreamBuffer.frame(
+                    OscMessage("/status.reply", count).to_datagram()
+                )
+                self.request.sendall(reply * 2)
+
+
+@pytest.fixture
+def fake_tcp_server():
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), FakeTcpHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.asyncio
+async def test_AsyncTcpOscProtocol(fake_tcp_server):
+    def on_healthcheck_failed():
+        healthcheck_failed.append(True)
+
+    healthcheck_failed = []
+    replies = []
+    healthcheck = HealthCheck(
+        request_pattern=["/status"],
+        response_pattern=["/status.reply"],
+        callback=on_healthcheck_failed,
+        active=False,
+        timeout=0.1,
+        max_attempts=2,
+    )
+    osc_protocol = AsyncTcpOscProtocol()
+    osc_protocol.register(["/status.reply"], lambda message: replies.append(message))
+    await osc_protocol.connect(*fake_tcp_server.server_address, healthcheck=healthcheck)
+    assert osc_protocol.is_running
+    osc_protocol.send(OscMessage("/status"))
+    for _ in range(20):
+        await asyncio.sleep(0.05)
+        if len(replies) == 2:
+            break
+    assert replies == [OscMessage("/status.reply", 1)] * 2
+    osc_protocol.send(OscMessage("/status"))
+    await asyncio.wait_for(osc_protocol.exit_future, 1.0)
+    assert replies[2:] == [OscMessage("/status.reply", 2)] * 2
+    osc_protocol.activate_healthcheck()
+    for _ in range(20):
+        await asyncio.sleep(0.1)
+        if not osc_protocol.is_running:
+            break
+    assert healthcheck_failed
+    assert not osc_protocol.is_running
+
+
+def test_ThreadedTcpOscProtocol(fake_tcp_server):
+    def on_healthcheck_failed():
+        healthcheck_failed.append(True)
+
+    healthcheck_failed = []
+    replies = []
+    healthcheck = HealthCheck(
+        request_pattern=["/status"],
+        response_pattern=["/status.reply"],
+        callback=on_healthcheck_failed,
+        active=False,
+        timeout=0.1,
+        max_attempts=2,
+    )
+    osc_protocol = ThreadedTcpOscProtocol()
+    osc_protocol.register(["/status.reply"], lambda message: replies.append(message))
+    osc_protocol.connect(*fake_tcp_server.server_address, healthcheck=healthcheck)
+    assert osc_protocol.is_running
+    osc_protocol.send(OscMessage("/status"))
+    osc_protocol.send(OscMessage("/status"))
+    for _ in range(20):
+        time.sleep(0.05)
+        if osc_protocol.socket is None:
+            break
+    assert replies == (
+        [OscMessage("/status.reply", 1)] * 2 + [OscMessage("/status.reply", 2)] * 2
+    )
+    assert osc_protocol.is_running
+    assert not healthcheck_failed
+    osc_protocol.activate_healthcheck()
+    for _ in range(20):
+        time.sleep(0.1)
+        if not osc_protocol.is_running:
+            break
+    assert healthcheck_failed
+    assert not osc_protocol.is_running
+
+
+def test_Server_osc_protocol_selection():
+    server = supriya.Server()
+    assert type(server.osc_protocol) is ThreadedOscProtocol
+    callbacks = server.osc_protocol.callbacks
+    server = supriya.Server(protocol="tcp")
+    assert type(server.osc_protocol) is ThreadedTcpOscProtocol
+    server._options = Options(protocol="udp")
+    server._setup_osc_protocol()
+    assert type(server.osc_protocol) is ThreadedOscProtocol
+    assert server.osc_protocol.callbacks is not callbacks
+    assert type(supriya.AsyncServer(protocol="tcp").osc_protocol) is (
+        AsyncTcpOscProtocol
+    )
+    server._options = Options(protocol="sctp")
+    with pytest.raises(ValueError):
+        server._setup_osc_protocol()
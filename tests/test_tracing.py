@@ -0,0 +1,65 @@
+import supriya.tracing
+from supriya.clocks import OfflineClock
+from supriya.osc import OscMessage, ThreadedOscProtocol
+
+
+def callback(context, limit=3):
+    if context.event.invocations < limit - 1:
+        return 0.25
+
+
+def test_trace_clock():
+    clock = OfflineClock()
+    with supriya.tracing.trace() as events:
+        event_id = clock.cue(callback)
+        clock.start()
+    assert not supriya.tracing.enabled
+    assert [(event.kind, event.event_id) for event in events] == [
+        ("enqueue", event_id),
+        ("schedule", event_id),
+        ("perform", event_id),
+        ("reschedule", event_id),
+        ("perform", event_id),
+        ("reschedule", event_id),
+        ("perform", event_id),
+    ]
+    performed = [event for event in events if event.kind == "perform"]
+    assert [event.seconds for event in performed] == [0.0, 0.5, 1.0]
+    assert [event.lateness for event in performed] == [0.0, 0.0, 0.0]
+    assert all(event.source == clock.name for event in events)
+    timestamps = [event.timestamp for event in events]
+    assert timestamps == sorted(timestamps)
+
+
+def test_trace_disabled():
+    with supriya.tracing.trace() as events:
+        pass
+    clock = OfflineClock()
+    clock.cue(callback)
+    clock.start()
+    assert events == supriya.tracing.get_events() == []
+
+
+def test_trace_maximum_length():
+    clock = OfflineClock()
+    with supriya.tracing.trace(maximum_length=2) as events:
+        clock.cue(callback)
+        clock.start()
+    assert [event.kind for event in events] == ["reschedule", "perform"]
+
+
+def test_trace_osc(monkeypatch):
+    osc_protocol = ThreadedOscProtocol()
+    monkeypatch.setattr(osc_protocol, "ip_address", "127.0.0.1")
+    monkeypatch.setattr(osc_protocol, "port", 57110)
+    monkeypatch.setattr(osc_protocol, "is_running", True)
+    message = OscMessage("/status")
+    with supriya.tracing.trace() as events:
+        datagram = osc_protocol._validate_send(message)
+        assert list(osc_protocol._validate_receive(datagram)) == []
+    assert [(event.kind, event.source) for event in events] == [
+        ("send", "127.0.0.1:57110"),
+        ("receive", "127.0.0.1:57110"),
+    ]
+    assert events[0].message == message
+    assert events[1].message == message